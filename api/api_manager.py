@@ -7,15 +7,20 @@ class ApiManager:
     """
     Класс для управления API-классами с единой HTTP-сессией.
     """
-    def __init__(self, session):
+    def __init__(self, session, response_cache=None):
         """
         Инициализация ApiManager.
         :param session: HTTP-сессия, используемая всеми API-классами.
+        :param response_cache: Общий для API-классов кэш GET-ответов (ResponseCache); изменение фильма
+            или пользователя через любой из них сбрасывает соответствующие записи.
         """
         self.session = session
+        self.response_cache = response_cache
         self.auth_api = AuthAPI(session)
         self.user_api = UserAPI(session)  # Передаём session и BASE_URL
         self.movies_api = MoviesAPI(session)
+        for api in (self.auth_api, self.user_api, self.movies_api):
+            api.response_cache = response_cache
 
     def close_session(self):
         self.session.close()
@@ -0,0 +1,22 @@
+from api.async_auth_api import AsyncAuthAPI
+from api.async_user_api import AsyncUserAPI
+from api.async_movies_api import AsyncMoviesAPI
+
+
+class AsyncApiManager:
+    """
+    Класс для управления асинхронными API-классами с единой aiohttp-сессией.
+    Сессию нужно создавать внутри запущенного event loop.
+    """
+    def __init__(self, session):
+        """
+        Инициализация AsyncApiManager.
+        :param session: aiohttp.ClientSession, используемая всеми API-классами.
+        """
+        self.session = session
+        self.auth_api = AsyncAuthAPI(session)
+        self.user_api = AsyncUserAPI(session)
+        self.movies_api = AsyncMoviesAPI(session)
+
+    async def close_session(self):
+        await self.session.close()
@@ -0,0 +1,20 @@
+from constants import BASE_URL
+from custom_requester.async_custom_requester import AsyncCustomRequester
+
+
+class AsyncUserAPI(AsyncCustomRequester):
+    USER_BASE_URL = BASE_URL
+
+    def __init__(self, session):
+        super().__init__(session, self.USER_BASE_URL)
+
+    async def get_user(self, user_locator, expected_status=200):
+        return await self.send_request("GET", f"user/{user_locator}", expected_status=expected_status)
+
+    async def create_user(self, user_data, expected_status=201):
+        return await self.send_request(
+            method="POST",
+            endpoint="user",
+            data=user_data,
+            expected_status=expected_status
+        )
@@ -1,4 +1,5 @@
-from constants import REGISTER_ENDPOINT, LOGIN_ENDPOINT
+from api.token_cache import TokenCache, default_token_cache
+from constants import BASE_URL, REGISTER_ENDPOINT, LOGIN_ENDPOINT
 from custom_requester.custom_requester import CustomRequester
 
 
@@ -6,9 +7,10 @@ class AuthAPI(CustomRequester):
     """
     Класс для работы с аутентификацией.
     """
+    token_cache = default_token_cache
 
     def __init__(self, session):
-        super().__init__(session=session, base_url="https://auth.dev-cinescope.coconutqa.ru/")
+        super().__init__(session=session, base_url=BASE_URL)
 
     def register_user(self, user_data, expected_status=201):
         """
@@ -37,7 +39,21 @@ class AuthAPI(CustomRequester):
             expected_status=expected_status
         )
 
-    def authenticate(self, user_creds):
+    def authenticate(self, user_creds, use_cache=True):
+        """
+        Авторизация и установка токена в заголовки сессии.
+        :param user_creds: Кортеж (email, password).
+        :param use_cache: Переиспользовать ещё действующий токен из token_cache вместо нового логина.
+        """
+        if use_cache:
+            key = TokenCache.make_key(self.base_url, user_creds)
+            token = self.token_cache.get_token(key, lambda: self._get_access_token(user_creds))
+        else:
+            token = self._get_access_token(user_creds)
+
+        self._update_session_headers(**{"authorization": "Bearer " + token})
+
+    def _get_access_token(self, user_creds):
         login_data = {
             "email": user_creds[0],
             "password": user_creds[1]
@@ -47,5 +63,4 @@ class AuthAPI(CustomRequester):
         if "accessToken" not in response:
             raise KeyError("token is missing")
 
-        token = response["accessToken"]
-        self._update_session_headers(**{"authorization": "Bearer " + token})
\ No newline at end of file
+        return response["accessToken"]
@@ -1,5 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from custom_requester.batch import run_batch
 from custom_requester.custom_requester import CustomRequester
-from constants import MOVIES_ENDPOINT
+from constants import API_URL, MOVIES_ENDPOINT
+from models.fast_validation import validate_items
+from models.test_pydantic import MovieResponse
 
 class MoviesAPI(CustomRequester):
     """
@@ -7,7 +12,7 @@ class MoviesAPI(CustomRequester):
     """
 
     def __init__(self, session):
-        super().__init__(session=session, base_url="https://api.dev-cinescope.coconutqa.ru/")
+        super().__init__(session=session, base_url=API_URL)
 
     def get_movies(self, params=None, expected_status=200):
         return self.send_request(
@@ -17,6 +22,38 @@ class MoviesAPI(CustomRequester):
             expected_status=expected_status
         )
 
+    def iter_movies(self, filters=None, page_size=10, prefetch=True):
+        """
+        Ленивый обход всех страниц GET /movies.
+        Пока вызывающий код обрабатывает текущую страницу, следующая загружается в фоне,
+        поэтому в памяти одновременно не больше двух страниц.
+        :param filters: Фильтры (locations, minPrice, maxPrice, genreId и т.д.).
+        :param page_size: Размер страницы.
+        :param prefetch: Загружать следующую страницу заранее.
+        :return: Генератор объектов MovieResponse.
+        """
+        def fetch(page):
+            params = {**(filters or {}), "page": page, "pageSize": page_size}
+            return self.get_movies(params=params).json()
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = 1
+            data = fetch(page)
+            while True:
+                has_next = page < data.get("pageCount", 1)
+                next_page = executor.submit(fetch, page + 1) if has_next and executor else None
+
+                yield from validate_items(MovieResponse, data["movies"], sample_every=1)
+
+                if not has_next:
+                    return
+                page += 1
+                data = next_page.result() if next_page else fetch(page)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def create_movie(self, movie_data, expected_status=201):
         return self.send_request(
             method="POST",
@@ -45,4 +82,36 @@ class MoviesAPI(CustomRequester):
             endpoint=f"{MOVIES_ENDPOINT}/{movie_id}",
             data=update_data,
             expected_status=expected_status
-        )
\ No newline at end of file
+        )
+
+    def create_movies(self, movies_data, concurrency=10, max_errors=None, expected_status=201):
+        """
+        Пакетное создание фильмов.
+        :param movies_data: Итерируемый набор данных фильмов.
+        :param concurrency: Количество одновременных запросов.
+        :param max_errors: Бюджет ошибок, после превышения которого новые запросы не отправляются.
+        :param expected_status: Ожидаемый статус-код для каждого запроса.
+        :return: Список BatchItemResult в порядке входных данных.
+        """
+        return run_batch(
+            lambda movie_data: self.create_movie(movie_data, expected_status=expected_status),
+            movies_data,
+            concurrency=concurrency,
+            max_errors=max_errors
+        )
+
+    def delete_movies(self, movie_ids, concurrency=10, max_errors=None, expected_status=200):
+        """
+        Пакетное удаление фильмов.
+        :param movie_ids: Итерируемый набор id фильмов.
+        :param concurrency: Количество одновременных запросов.
+        :param max_errors: Бюджет ошибок, после превышения которого новые запросы не отправляются.
+        :param expected_status: Ожидаемый статус-код для каждого запроса.
+        :return: Список BatchItemResult в порядке входных id.
+        """
+        return run_batch(
+            lambda movie_id: self.delete_movie(movie_id, expected_status=expected_status),
+            movie_ids,
+            concurrency=concurrency,
+            max_errors=max_errors
+        )
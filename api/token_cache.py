@@ -0,0 +1,119 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from common.file_lock import FileLock
+
+
+def jwt_expiry(token):
+    """
+    Достаёт время истечения (exp, unix time) из payload JWT без проверки подписи.
+    Возвращает None, если токен не JWT или exp отсутствует.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, ValueError, TypeError):
+        return None
+
+
+class TokenCache:
+    """
+    Потокобезопасный кэш access-токенов, ключом служат учётные данные.
+    Токен переиспользуется, пока до его истечения остаётся больше refresh_margin секунд.
+    При указании path кэш дублируется в файл и разделяется между воркерами pytest-xdist.
+    """
+
+    def __init__(self, path=None, refresh_margin: float = 60, default_ttl: float = 600):
+        """
+        :param path: Путь к JSON-файлу для общего кэша между процессами (None — только память процесса).
+        :param refresh_margin: За сколько секунд до истечения токен обновляется заранее.
+        :param default_ttl: Время жизни токена, если в нём нет поля exp.
+        """
+        self.path = Path(path) if path else None
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.logins = 0
+        self._tokens = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    @staticmethod
+    def make_key(base_url, user_creds):
+        email, password = user_creds
+        return hashlib.sha256(f"{base_url}|{email}|{password}".encode("utf-8")).hexdigest()
+
+    def get_token(self, key, login):
+        """
+        Возвращает действующий токен по ключу или получает новый через login().
+        :param key: Ключ кэша (см. make_key).
+        :param login: Функция без аргументов, выполняющая реальный логин и возвращающая токен.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            entry = self._tokens.get(key)
+            if entry is None and self.path:
+                entry = self._read_file().get(key)
+            if entry is not None and self._is_fresh(entry):
+                self._tokens[key] = entry
+                self._count_hit()
+                return entry["token"]
+
+            if self.path:
+                with FileLock(self.path.with_suffix(".lock")):
+                    entry = self._read_file().get(key)
+                    if entry is None or not self._is_fresh(entry):
+                        entry = self._login(login)
+                        self._write_file(key, entry)
+                    else:
+                        self._count_hit()
+            else:
+                entry = self._login(login)
+
+            self._tokens[key] = entry
+            return entry["token"]
+
+    def invalidate(self, key):
+        with self._lock:
+            self._tokens.pop(key, None)
+
+    def stats(self):
+        return {"hits": self.hits, "logins": self.logins}
+
+    def _login(self, login):
+        token = login()
+        with self._lock:
+            self.logins += 1
+        return {"token": token, "expires_at": jwt_expiry(token) or time.time() + self.default_ttl}
+
+    def _count_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def _is_fresh(self, entry):
+        return entry["expires_at"] - self.refresh_margin > time.time()
+
+    def _read_file(self):
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_file(self, key, entry):
+        data = self._read_file()
+        data[key] = entry
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+# Кэш по умолчанию для всех AuthAPI процесса
+default_token_cache = TokenCache()
@@ -1,8 +1,9 @@
+from constants import BASE_URL
 from custom_requester.custom_requester import CustomRequester
 
 
 class UserAPI(CustomRequester):
-    USER_BASE_URL = "https://auth.dev-cinescope.coconutqa.ru/"
+    USER_BASE_URL = BASE_URL
 
     def __init__(self, session):
         self.session = session
@@ -16,5 +17,27 @@ class UserAPI(CustomRequester):
             method="POST",
             endpoint="user",
             data=user_data,
+            expected_status=expected_status,
+            idempotency_guard=lambda: self._is_missing(user_data["email"])
+        )
+
+    def _is_missing(self, user_locator):
+        """
+        Повтор создания безопасен, только если пользователя с таким email на сервере нет.
+        """
+        try:
+            self.send_request("GET", f"user/{user_locator}", expected_status=404, need_logging=False)
+        except ValueError:
+            return False
+        return True
+
+    def update_user(self, user_id, update_data, expected_status=200):
+        return self.send_request(
+            method="PATCH",
+            endpoint=f"user/{user_id}",
+            data=update_data,
             expected_status=expected_status
-        )
\ No newline at end of file
+        )
+
+    def delete_user(self, user_id, expected_status=200):
+        return self.send_request("DELETE", f"user/{user_id}", expected_status=expected_status)
@@ -0,0 +1,68 @@
+"""
+Бенчмарк генерации тестовых данных: по одному значению через Faker против пачек DataGenerator.
+
+Запуск: python -m benchmarks.bench_data_generator [--count 10000]
+"""
+import argparse
+import time
+
+from constants import Roles
+from utils.data_generator import DataGenerator, MOVIE_IMAGE_URL
+
+
+def per_call_users(count):
+    users = []
+    for _ in range(count):
+        password = DataGenerator.generate_random_password()
+        users.append({
+            "email": DataGenerator.generate_random_email(),
+            "fullName": DataGenerator.generate_random_name(),
+            "password": password,
+            "passwordRepeat": password,
+            "roles": [Roles.USER.value]
+        })
+    return users
+
+
+def per_call_movies(count):
+    return [
+        {
+            "name": DataGenerator.generate_random_movie_name(),
+            "imageUrl": MOVIE_IMAGE_URL,
+            "price": DataGenerator.generate_random_price(),
+            "description": DataGenerator.generate_random_desc_name(),
+            "location": DataGenerator.generate_random_location(),
+            "published": True,
+            "genreId": 1
+        }
+        for _ in range(count)
+    ]
+
+
+def measure(generate, count):
+    started = time.perf_counter()
+    generate(count)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10_000)
+    args = parser.parse_args()
+
+    # Прогрев: загрузка Faker и словарей не входит в замер
+    per_call_users(1)
+    DataGenerator.generate_users(1)
+
+    for label, per_call, batch in (
+        ("users", per_call_users, lambda count: DataGenerator.generate_users(count, seed=1)),
+        ("movies", per_call_movies, lambda count: DataGenerator.generate_movies(count, seed=1)),
+    ):
+        slow = measure(per_call, args.count)
+        fast = measure(batch, args.count)
+        print(f"{label:<7} {args.count}: по одному {slow * 1000:8.1f} мс, пачкой {fast * 1000:8.1f} мс"
+              f" (x{slow / fast:.1f})")
+
+
+if __name__ == "__main__":
+    main()
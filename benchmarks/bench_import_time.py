@@ -0,0 +1,103 @@
+"""
+Бенчмарк времени запуска pytest — того, что платится при каждом прогоне до первого теста.
+
+Запускает `python -X importtime -m pytest --co -q -s <target>` несколько раз в чистом процессе:
+импортируются conftest, все плагины из pytest_plugins и собираемый модуль. Печатает медиану
+суммарного времени импорта и самые дорогие пакеты верхнего уровня.
+
+Запуск: python -m benchmarks.bench_import_time [--target tests/api/test_user.py] [--runs 5] [--top 10]
+        [--no-plugin-autoload] [--max-ms 600]
+С --max-ms завершается с кодом 1, если медиана больше порога (для CI).
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Модуль, сбор которого моделирует API-прогон: UI- и DB-стек ему не нужны
+DEFAULT_TARGET = "tests/api/test_user.py"
+
+# Тяжёлые зависимости, которые conftest и плагины должны импортировать только из фикстур
+LAZY_MODULES = ("sqlalchemy", "faker", "playwright", "psycopg2")
+
+
+def import_times(target=DEFAULT_TARGET, plugin_autoload=True):
+    """
+    Собирает target через pytest --co в отдельном процессе под -X importtime.
+    -s обязателен: иначе pytest перехватывает stderr и строки importtime во время сбора теряются.
+    :param target: Путь к модулю или директории тестов.
+    :param plugin_autoload: Загружать ли сторонние плагины из entry points (faker, allure и т.п.);
+        False — остаются только импорты самого проекта.
+    :return: Словарь {имя модуля: (накопленное время импорта в микросекундах, вложенность)}.
+    """
+    env = dict(os.environ)
+    if not plugin_autoload:
+        env["PYTEST_DISABLE_PLUGIN_AUTOLOAD"] = "1"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pytest", "--co", "-q", "-s", target],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(cumulative), (len(name) - len(name.lstrip()) - 1) // 2)
+    return times
+
+
+def eager_modules(times):
+    """
+    Какие из LAZY_MODULES импортированы: по имени пакета, ведь importtime может показать
+    только подмодули (faker.factory без строки faker).
+    """
+    packages = {name.split(".")[0] for name in times}
+    return [module for module in LAZY_MODULES if module in packages]
+
+
+def total_time(times):
+    """
+    Суммарное время импорта: сумма по модулям верхнего уровня (вложенные уже входят в них).
+    """
+    return sum(cumulative for cumulative, depth in times.values() if depth == 0)
+
+
+def top_packages(times, top):
+    packages = defaultdict(int)
+    for name, (cumulative, _) in times.items():
+        package = name.split(".")[0]
+        packages[package] = max(packages[package], cumulative)
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default=DEFAULT_TARGET)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--no-plugin-autoload", action="store_true",
+                        help="Не загружать сторонние плагины pytest: измеряется только код проекта")
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    runs = [import_times(args.target, plugin_autoload=not args.no_plugin_autoload) for _ in range(args.runs)]
+    median_ms = statistics.median(map(total_time, runs)) / 1000
+    print(f"pytest --co {args.target}: медиана импорта {median_ms:.0f} мс за {args.runs} запусков")
+    for package, cumulative in top_packages(runs[-1], args.top):
+        print(f"  {package:<30} {cumulative / 1000:8.1f} мс")
+
+    eager = eager_modules(runs[-1])
+    if eager:
+        print(f"Импортируются при запуске pytest: {', '.join(eager)}")
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"Медиана {median_ms:.0f} мс больше порога {args.max_ms:.0f} мс")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
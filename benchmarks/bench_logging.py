@@ -0,0 +1,68 @@
+"""
+Бенчмарк логирования CustomRequester.
+
+Сравнивает стоимость log_request_and_response на большой странице /movies:
+- INFO выключен (запись отбрасывается до форматирования);
+- INFO включен, но хендлер отбрасывает запись (форматирование отложено);
+- INFO включен и запись реально выводится.
+
+Запуск: python -m benchmarks.bench_logging
+"""
+import io
+import json
+import logging
+import timeit
+
+import requests
+
+from custom_requester.custom_requester import CustomRequester
+
+ITERATIONS = 2000
+
+
+def make_movies_response(count=500):
+    movies = [
+        {"id": i, "name": f"Movie {i}", "price": i, "location": "MSK", "published": True, "description": "x" * 100}
+        for i in range(count)
+    ]
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps({"movies": movies, "count": count}).encode("utf-8")
+    response.request = requests.Request("GET", "https://api.example.test/movies", headers=CustomRequester.base_headers).prepare()
+    return response
+
+
+def measure(requester, response):
+    seconds = timeit.timeit(lambda: requester.log_request_and_response(response), number=ITERATIONS)
+    return seconds / ITERATIONS * 1_000_000
+
+
+def main():
+    response = make_movies_response()
+    requester = CustomRequester(session=requests.Session(), base_url="https://api.example.test/")
+    logger = requester.logger
+    logger.propagate = False
+
+    logger.setLevel(logging.WARNING)
+    disabled = measure(requester, response)
+
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setLevel(logging.WARNING)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    filtered_by_handler = measure(requester, response)
+
+    handler.setLevel(logging.INFO)
+    emitted = measure(requester, response)
+    requester.log_body_limit = None
+    emitted_unlimited = measure(requester, response)
+
+    print(f"{'mode':<40}{'us/call':>12}")
+    print(f"{'INFO disabled':<40}{disabled:>12.2f}")
+    print(f"{'INFO enabled, dropped by handler':<40}{filtered_by_handler:>12.2f}")
+    print(f"{'INFO emitted, body capped':<40}{emitted:>12.2f}")
+    print(f"{'INFO emitted, full pretty-printed body':<40}{emitted_unlimited:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""
+Бенчмарк записи латентности в RequestMetrics.
+
+Показывает, сколько добавляет к каждому send_request запись пяти фаз в гистограммы.
+
+Запуск: python -m benchmarks.bench_metrics
+"""
+import timeit
+
+from custom_requester.metrics import RequestMetrics
+
+ITERATIONS = 100_000
+
+
+def main():
+    metrics = RequestMetrics()
+    timings = {"total": 0.052, "connect": 0.0, "server": 0.041, "download": 0.006, "client": 0.005}
+    seconds = timeit.timeit(lambda: metrics.record("GET", "movies/42", timings), number=ITERATIONS)
+    print(f"RequestMetrics.record: {seconds / ITERATIONS * 1_000_000:.2f} мкс на запрос")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Бенчмарк валидации ответов: текущий способ против быстрого пути models.fast_validation.
+
+- per-item: response.json() и GetUserResponse(**item) для каждого элемента;
+- validate_page: одна модель страницы, model_validate_json прямо из байтов;
+- sampled: проверяется только каждый 10-й элемент (json.loads + TypeAdapter на выборке).
+
+Запуск: python -m benchmarks.bench_validation
+"""
+import json
+import timeit
+
+import requests
+
+from models.fast_validation import validate_page
+from models.test_pydantic import GetUserResponse
+
+ITERATIONS = 50
+
+
+def make_users_response(count=1000):
+    users = [
+        {
+            "id": f"3a172562-e05d-4768-82dd-{i:012d}",
+            "email": f"user{i}@gmail.com",
+            "fullName": f"User {i}",
+            "verified": True,
+            "banned": False,
+            "roles": ["USER"],
+            "createdAt": "2025-06-01T12:00:00.000Z"
+        }
+        for i in range(count)
+    ]
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps({"users": users, "count": count}).encode("utf-8")
+    return response
+
+
+def per_item(response):
+    return [GetUserResponse(**user) for user in response.json()["users"]]
+
+
+def measure(func):
+    return timeit.timeit(func, number=ITERATIONS) / ITERATIONS * 1000
+
+
+def main():
+    response = make_users_response()
+    assert len(validate_page(GetUserResponse, response, items_key="users")) == len(per_item(response))
+
+    current = measure(lambda: per_item(response))
+    fast = measure(lambda: validate_page(GetUserResponse, response, items_key="users", sample_every=1))
+    sampled = measure(lambda: validate_page(GetUserResponse, response, items_key="users", sample_every=10))
+
+    print(f"{'mode (1000 users)':<40}{'ms/page':>10}{'speedup':>10}")
+    print(f"{'per-item GetUserResponse(**item)':<40}{current:>10.2f}{1:>10.1f}")
+    print(f"{'validate_page (json bytes)':<40}{fast:>10.2f}{current / fast:>10.1f}")
+    print(f"{'validate_page, every 10th item':<40}{sampled:>10.2f}{current / sampled:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
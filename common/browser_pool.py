@@ -0,0 +1,133 @@
+"""
+Пул браузера и контекстов Playwright для UI-тестов.
+
+Запуск Chromium занимает секунды, создание контекста — десятки миллисекунд, страницы — единицы.
+Пул запускает один браузер на процесс (воркер xdist) и держит несколько «прогретых» контекстов:
+после теста контекст очищается (cookies, разрешения, localStorage/sessionStorage, открытые страницы)
+и отдаётся следующему тесту.
+"""
+import json
+import threading
+from pathlib import Path
+
+
+class BrowserPool:
+    """
+    Один браузер и пул переиспользуемых контекстов.
+    """
+
+    def __init__(self, launch, size: int = 2, default_timeout: float = None, setup=None):
+        """
+        :param launch: Функция без аргументов, запускающая браузер (вызывается при первом обращении).
+        :param size: Сколько очищенных контекстов держать в пуле; 0 — не переиспользовать контексты.
+        :param default_timeout: Таймаут по умолчанию для контекстов, мс.
+        :param setup: Функция setup(context), вызываемая один раз для каждого нового контекста
+            (например, установка перехвата запросов); переживает возврат контекста в пул.
+        """
+        self._launch = launch
+        self.size = size
+        self.default_timeout = default_timeout
+        self.setup = setup
+        self._browser = None
+        self._idle = []
+        self._lock = threading.Lock()
+        self.launches = 0
+        self.contexts_created = 0
+        self.contexts_reused = 0
+        self.contexts_discarded = 0
+
+    @property
+    def browser(self):
+        with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                self._browser = self._launch()
+                self._idle.clear()
+                self.launches += 1
+            return self._browser
+
+    def acquire(self, storage_state=None):
+        """
+        Выдаёт чистый контекст: из пула или новый.
+        :param storage_state: Состояние авторизации (dict или путь, как в Browser.new_context).
+        Cookies добавляются в переиспользуемый контекст; состояние с localStorage требует нового контекста.
+        """
+        if storage_state is not None and not isinstance(storage_state, dict):
+            storage_state = _read_state(storage_state)
+        if storage_state and storage_state.get("origins"):
+            return self._new_context(storage_state=storage_state)
+
+        browser = self.browser
+        with self._lock:
+            context = self._idle.pop() if self._idle else None
+            if context is not None:
+                self.contexts_reused += 1
+        if context is None:
+            context = self._new_context(browser)
+        if storage_state and storage_state.get("cookies"):
+            context.add_cookies(storage_state["cookies"])
+        return context
+
+    def release(self, context):
+        """
+        Очищает контекст и возвращает его в пул (или закрывает, если пул полон или очистить не удалось).
+        """
+        try:
+            for page in context.pages:
+                _clear_web_storage(page)
+                page.close()
+            context.clear_cookies()
+            context.clear_permissions()
+            reusable = not context.storage_state()["origins"]
+        except Exception:
+            reusable = False
+
+        with self._lock:
+            if reusable and len(self._idle) < self.size and self._browser is not None and self._browser.is_connected():
+                self._idle.append(context)
+                return
+            self.contexts_discarded += 1
+        try:
+            context.close()
+        except Exception:
+            pass
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+            browser, self._browser = self._browser, None
+        for context in idle:
+            context.close()
+        if browser is not None and browser.is_connected():
+            browser.close()
+
+    def stats(self):
+        return {
+            "launches": self.launches,
+            "contexts_created": self.contexts_created,
+            "contexts_reused": self.contexts_reused,
+            "contexts_discarded": self.contexts_discarded
+        }
+
+    def _new_context(self, browser=None, **options):
+        context = (browser or self.browser).new_context(**options)
+        if self.default_timeout is not None:
+            context.set_default_timeout(self.default_timeout)
+        if self.setup is not None:
+            self.setup(context)
+        with self._lock:
+            self.contexts_created += 1
+        return context
+
+
+def _read_state(path):
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _clear_web_storage(page):
+    if not page.url.startswith("http"):
+        return
+    try:
+        page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+    except Exception:
+        # Страница могла закрыться или уйти на другой origin: storage_state() в release это поймает
+        pass
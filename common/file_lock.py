@@ -0,0 +1,58 @@
+import os
+import time
+from pathlib import Path
+
+
+class FileLock:
+    """
+    Межпроцессная блокировка на основе lock-файла.
+    Работает одинаково на Windows и Linux: файл создаётся атомарно через O_CREAT | O_EXCL.
+    Используется для координации воркеров pytest-xdist.
+    """
+
+    def __init__(self, path, timeout: float = 60, poll_interval: float = 0.05, stale_after: float = 300):
+        """
+        :param path: Путь к lock-файлу.
+        :param timeout: Сколько секунд ждать захвата блокировки.
+        :param poll_interval: Пауза между попытками захвата.
+        :param stale_after: Через сколько секунд lock-файл считается брошенным упавшим процессом.
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._remove_if_stale()
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Не удалось захватить блокировку {self.path} за {self.timeout} секунд")
+                time.sleep(self.poll_interval)
+                continue
+            with os.fdopen(fd, "w") as file:
+                file.write(str(os.getpid()))
+            return self
+
+    def release(self):
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _remove_if_stale(self):
+        try:
+            if time.time() - self.path.stat().st_mtime > self.stale_after:
+                self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
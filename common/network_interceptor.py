@@ -0,0 +1,266 @@
+"""
+Перехват сетевых запросов UI-тестов: статика из дискового кэша и блокировка лишних запросов.
+
+Скрипты, стили, шрифты и картинки фронтенда при первой загрузке сохраняются на диск
+(files/asset_cache). Пока запись свежая по Cache-Control: max-age сервера, браузер получает её
+без сети; устаревшая запись с ETag или Last-Modified перепроверяется условным запросом,
+и при 304 тело берётся из кэша — после деплоя фронтенда тесты сразу получают новую статику.
+prune() в начале сессии удаляет мёртвые записи и держит размер кэша в пределах квоты.
+Запросы к сторонним доменам (аналитика, виджеты) и картинки можно не пускать вовсе —
+для тестов, которым они не нужны.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+STATIC_RESOURCE_TYPES = {"script", "stylesheet", "font", "image", "media"}
+IMAGE_RESOURCE_TYPES = {"image", "media"}
+COUNTERS = ("cache_hits", "cache_misses", "bytes_saved", "bytes_downloaded", "blocked")
+# Тело в кэше хранится уже распакованным: заголовки кодирования и длины не переносятся
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)")
+
+
+@dataclass
+class CachedAsset:
+    status: int
+    headers: dict
+    body: bytes
+    expires_at: float
+    etag: str = None
+    last_modified: str = None
+
+    @property
+    def fresh(self):
+        return time.time() < self.expires_at
+
+    @property
+    def validators(self):
+        """
+        Заголовки условного запроса для перепроверки устаревшей записи.
+        """
+        headers = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+
+class AssetCache:
+    """
+    Дисковый кэш статических ответов: <sha256 url>.body и <sha256 url>.json с кодом, заголовками
+    и валидаторами (ETag, Last-Modified).
+    """
+
+    def __init__(self, directory, max_age: float = 24 * 3600):
+        """
+        :param directory: Директория кэша (общая для воркеров: файлы пишутся атомарно).
+        :param max_age: Верхняя граница свежести записи; она же — время жизни ответа без max-age и без валидаторов.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+
+    def _paths(self, url):
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{name}.body", self.directory / f"{name}.json"
+
+    def get(self, url):
+        """
+        :return: CachedAsset (свежий или устаревший с валидаторами) или None, если записи нет
+            или её нельзя перепроверить.
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            entry = CachedAsset(meta["status"], meta["headers"], body_path.read_bytes(), meta["expires_at"],
+                                meta.get("etag"), meta.get("last_modified"))
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+        return entry if entry.fresh or entry.validators else None
+
+    def put(self, url, status, headers, body):
+        body_path, meta_path = self._paths(url)
+        headers = {name: value for name, value in headers.items() if name.lower() not in SKIPPED_HEADERS}
+        _atomic_write(body_path, body)
+        self._write_meta(url, status, headers)
+
+    def refresh(self, url, entry, headers):
+        """
+        Продлевает запись после ответа 304 по новым заголовкам кэширования сервера.
+        """
+        headers = {**entry.headers, **{name: value for name, value in headers.items()
+                                       if name.lower() not in SKIPPED_HEADERS}}
+        self._write_meta(url, entry.status, headers)
+        entry.headers = headers
+        entry.expires_at = time.time() + self.lifetime(headers)
+
+    def lifetime(self, headers):
+        """
+        Сколько секунд ответ свежий: max-age из Cache-Control (не больше self.max_age);
+        no-cache или ответ без max-age, но с валидаторами — 0, то есть перепроверять при каждом запросе.
+        """
+        headers = {name.lower(): value for name, value in headers.items()}
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-cache" in cache_control:
+            return 0
+        match = MAX_AGE.search(cache_control)
+        if match:
+            return min(int(match.group(1)), self.max_age)
+        return 0 if "etag" in headers or "last-modified" in headers else self.max_age
+
+    def prune(self, quota_bytes=None):
+        """
+        Удаляет записи, которые уже не пригодятся (устаревшие без валидаторов, битые, без тела),
+        затем, пока кэш больше quota_bytes, — самые давно записанные или продлённые.
+        :param quota_bytes: Предельный размер кэша (None — без ограничения).
+        :return: Количество удалённых записей.
+        """
+        now = time.time()
+        entries = []
+        removed = 0
+        for meta_path in self.directory.glob("*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                size = body_path.stat().st_size + meta_path.stat().st_size
+                written_at = meta_path.stat().st_mtime
+                dead = meta["expires_at"] <= now and not (meta.get("etag") or meta.get("last_modified"))
+            except (FileNotFoundError, json.JSONDecodeError, KeyError):
+                dead = True
+            if dead:
+                _remove_entry(meta_path)
+                removed += 1
+            else:
+                entries.append((written_at, size, meta_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, meta_path in sorted(entries):
+            if quota_bytes is None or total <= quota_bytes:
+                break
+            total -= size
+            _remove_entry(meta_path)
+            removed += 1
+        return removed
+
+    def _write_meta(self, url, status, headers):
+        lowered = {name.lower(): value for name, value in headers.items()}
+        _atomic_write(self._paths(url)[1], json.dumps({
+            "url": url,
+            "status": status,
+            "headers": headers,
+            "expires_at": time.time() + self.lifetime(headers),
+            "etag": lowered.get("etag"),
+            "last_modified": lowered.get("last-modified")
+        }).encode("utf-8"))
+
+
+class NetworkInterceptor:
+    """
+    Обработчик context.route("**/*"), общий для всех контекстов воркера.
+    block_images действует на весь прогон, images_allowed снимает блокировку для отдельного теста;
+    счётчики накапливаются, stats() даёт срез.
+    """
+
+    def __init__(self, cache: AssetCache = None, first_party_hosts=(), block_third_party=False, block_images=False):
+        """
+        :param cache: Кэш статики (None — статика грузится из сети как обычно).
+        :param first_party_hosts: Хосты стенда (UI, API, авторизация); их поддомены тоже считаются своими.
+        :param block_third_party: Не пускать запросы к сторонним доменам.
+        :param block_images: Не загружать картинки и медиа.
+        """
+        self.cache = cache
+        self.first_party_hosts = {host for host in first_party_hosts if host}
+        self.block_third_party = block_third_party
+        self.block_images = block_images
+        self.images_allowed = False
+        self._lock = threading.Lock()
+        self.counters = dict.fromkeys(COUNTERS, 0)
+
+    @property
+    def active(self):
+        """
+        Есть ли обработчику что делать: без кэша и блокировок запросы не гоняются через Python.
+        """
+        return self.cache is not None or self.block_third_party or self.block_images
+
+    def install(self, context):
+        if self.active:
+            context.route("**/*", self.handle)
+
+    def is_third_party(self, url):
+        host = urlsplit(url).hostname or ""
+        return not any(host == known or host.endswith("." + _site(known)) for known in self.first_party_hosts)
+
+    def handle(self, route, request):
+        if request.url.startswith("data:"):
+            return route.fallback()
+        if self.block_images and not self.images_allowed and request.resource_type in IMAGE_RESOURCE_TYPES:
+            return self._block(route)
+        if self.block_third_party and self.is_third_party(request.url):
+            return self._block(route)
+        if self.cache is None or request.method != "GET" or request.resource_type not in STATIC_RESOURCE_TYPES:
+            return route.fallback()
+
+        cached = self.cache.get(request.url)
+        if cached is not None and cached.fresh:
+            return self._fulfill_cached(route, cached)
+
+        if cached is not None:
+            response = route.fetch(headers={**request.headers, **cached.validators})
+            if response.status == 304:
+                self.cache.refresh(request.url, cached, response.headers)
+                return self._fulfill_cached(route, cached)
+        else:
+            response = route.fetch()
+        body = response.body()
+        self._count(cache_misses=1, bytes_downloaded=len(body))
+        if response.status == 200 and "no-store" not in response.headers.get("cache-control", ""):
+            self.cache.put(request.url, response.status, response.headers, body)
+        return route.fulfill(response=response, body=body)
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters)
+
+    def _fulfill_cached(self, route, cached):
+        self._count(cache_hits=1, bytes_saved=len(cached.body))
+        return route.fulfill(status=cached.status, headers=cached.headers, body=cached.body)
+
+    def _block(self, route):
+        self._count(blocked=1)
+        return route.abort("blockedbyclient")
+
+    def _count(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                self.counters[name] += delta
+
+
+def _site(host):
+    """
+    Домен сайта без сервисного поддомена: api.dev-cinescope.ru -> dev-cinescope.ru; IP и localhost как есть.
+    """
+    labels = host.split(".")
+    if host.replace(".", "").isdigit() or len(labels) <= 2:
+        return host
+    return ".".join(labels[-2:])
+
+
+def _remove_entry(meta_path):
+    # Сначала метаданные: без них get() не прочитает тело, даже если другой воркер читает запись прямо сейчас
+    meta_path.unlink(missing_ok=True)
+    meta_path.with_suffix(".body").unlink(missing_ok=True)
+
+
+def _atomic_write(path, data):
+    tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}-{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
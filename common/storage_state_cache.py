@@ -0,0 +1,141 @@
+"""
+Кэш состояния авторизации браузера (Playwright storage_state) по учётным данным.
+
+Логин выполняется один раз: через UI или через AuthAPI.login_user. Полученное состояние
+сохраняется в файл воркера и подставляется в новые контексты, пока не истекло, —
+подготовка авторизованного UI-теста сводится к чтению файла. Между прогонами файл пригоден
+только для постоянных учётных записей: пользователи пула пересоздаются в каждой сессии.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from api.token_cache import TokenCache, jwt_expiry
+
+
+class StorageStateCache:
+    """
+    Состояния авторизации в памяти процесса и в файлах directory/<ключ>.json.
+    Состояние свежее, пока до истечения самой ранней cookie или JWT в нём больше refresh_margin секунд;
+    если сроков в состоянии нет — default_ttl секунд с момента сохранения файла.
+    """
+
+    def __init__(self, directory, refresh_margin: float = 60, default_ttl: float = 600):
+        """
+        :param directory: Директория для файлов состояния (своя у каждого воркера xdist).
+        :param refresh_margin: За сколько секунд до истечения состояние считается устаревшим.
+        :param default_ttl: Время жизни состояния без cookie с expires и без JWT.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.logins = 0
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def path(self, key):
+        return self.directory / f"{key[:32]}.json"
+
+    def get(self, base_url, user_creds, login):
+        """
+        Возвращает свежее состояние авторизации или получает новое через login().
+        :param base_url: Адрес UI: одни и те же учётные данные на разных стендах — разные состояния.
+        :param user_creds: Кортеж (email, password).
+        :param login: Функция без аргументов, выполняющая логин и возвращающая storage_state (dict).
+        """
+        key = TokenCache.make_key(base_url, user_creds)
+        with self._lock:
+            entry = self._states.get(key) or self._read(key)
+            if entry is not None and self._is_fresh(entry):
+                self._states[key] = entry
+                self.hits += 1
+                return entry["state"]
+
+        state = login()
+        entry = {"state": state, "expires_at": self.expires_at(state, time.time())}
+        self._write(key, state)
+        with self._lock:
+            self._states[key] = entry
+            self.logins += 1
+        return state
+
+    def invalidate(self, base_url, user_creds):
+        key = TokenCache.make_key(base_url, user_creds)
+        with self._lock:
+            self._states.pop(key, None)
+        self.path(key).unlink(missing_ok=True)
+
+    def stats(self):
+        return {"hits": self.hits, "logins": self.logins}
+
+    def prune(self):
+        """
+        Удаляет файлы состояний, которые уже не свежие или не читаются: иначе остаются файлы
+        пользователей, удалённых после прошлых прогонов (например, из пула).
+        :return: Список удалённых файлов.
+        """
+        removed = []
+        with self._lock:
+            for path in self.directory.glob("*.json"):
+                entry = self._read_path(path)
+                if entry is None or not self._is_fresh(entry):
+                    path.unlink(missing_ok=True)
+                    removed.append(path)
+        return removed
+
+    def expires_at(self, state, saved_at):
+        """
+        Самый ранний срок из expires cookies и exp JWT в cookies и localStorage.
+        """
+        deadlines = [cookie["expires"] for cookie in state.get("cookies", []) if cookie.get("expires", -1) > 0]
+        values = [cookie["value"] for cookie in state.get("cookies", [])]
+        values += [item["value"] for origin in state.get("origins", []) for item in origin.get("localStorage", [])]
+        deadlines += [expiry for expiry in map(jwt_expiry, values) if expiry is not None]
+        return min(deadlines) if deadlines else saved_at + self.default_ttl
+
+    def _is_fresh(self, entry):
+        return entry["expires_at"] - self.refresh_margin > time.time()
+
+    def _read(self, key):
+        return self._read_path(self.path(key))
+
+    def _read_path(self, path):
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return {"state": state, "expires_at": self.expires_at(state, path.stat().st_mtime)}
+
+    def _write(self, key, state):
+        path = self.path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+def api_storage_state(auth_api, user_creds):
+    """
+    Логин через AuthAPI.login_user без браузера: cookies, выставленные сервисом авторизации,
+    переводятся в формат storage_state. Подходит, если фронтенд авторизуется этими cookies.
+    """
+    auth_api.login_user({"email": user_creds[0], "password": user_creds[1]})
+    default_domain = urlparse(auth_api.base_url).hostname
+    cookies = [
+        {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain or default_domain,
+            "path": cookie.path or "/",
+            "expires": float(cookie.expires) if cookie.expires else -1,
+            "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+            "secure": cookie.secure,
+            "sameSite": "Lax"
+        }
+        for cookie in auth_api.session.cookies
+    ]
+    return {"cookies": cookies, "origins": []}
@@ -1,25 +1,36 @@
 import datetime
+import logging
 import os
 import uuid
-from playwright.sync_api import sync_playwright
 from dotenv import load_dotenv
-from faker import Faker
 import pytest
 import requests
 
 from api.api_manager import ApiManager
+from api.auth_api import AuthAPI
+from api.token_cache import TokenCache
 from common.Tools import Tools
-from constants import BASE_URL, REGISTER_ENDPOINT, Roles
+from constants import BASE_URL, REGISTER_ENDPOINT, UI_URL, Roles
 from custom_requester.custom_requester import CustomRequester
-from db_requester.models import UserDBModel
+from custom_requester.response_cache import ResponseCache
+from custom_requester.retry import RetryPolicy
+from custom_requester.transport import SharedTransport
 from entities.user import User
+from entities.user_pool import UserPool
 from models.test_pydantic import PydenticUser
 from resources.user_creds import SuperAdminCreds
 from utils.data_generator import DataGenerator
-from sqlalchemy import create_engine, Column, String, Boolean, DateTime, text
-from sqlalchemy.orm import declarative_base, sessionmaker
 
-faker = Faker()
+pytest_plugins = [
+    "plugins.environment",
+    "plugins.xdist_sharding",
+    "plugins.duration_store",
+    "plugins.request_metrics",
+    "plugins.browser_pool",
+    "plugins.tracing",
+    "plugins.network",
+    "plugins.ui_waits"
+]
 
 @pytest.fixture(scope="function")
 def test_user():
@@ -67,28 +78,87 @@ def requester():
 
 
 @pytest.fixture(scope="session")
-def session():
+def http_transport():
+    """
+    Общий пул соединений для всех HTTP-сессий тестового прогона.
+    Параметры пула можно переопределить переменными окружения.
+    """
+    transport = SharedTransport(
+        pool_connections=int(os.getenv("HTTP_POOL_CONNECTIONS", 10)),
+        pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", 20)),
+        max_retries=int(os.getenv("HTTP_MAX_RETRIES", 0)),
+        keep_alive=os.getenv("HTTP_KEEP_ALIVE", "true").lower() == "true"
+    )
+    yield transport
+    for host, host_stats in transport.stats().items():
+        logging.getLogger(__name__).info(
+            f"Connection pool {host}: requests={host_stats['requests']}, "
+            f"reused={host_stats['hits']}, new={host_stats['misses']}"
+        )
+    transport.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def retry_policy():
+    """
+    Политика повторов запросов при 502/503/504 и обрывах соединения; по умолчанию повторов нет.
+    HTTP_RETRY_ATTEMPTS=3 включает повторы, HTTP_RETRY_BUDGET ограничивает время на запрос с повторами.
+    """
+    attempts = int(os.getenv("HTTP_RETRY_ATTEMPTS", 1))
+    previous = CustomRequester.retry_policy
+    if attempts > 1:
+        CustomRequester.retry_policy = RetryPolicy(
+            max_attempts=attempts,
+            total_budget=float(os.getenv("HTTP_RETRY_BUDGET", 30))
+        )
+    else:
+        CustomRequester.retry_policy = None
+    yield CustomRequester.retry_policy
+    CustomRequester.retry_policy = previous
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers(retry_policy):
+    """
+    Разомкнутый circuit breaker не переходит в следующий тест: падение хоста в одном тесте
+    не превращается в CircuitOpenError в несвязанных тестах.
+    """
+    yield
+    if retry_policy is not None:
+        retry_policy.reset()
+
+
+@pytest.fixture(scope="session")
+def session(http_transport):
     """
     Фикстура для создания HTTP-сессии.
     """
-    http_session = requests.Session()
+    http_session = http_transport.new_session()
     http_session.base_url = BASE_URL  # Импортируйте BASE_URL из constants
     yield http_session
     http_session.close()
 
+def new_response_cache():
+    """
+    Кэш GET-ответов для ApiManager, если задан HTTP_RESPONSE_CACHE_TTL (в секундах), иначе None.
+    """
+    ttl = float(os.getenv("HTTP_RESPONSE_CACHE_TTL", 0))
+    return ResponseCache(ttl=ttl) if ttl > 0 else None
+
 @pytest.fixture(scope="session")
 def api_manager(session):
     """
     Фикстура для создания экземпляра ApiManager.
     """
-    return ApiManager(session)
+    return ApiManager(session, response_cache=new_response_cache())
 
 @pytest.fixture(scope="session")
-def test_movie():
+def test_movie(worker_shard):
     """
     Генерация случайного фильма для тестов.
+    Имя уникально между воркерами xdist.
     """
-    random_name = DataGenerator.generate_random_movie_name()
+    random_name = worker_shard.unique_name(DataGenerator.generate_random_movie_name())
     random_desc = DataGenerator.generate_random_movie_name()
     random_price = DataGenerator.generate_random_price()
     random_location = DataGenerator.generate_random_location()
@@ -103,6 +173,22 @@ def test_movie():
         "genreId": 2
     }
 
+@pytest.fixture(scope="session", autouse=True)
+def token_cache(shared_tmp_dir):
+    """
+    Кэш токенов для AuthAPI.authenticate.
+    Под pytest-xdist (или при TOKEN_CACHE_SHARED=true) кэш хранится в файле, общем для всех воркеров,
+    поэтому супер-админ логинится один раз на весь прогон. После сессии прежний кэш возвращается на место.
+    """
+    previous = AuthAPI.token_cache
+    if os.getenv("TOKEN_CACHE_SHARED", "false").lower() == "true" or os.getenv("PYTEST_XDIST_WORKER"):
+        AuthAPI.token_cache = TokenCache(path=shared_tmp_dir / "token_cache.json")
+    yield AuthAPI.token_cache
+    cache_stats = AuthAPI.token_cache.stats()
+    logging.getLogger(__name__).info(f"Token cache: hits={cache_stats['hits']}, logins={cache_stats['logins']}")
+    AuthAPI.token_cache = previous
+
+
 @pytest.fixture()
 def authenticate_admin(api_manager):
     return api_manager.auth_api.authenticate([SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD])
@@ -112,12 +198,12 @@ def create_test_movie(test_movie, super_admin):
     yield super_admin.api.movies_api.create_movie(test_movie)
 
 @pytest.fixture
-def user_session():
+def user_session(http_transport):
     user_pool = []
 
     def _create_user_session():
-        session = requests.Session()
-        user_session = ApiManager(session)
+        session = http_transport.new_session()  # Заголовки у каждого пользователя свои, соединения общие
+        user_session = ApiManager(session, response_cache=new_response_cache())
         user_pool.append(user_session)
         return user_session
 
@@ -149,19 +235,43 @@ def creation_user_data(test_user):
     })
     return updated_data
 
-@pytest.fixture
-def common_user(user_session, super_admin, creation_user_data):
-    new_session = user_session()
+@pytest.fixture(scope="session")
+def session_super_admin(http_transport):
+    """
+    Супер-админ на всю сессию: используется для подготовки общих данных, например пула пользователей.
+    """
+    api = ApiManager(http_transport.new_session(), response_cache=new_response_cache())
+    super_admin = User(
+        SuperAdminCreds.USERNAME,
+        SuperAdminCreds.PASSWORD,
+        [Roles.SUPER_ADMIN.value],
+        api)
 
-    common_user = User(
-        creation_user_data['email'],
-        creation_user_data['password'],
-        list(Roles.USER.value),
-        new_session)
+    super_admin.api.auth_api.authenticate(super_admin.creds)
+    yield super_admin
+    api.close_session()
+
+@pytest.fixture(scope="session")
+def user_pool(session_super_admin, http_transport):
+    """
+    Пул заранее созданных пользователей: создаётся один раз на сессию, в конце удаляется целиком.
+    Размер пула на каждую роль задаётся переменной окружения USER_POOL_SIZE.
+    """
+    pool = UserPool(
+        session_super_admin,
+        lambda: ApiManager(http_transport.new_session(), response_cache=new_response_cache()),
+        size_per_role=int(os.getenv("USER_POOL_SIZE", 2))
+    ).provision()
+    yield pool
+    pool.teardown()
 
-    super_admin.api.user_api.create_user(creation_user_data)
-    common_user.api.auth_api.authenticate(common_user.creds)
-    return common_user
+@pytest.fixture
+def common_user(user_pool):
+    """
+    Пользователь с ролью USER, арендованный из пула на время теста.
+    """
+    with user_pool.leased(Roles.USER) as common_user:
+        yield common_user
 
 @pytest.fixture
 def registration_user_data():
@@ -175,25 +285,25 @@ def registration_user_data():
         "roles": [Roles.USER.value]
     }
 
-USERNAME = os.getenv("DB_USER")
-PASSWORD = os.getenv("PASSWORD")
-HOST = os.getenv("HOST")
-PORT = os.getenv("PORT")
-DATABASE_NAME = os.getenv("DATABASE_NAME")
-
-engine = create_engine(f"postgresql+psycopg2://{USERNAME}:{PASSWORD}@{HOST}:{PORT}/{DATABASE_NAME}") # Создаем движок (engine) для подключения к базе данных
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine) # Создаем фабрику сессий
-
-@pytest.fixture(scope="module")
-def db_session():
+@pytest.fixture(scope="session")
+def db_engine():
     """
-    Фикстура с областью видимости module.
-    Тестовые данные создаются один раз для всех тестов в модуле.
+    Engine с пулом соединений, общий для всех тестов воркера.
+    Размер пула задаётся DB_POOL_SIZE и DB_MAX_OVERFLOW.
+    SQLAlchemy импортируется здесь, а не при загрузке conftest: тесты без БД не платят за её импорт
+    и не требуют переменных окружения для подключения.
     """
-    session = SessionLocal()
+    from db_requester.db_session import create_db_engine
 
-    # Создаем тестовые данные
-    test_user = UserDBModel(
+    engine = create_db_engine()
+    yield engine
+    engine.dispose()
+
+
+def new_test_db_user():
+    from db_requester.models import UserDBModel
+
+    return UserDBModel(
         id = DataGenerator.generate_random_id(),
         email = DataGenerator.generate_random_email(),
         full_name = DataGenerator.generate_random_name(),
@@ -204,6 +314,31 @@ def db_session():
         banned = False,
         roles = "{USER}"
     )
+
+
+@pytest.fixture(scope="module")
+def db_session(db_engine):
+    """
+    Фикстура с областью видимости module.
+    Тестовые данные создаются один раз для всех тестов в модуле.
+    По умолчанию (DB_ISOLATION=rollback) модуль работает во внешней транзакции, которая откатывается
+    в конце: commit() в тестах фиксирует только SAVEPOINT. DB_ISOLATION=commit возвращает
+    прежнее поведение — данные коммитятся и удаляются после тестов.
+    """
+    from sqlalchemy.orm import Session
+    from db_requester.db_session import rollback_session
+
+    if os.getenv("DB_ISOLATION", "rollback") == "rollback":
+        with rollback_session(db_engine) as session:
+            session.add(new_test_db_user())
+            session.commit()
+            yield session
+        return
+
+    session = Session(bind=db_engine, autoflush=False)
+
+    # Создаем тестовые данные
+    test_user = new_test_db_user()
     session.add(test_user) #добавляем обьект в базу данных
     session.commit() #сохраняем изменения для всех остальных подключений
 
@@ -216,30 +351,116 @@ def db_session():
     session.close() #завершем сессию (отключаемся от базы данных)
 
 
+@pytest.fixture
+def db_transaction(db_engine):
+    """
+    Сессия на один тест: всё, что тест записал (включая commit()), откатывается после него.
+    """
+    from db_requester.db_session import rollback_session
+
+    with rollback_session(db_engine) as session:
+        yield session
+
+
+@pytest.fixture(scope="module")
+def db_loader(db_engine):
+    """
+    Массовое наполнение БД: db_loader.users(1000), db_loader.movies(500, genre_id) и т.д.
+    Всё созданное удаляется после тестов модуля — по одному DELETE на таблицу.
+    """
+    from db_requester.bulk_loader import BulkLoader
+
+    with BulkLoader(db_engine) as loader:
+        yield loader
+
+
 DEFAULT_UI_TIMEOUT = 30000  # Пример значения таймаута
 
 
-@pytest.fixture(scope="session")  # Браузер запускается один раз для всей сессии
-def browser(playwright):
-    browser = playwright.chromium.launch(headless=False)  # headless=True для CI/CD, headless=False для локальной разработки
-    yield browser  # yield возвращает значение фикстуры, выполнение теста продолжится после yield
-    browser.close()  # Браузер закрывается после завершения всех тестов
+@pytest.fixture(scope="session")
+def browser(browser_pool):
+    """
+    Браузер воркера: запускается один раз (headless, --ui-headed для локальной отладки).
+    """
+    return browser_pool.browser
 
 
 @pytest.fixture(scope="function")
-def context(browser):
-    context = browser.new_context()
-    context.tracing.start(screenshots=True, snapshots=True, sources=True)
+def context(browser_pool, tracing, network):
+    """
+    Контекст из пула: после теста он очищается и достаётся следующему тесту.
+    Трасса снимается и сохраняется по режиму --ui-tracing (по умолчанию только у упавших тестов),
+    статика фронтенда отдаётся из дискового кэша (плагин network).
+    """
+    context = browser_pool.acquire()
+    tracing.start(context)
     context.set_default_timeout(DEFAULT_UI_TIMEOUT)
     yield context
-    log_name = f"trace_{Tools.get_timestamp()}.zip"
-    trace_path = Tools.files_dir('playwright_trace', log_name)
-    context.tracing.stop(path=trace_path)
-    context.close()
+    tracing.stop(context)
+    browser_pool.release(context)
 
 
 @pytest.fixture(scope="function")  # Страница создается для каждого теста
 def page(context):
-    page = context.new_page()
-    yield page  # yield возвращает значение фикстуры, выполнение теста продолжится после yield
-    page.close()  # Страница закрывается после завершения теста
\ No newline at end of file
+    return context.new_page()  # Страница закрывается, когда контекст возвращается в пул
+
+
+@pytest.fixture(scope="session")
+def storage_state_cache(worker_shard):
+    """
+    Кэш состояний авторизации браузера по учётным данным, файлы — в files/storage_state/<воркер>.
+    Свежее состояние переживает и перезапуск прогона, но это помогает только стабильным учётным данным:
+    пользователи пула создаются заново в каждой сессии, и для них кэш экономит логины лишь внутри сессии.
+    Устаревшие файлы удаляются при старте.
+    """
+    from common.storage_state_cache import StorageStateCache
+
+    cache = StorageStateCache(Tools.files_dir("storage_state", worker_shard.worker_id))
+    cache.prune()
+    yield cache
+    cache_stats = cache.stats()
+    logging.getLogger(__name__).info(f"Storage state cache: hits={cache_stats['hits']}, logins={cache_stats['logins']}")
+
+
+@pytest.fixture(scope="function")
+def authenticated_context(browser_pool, storage_state_cache, network, tracing):
+    """
+    Фабрика авторизованных контекстов: authenticated_context((email, password)).
+    Логин выполняется только если в кэше нет свежего состояния для этих учётных данных:
+    через UI (по умолчанию) или через API при UI_LOGIN_VIA=api.
+    Трасса контекста снимается и сохраняется по режиму --ui-tracing, как у фикстуры context.
+    """
+    from common.storage_state_cache import api_storage_state
+    from tests.ui.pages.LoginPage import LoginPage
+
+    def login_via_ui(user_creds):
+        context = browser_pool.acquire()
+        try:
+            login_page = LoginPage(context.new_page())
+            login_page.open()
+            login_page.login(*user_creds)
+            login_page.assert_was_redirect_to_home_page()
+            return context.storage_state()
+        finally:
+            browser_pool.release(context)
+
+    def login_via_api(user_creds):
+        with requests.Session() as login_session:
+            return api_storage_state(AuthAPI(login_session), user_creds)
+
+    login = login_via_api if os.getenv("UI_LOGIN_VIA", "ui") == "api" else login_via_ui
+    contexts = []
+
+    def _open(user_creds):
+        state = storage_state_cache.get(UI_URL, user_creds, lambda: login(user_creds))
+        context = browser_pool.acquire(storage_state=state)
+        tracing.start(context)
+        context.set_default_timeout(DEFAULT_UI_TIMEOUT)
+        contexts.append(context)
+        return context
+
+    yield _open
+    for context in contexts:
+        tracing.stop(context)
+        browser_pool.release(context)
+
@@ -1,13 +1,17 @@
 from enum import Enum
 
+from resources.environment import ENVIRONMENT
+
 
 class Roles(Enum):
     USER = "USER"
     ADMIN = "ADMIN"
     SUPER_ADMIN = "SUPER_ADMIN"
 
-BASE_URL = "https://auth.dev-cinescope.coconutqa.ru/"
-API_URL = "https://api.dev-cinescope.coconutqa.ru/"
+# Адреса берутся из профиля окружения (CINESCOPE_ENV), см. resources/environment.py
+BASE_URL = ENVIRONMENT.auth_url
+API_URL = ENVIRONMENT.api_url
+UI_URL = ENVIRONMENT.ui_url
 HEADERS = {
     "Content-Type": "application/json",
     "Accept": "application/json"
@@ -0,0 +1,75 @@
+import datetime
+import json
+import time
+from types import SimpleNamespace
+
+from custom_requester.custom_requester import CustomRequester
+
+
+class AsyncResponse:
+    """
+    Ответ асинхронного реквестера.
+    Повторяет интерфейс requests.Response, который используют тесты и логирование:
+    status_code, ok, text, content, headers, json() и request.
+    """
+
+    def __init__(self, status_code, content, headers, url, request):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.url = url
+        self.request = request
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncCustomRequester(CustomRequester):
+    """
+    Асинхронный аналог CustomRequester поверх aiohttp.ClientSession.
+    Контракт тот же: send_request проверяет expected_status и возвращает ответ,
+    только вызывать его нужно через await.
+    """
+
+    async def send_request(self, method, endpoint, data=None, params=None, expected_status=200, need_logging=True):
+        """
+        Универсальный метод для отправки асинхронных запросов.
+        :param method: HTTP метод (GET, POST, PUT, DELETE и т.д.).
+        :param endpoint: Эндпоинт (например, "/login").
+        :param data: Тело запроса (JSON-данные).
+        :param params: Параметры запроса (query parameters).
+        :param expected_status: Ожидаемый статус-код (по умолчанию 200).
+        :param need_logging: Флаг для логирования (по умолчанию True).
+        :return: Объект ответа AsyncResponse.
+        """
+        url = f"{self.base_url}{endpoint}"
+        body = json.dumps(data).encode("utf-8") if data is not None else None
+        start = time.perf_counter()
+        async with self.session.request(method, url, data=body, params=params, headers=self.headers) as raw_response:
+            headers_received = time.perf_counter()
+            content = await raw_response.read()
+            request_info = raw_response.request_info
+            request = SimpleNamespace(
+                method=request_info.method,
+                url=str(request_info.url),
+                headers=dict(request_info.headers),
+                body=body
+            )
+            response = AsyncResponse(raw_response.status, content, raw_response.headers, str(raw_response.url), request)
+        received = time.perf_counter()
+        if need_logging and self._is_sampled(endpoint):
+            self.log_request_and_response(response)
+        if self.metrics is not None:
+            response.elapsed = datetime.timedelta(seconds=headers_received - start)
+            self._record_timings(method, endpoint, response, start, received)
+        if response.status_code != expected_status:
+            raise ValueError(f"Unexpected status code: {response.status_code}. Expected: {expected_status}")
+        return response
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class BatchItemResult:
+    """
+    Результат обработки одного элемента пакета.
+    :param item: Исходный элемент (данные фильма, id и т.д.).
+    :param response: Ответ сервера, если запрос прошёл успешно.
+    :param error: Исключение, если запрос упал.
+    :param skipped: True, если элемент не отправлялся из-за исчерпания бюджета ошибок.
+    """
+    item: Any
+    response: Any = None
+    error: Optional[Exception] = None
+    skipped: bool = False
+
+    @property
+    def ok(self):
+        return self.error is None and not self.skipped
+
+
+def run_batch(func, items, concurrency=10, max_errors=None):
+    """
+    Выполняет func(item) для каждого элемента в пуле потоков.
+    Одновременно в работе не больше concurrency запросов, поэтому при исчерпании бюджета
+    ошибок оставшиеся элементы просто не отправляются.
+    :param func: Функция, выполняющая запрос для одного элемента.
+    :param items: Итерируемый набор элементов.
+    :param concurrency: Количество одновременных запросов.
+    :param max_errors: Допустимое число ошибок (None — без ограничения).
+    :return: Список BatchItemResult в порядке входных элементов.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency должен быть больше 0")
+
+    items = list(items)
+    results = [BatchItemResult(item=item, skipped=True) for item in items]
+    errors = 0
+    pending = {}
+    next_index = 0
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while next_index < len(items) or pending:
+            budget_exhausted = max_errors is not None and errors > max_errors
+            while not budget_exhausted and next_index < len(items) and len(pending) < concurrency:
+                pending[executor.submit(func, items[next_index])] = next_index
+                next_index += 1
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                result = results[index]
+                result.skipped = False
+                try:
+                    result.response = future.result()
+                except Exception as e:
+                    result.error = e
+                    errors += 1
+
+    return results
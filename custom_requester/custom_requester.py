@@ -2,6 +2,98 @@
 import json
 import logging
 import os
+import random
+import time
+from fnmatch import fnmatch
+
+import requests
+
+from custom_requester.metrics import default_request_metrics, pop_connect_time
+from custom_requester.retry import CircuitOpenError
+
+GREEN = '\033[32m'
+RED = '\033[31m'
+RESET = '\033[0m'
+
+
+def _truncate(text, limit):
+    """
+    Обрезает текст до limit символов и помечает, сколько было отброшено.
+    """
+    if limit is None or len(text) <= limit:
+        return text
+    return f"{text[:limit]}... ({len(text) - limit} chars truncated)"
+
+
+class _LazyMessage:
+    """
+    Сообщение лога, которое форматируется только в момент,
+    когда хендлер действительно пишет запись: первый str() вызывает fn(*args),
+    остальные хендлеры (консоль, файл, caplog) получают сохранённую строку.
+    """
+
+    def __init__(self, fn, *args):
+        self.fn = fn
+        self.args = args
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            try:
+                self._text = self.fn(*self.args)
+            except Exception as e:
+                self._text = f"\nLogging failed: {type(e)} - {e}"
+        return self._text
+
+
+def _format_request(request, body_limit):
+    """
+    Текст запроса в виде curl-команды.
+    """
+    headers = " \\\n".join([f"-H '{header}: {value}'" for header, value in request.headers.items()])
+    full_test_name = f"pytest {os.environ.get('PYTEST_CURRENT_TEST', '').replace(' (call)', '')}"
+
+    body = ""
+    if getattr(request, 'body', None) is not None:
+        if isinstance(request.body, bytes):
+            body = request.body.decode('utf-8', errors='replace')
+        body = f"-d '{_truncate(body, body_limit)}' \n" if body != '{}' else ''
+
+    return (
+        f"\n{'=' * 40} REQUEST {'=' * 40}\n"
+        f"{GREEN}{full_test_name}{RESET}\n"
+        f"curl -X {request.method} '{request.url}' \\\n"
+        f"{headers} \\\n"
+        f"{body}"
+    )
+
+
+def _format_response(response, body_limit):
+    """
+    Статус и тело ответа.
+    JSON переформатируется с отступами только если тело не превышает лимит.
+    """
+    response_data = response.text
+    if body_limit is None or len(response.content) <= body_limit:
+        try:
+            response_data = json.dumps(json.loads(response_data), indent=4, ensure_ascii=False)
+        except json.JSONDecodeError:
+            pass
+    else:
+        response_data = _truncate(response_data, body_limit)
+
+    if not response.ok:
+        status = (
+            f"\tSTATUS_CODE: {RED}{response.status_code}{RESET}\n"
+            f"\tDATA: {RED}{response_data}{RESET}"
+        )
+    else:
+        status = (
+            f"\tSTATUS_CODE: {GREEN}{response.status_code}{RESET}\n"
+            f"\tDATA:\n{response_data}"
+        )
+    return f"\n{'=' * 40} RESPONSE {'=' * 40}\n{status}\n{'=' * 80}\n"
+
 
 class CustomRequester:
     """
@@ -11,16 +103,28 @@ class CustomRequester:
         "Content-Type": "application/json",
         "Accept": "application/json"
     }
+    log_level = logging.INFO
+    # Максимальный размер тела запроса/ответа в логе (None — без ограничения)
+    log_body_limit = 4096
+    # Доля логируемых запросов по шаблону эндпоинта, например {"/movies*": 0.1}
+    log_sampling = {}
+    # Реестр гистограмм латентности (None — не измерять)
+    metrics = default_request_metrics
+    # Политика повторов при 502/503/504 и ошибках соединения (None — без повторов, по умолчанию)
+    retry_policy = None
+    # Кэш ответов GET (None — выключен); обычно один ResponseCache на ApiManager
+    response_cache = None
 
     def __init__(self, session, base_url):
         self.session = session
         self.base_url = base_url
         self.headers = self.base_headers.copy()
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
+        self.logger.setLevel(self.log_level)
 
 
-    def send_request(self, method, endpoint, data=None, params=None, expected_status=200, need_logging=True):
+    def send_request(self, method, endpoint, data=None, params=None, expected_status=200, need_logging=True,
+                     idempotency_guard=None):
         """
         Универсальный метод для отправки запросов.
         :param method: HTTP метод (GET, POST, PUT, DELETE и т.д.).
@@ -29,17 +133,99 @@ class CustomRequester:
         :param params: Параметры запроса (query parameters).
         :param expected_status: Ожидаемый статус-код (по умолчанию 200).
         :param need_logging: Флаг для логирования (по умолчанию True).
-        :return: Объект ответа requests.Response.
+        :param idempotency_guard: Для POST/PATCH: функция без аргументов, которая перед повтором проверяет,
+            что предыдущая попытка не применилась на сервере (True — повторять безопасно).
+        :return: Объект ответа requests.Response (для GET при включённом response_cache — возможно, из кэша).
         """
         url = f"{self.base_url}{endpoint}"
-        response = self.session.request(method, url, json=data, params=params, headers=self.headers)
-        if need_logging:
+        headers = self.headers
+        cache = self.response_cache if method.upper() == "GET" and expected_status == 200 else None
+        if cache is not None:
+            cache_key = cache.make_key(url, params, self._authorization())
+            entry = cache.lookup(cache_key)
+            if entry is not None and entry.fresh:
+                return entry.response
+            if entry is not None:
+                headers = {**self.headers, "If-None-Match": entry.etag}
+
+        response, start, received = self._send_with_retries(
+            method, endpoint, url, data, params, idempotency_guard, headers
+        )
+        if cache is not None:
+            response = cache.update(cache_key, entry, response)
+        elif self.response_cache is not None and method.upper() != "GET" and response.ok:
+            self.response_cache.invalidate(url)
+        if need_logging and self._is_sampled(endpoint):
             self.log_request_and_response(response)
+        if self.metrics is not None:
+            self._record_timings(method, endpoint, response, start, received)
         if response.status_code != expected_status:
             raise ValueError(f"Unexpected status code: {response.status_code}. Expected: {expected_status}")
         return response
 
 
+    def _authorization(self):
+        return self.headers.get("authorization") or self.session.headers.get("authorization")
+
+
+    def _send_once(self, method, url, data, params, headers):
+        pop_connect_time()
+        start = time.perf_counter()
+        response = self.session.request(method, url, json=data, params=params, headers=headers)
+        return response, start, time.perf_counter()
+
+
+    def _send_with_retries(self, method, endpoint, url, data, params, idempotency_guard, headers):
+        """
+        Отправляет запрос по политике retry_policy: повторяет ошибки соединения и статусы из retry_statuses,
+        пока позволяют число попыток, бюджет времени и правила идемпотентности.
+        Ответ с ретраибельным статусом после исчерпания попыток возвращается как есть.
+        :raises CircuitOpenError: Если circuit breaker хоста разомкнут.
+        """
+        policy = self.retry_policy
+        if policy is None:
+            return self._send_once(method, url, data, params, headers)
+
+        host, breaker = policy.breaker(url)
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                breaker.before_request(host)
+            except CircuitOpenError:
+                if self.metrics is not None:
+                    self.metrics.count(method, endpoint, "rejected")
+                raise
+
+            error = None
+            try:
+                result = self._send_once(method, url, data, params, headers)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                breaker.record_failure()
+                error, result, reason = e, None, type(e).__name__
+            else:
+                if result[0].status_code not in policy.retry_statuses:
+                    breaker.record_success()
+                    return result
+                breaker.record_failure()
+                reason = f"status {result[0].status_code}"
+
+            delay = policy.backoff(attempt)
+            if (attempt >= policy.max_attempts
+                    or time.monotonic() - started + delay > policy.total_budget
+                    or breaker.is_open
+                    or not policy.can_retry(method, error, idempotency_guard)):
+                if error is not None:
+                    raise error
+                return result
+
+            self.logger.warning(f"{method} {url}: {reason}, повтор {attempt}/{policy.max_attempts - 1} через {delay:.2f} с")
+            if self.metrics is not None:
+                self.metrics.count(method, endpoint, "retries")
+            time.sleep(delay)
+            attempt += 1
+
+
     def _update_session_headers(self, **kwargs):
         """
         Обновление заголовков сессии.
@@ -50,46 +236,40 @@ class CustomRequester:
         self.session.headers.update(self.headers)  # Обновляем заголовки в текущей сессии
 
 
+    def _record_timings(self, method, endpoint, response, start, received):
+        """
+        Раскладывает время запроса на фазы и пишет их в гистограммы.
+        response.elapsed — время до получения заголовков, включая установку соединения.
+        """
+        finished = time.perf_counter()
+        connect = pop_connect_time()
+        elapsed = response.elapsed.total_seconds() if getattr(response, "elapsed", None) else received - start
+        self.metrics.record(method, endpoint, {
+            "total": finished - start,
+            "connect": connect,
+            "server": max(elapsed - connect, 0.0),
+            "download": max(received - start - elapsed, 0.0),
+            "client": finished - received
+        })
+
+
+    def _is_sampled(self, endpoint):
+        """
+        Решает, попадает ли запрос к эндпоинту в выборку для логирования.
+        """
+        for pattern, rate in self.log_sampling.items():
+            if fnmatch(endpoint, pattern):
+                return rate >= 1 or random.random() < rate
+        return True
+
+
     def log_request_and_response(self, response):
-        try:
-            request = response.request
-            GREEN = '\033[32m'
-            RED = '\033[31m'
-            RESET = '\033[0m'
-            headers = " \\\n".join([f"-H '{header}: {value}'" for header, value in request.headers.items()])
-            full_test_name = f"pytest {os.environ.get('PYTEST_CURRENT_TEST', '').replace(' (call)', '')}"
-
-            body = ""
-            if hasattr(request, 'body') and request.body is not None:
-                if isinstance(request.body, bytes):
-                    body = request.body.decode('utf-8')
-                body = f"-d '{body}' \n" if body != '{}' else ''
-
-            self.logger.info(f"\n{'=' * 40} REQUEST {'=' * 40}")
-            self.logger.info(
-                f"{GREEN}{full_test_name}{RESET}\n"
-                f"curl -X {request.method} '{request.url}' \\\n"
-                f"{headers} \\\n"
-                f"{body}"
-            )
-
-            response_data = response.text
-            try:
-                response_data = json.dumps(json.loads(response.text), indent=4, ensure_ascii=False)
-            except json.JSONDecodeError:
-                pass
-
-            self.logger.info(f"\n{'=' * 40} RESPONSE {'=' * 40}")
-            if not response.ok:
-                self.logger.info(
-                    f"\tSTATUS_CODE: {RED}{response.status_code}{RESET}\n"
-                    f"\tDATA: {RED}{response_data}{RESET}"
-                )
-            else:
-                self.logger.info(
-                    f"\tSTATUS_CODE: {GREEN}{response.status_code}{RESET}\n"
-                    f"\tDATA:\n{response_data}"
-                )
-            self.logger.info(f"{'=' * 80}\n")
-        except Exception as e:
-            self.logger.error(f"\nLogging failed: {type(e)} - {e}")
\ No newline at end of file
+        """
+        Логирование запроса и ответа.
+        Если уровень INFO выключен, ничего не форматируется; иначе форматирование
+        откладывается до момента, когда хендлер действительно выводит запись.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("%s", _LazyMessage(_format_request, response.request, self.log_body_limit))
+        self.logger.info("%s", _LazyMessage(_format_response, response, self.log_body_limit))
@@ -0,0 +1,243 @@
+"""
+Гистограммы латентности HTTP-запросов по эндпоинтам.
+
+Каждый запрос CustomRequester раскладывается на фазы:
+- total — всё время send_request;
+- connect — установка нового соединения (DNS + TCP + TLS), известна только для сессий SharedTransport;
+- server — ожидание заголовков ответа (отправка запроса, работа сервера);
+- download — чтение тела ответа;
+- client — наша обработка после получения ответа (логирование, проверки).
+"""
+import json
+import re
+import threading
+import time
+from collections import defaultdict
+
+PHASES = ("total", "connect", "server", "download", "client")
+
+# Сегменты пути, которые являются идентификаторами: числа, UUID, email
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}|[^@]+@[^@]+)$")
+
+_connect_time = threading.local()
+
+
+def endpoint_template(endpoint):
+    """
+    Приводит эндпоинт к шаблону: "movies/42?x=1" -> "/movies/{id}".
+    """
+    path = endpoint.split("?", 1)[0]
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/") if segment]
+    return "/" + "/".join(segments)
+
+
+def add_connect_time(seconds):
+    """
+    Учитывает время установки соединения в текущем потоке (вызывается из соединений SharedTransport).
+    """
+    _connect_time.value = getattr(_connect_time, "value", 0.0) + seconds
+
+
+def pop_connect_time():
+    """
+    Возвращает накопленное в текущем потоке время установки соединений и обнуляет его.
+    """
+    value = getattr(_connect_time, "value", 0.0)
+    _connect_time.value = 0.0
+    return value
+
+
+class LatencyHistogram:
+    """
+    Гистограмма в духе HDR: логарифмические диапазоны, каждый разбит на 2**sub_bucket_bits линейных корзин.
+    Значения хранятся в микросекундах, относительная погрешность перцентилей не больше 1 / 2**sub_bucket_bits.
+    """
+
+    def __init__(self, sub_bucket_bits=7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts = defaultdict(int)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _bucket(self, value):
+        shift = value.bit_length() - self.sub_bucket_bits
+        if shift <= 0:
+            return value
+        return (value >> shift) << shift
+
+    def _bucket_upper(self, lower):
+        shift = lower.bit_length() - self.sub_bucket_bits
+        return lower if shift <= 0 else lower + (1 << shift) - 1
+
+    def record(self, seconds):
+        value = max(int(seconds * 1_000_000), 0)
+        self.counts[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for bucket, count in other.counts.items():
+            self.counts[bucket] += count
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, percent):
+        """
+        :return: Верхняя граница корзины, в которую попадает перцентиль, в секундах.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(percent / 100 * self.count, 1)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self._bucket_upper(bucket), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    @property
+    def mean(self):
+        return self.total / self.count / 1_000_000 if self.count else 0.0
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "min_ms": (self.min or 0) / 1000,
+            "mean_ms": self.mean * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max / 1000,
+            "total_us": self.total,
+            "buckets_us": {str(bucket): count for bucket, count in sorted(self.counts.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data, sub_bucket_bits=7):
+        histogram = cls(sub_bucket_bits)
+        histogram.counts.update({int(bucket): count for bucket, count in data["buckets_us"].items()})
+        histogram.count = data["count"]
+        histogram.total = data["total_us"]
+        histogram.min = round(data["min_ms"] * 1000) if data["count"] else None
+        histogram.max = round(data["max_ms"] * 1000)
+        return histogram
+
+
+class RequestMetrics:
+    """
+    Потокобезопасный реестр гистограмм: {(метод, шаблон эндпоинта): {фаза: LatencyHistogram}}
+    и счётчиков событий (повторы, отказы circuit breaker) по тем же ключам.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}
+        self.counters = defaultdict(lambda: defaultdict(int))
+
+    def record(self, method, endpoint, timings):
+        """
+        :param endpoint: Эндпоинт как он передан в send_request; идентификаторы заменяются на {id}.
+        :param timings: Длительности фаз в секундах, например {"total": 0.12, "server": 0.1}.
+        """
+        key = (method.upper(), endpoint_template(endpoint))
+        with self._lock:
+            phases = self.histograms.get(key)
+            if phases is None:
+                phases = self.histograms[key] = {phase: LatencyHistogram() for phase in PHASES}
+            for phase, seconds in timings.items():
+                phases[phase].record(seconds)
+
+    def count(self, method, endpoint, counter):
+        """
+        Увеличивает счётчик события для эндпоинта, например "retries".
+        """
+        key = (method.upper(), endpoint_template(endpoint))
+        with self._lock:
+            self.counters[key][counter] += 1
+
+    def counter(self, method, endpoint, counter):
+        return self.counters.get((method.upper(), endpoint_template(endpoint)), {}).get(counter, 0)
+
+    def histogram(self, method, endpoint, phase="total"):
+        """
+        Гистограмма фазы для эндпоинта (None, если запросов не было).
+        """
+        phases = self.histograms.get((method.upper(), endpoint_template(endpoint)))
+        return phases[phase] if phases else None
+
+    def merge(self, other):
+        with self._lock:
+            for key, other_phases in other.histograms.items():
+                phases = self.histograms.setdefault(key, {phase: LatencyHistogram() for phase in PHASES})
+                for phase, histogram in other_phases.items():
+                    phases[phase].merge(histogram)
+            for key, other_counters in other.counters.items():
+                for counter, value in other_counters.items():
+                    self.counters[key][counter] += value
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def summary(self):
+        """
+        :return: {"GET /movies/{id}": {фаза: статистика гистограммы, "counters": {событие: количество}}}.
+        """
+        empty = {phase: LatencyHistogram() for phase in PHASES}
+        result = {}
+        with self._lock:
+            for method, template in sorted(self.histograms.keys() | self.counters.keys()):
+                phases = self.histograms.get((method, template), empty)
+                result[f"{method} {template}"] = {
+                    **{phase: histogram.to_dict() for phase, histogram in phases.items()},
+                    "counters": dict(self.counters.get((method, template), {}))
+                }
+        return result
+
+    def report(self):
+        """
+        Таблица: количество запросов и перцентили total, плюс среднее по каждой фазе.
+        """
+        lines = [
+            f"{'endpoint':<32}{'count':>8}{'p50, ms':>10}{'p90, ms':>10}{'p99, ms':>10}{'max, ms':>10}"
+            f"{'connect':>10}{'server':>10}{'download':>10}{'client':>10}{'retries':>9}{'rejected':>10}"
+        ]
+        for endpoint, phases in self.summary().items():
+            total = phases["total"]
+            averages = "".join(
+                f"{phases[phase]['mean_ms']:>10.2f}" for phase in ("connect", "server", "download", "client")
+            )
+            lines.append(
+                f"{endpoint:<32}{total['count']:>8}{total['p50_ms']:>10.2f}{total['p90_ms']:>10.2f}"
+                f"{total['p99_ms']:>10.2f}{total['max_ms']:>10.2f}{averages}"
+                f"{phases['counters'].get('retries', 0):>9}{phases['counters'].get('rejected', 0):>10}"
+            )
+        return "\n".join(lines)
+
+    def dump_json(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"created_at": time.time(), "endpoints": self.summary()}, file, indent=4)
+
+    @classmethod
+    def load_json(cls, path):
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        metrics = cls()
+        for endpoint, phases in data["endpoints"].items():
+            key = tuple(endpoint.split(" ", 1))
+            metrics.counters[key].update(phases.pop("counters", {}))
+            metrics.histograms[key] = {
+                phase: LatencyHistogram.from_dict(histogram) for phase, histogram in phases.items()
+            }
+        return metrics
+
+
+default_request_metrics = RequestMetrics()
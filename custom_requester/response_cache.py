@@ -0,0 +1,127 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import urlencode, urlsplit
+
+import requests
+
+
+def _path(url):
+    return "/" + re.sub(r"/+", "/", urlsplit(url).path).strip("/")
+
+
+@dataclass
+class CacheEntry:
+    response: requests.Response
+    expires_at: float
+    etag: str = None
+
+    @property
+    def fresh(self):
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+    """
+    LRU-кэш ответов GET для CustomRequester.
+    Свежая запись отдаётся без запроса; у устаревшей записи с ETag ответ перепроверяется
+    через If-None-Match, и при 304 тело берётся из кэша.
+    Успешный изменяющий запрос (POST/PUT/PATCH/DELETE) сбрасывает записи своей коллекции:
+    PATCH /movies/5 удаляет и /movies/5, и закэшированные страницы /movies.
+    """
+
+    def __init__(self, ttl: float = 30, max_entries: int = 256):
+        """
+        :param ttl: Сколько секунд запись считается свежей.
+        :param max_entries: Максимум записей; при переполнении вытесняется самая давно использованная.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.invalidated = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(url, params=None, authorization=None):
+        """
+        Ключ учитывает токен: ответы разным пользователям (например, 403 и 200) не смешиваются.
+        """
+        query = urlencode(sorted(params.items()), doseq=True) if params else ""
+        return url, query, authorization
+
+    def lookup(self, key):
+        """
+        :return: Запись (свежая или устаревшая с ETag) или None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (not entry.fresh and entry.etag is None):
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.fresh:
+                self.hits += 1
+            return entry
+
+    def store(self, key, response):
+        with self._lock:
+            self._entries[key] = CacheEntry(response, time.monotonic() + self.ttl, response.headers.get("ETag"))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def update(self, key, entry, response):
+        """
+        Учитывает ответ сервера: при 304 продлевает устаревшую запись и возвращает закэшированный ответ,
+        ответ 200 кэширует.
+        :param entry: Запись, найденная lookup (None, если её не было).
+        """
+        if entry is not None and response.status_code == 304:
+            with self._lock:
+                entry.expires_at = time.monotonic() + self.ttl
+                self.revalidated += 1
+            return entry.response
+        if entry is not None:
+            with self._lock:
+                self.misses += 1
+        if response.status_code == 200:
+            self.store(key, response)
+        return response
+
+    def invalidate(self, url):
+        """
+        Удаляет записи для url и для коллекции, в которую он входит.
+        """
+        path = _path(url)
+        collection = path.rsplit("/", 1)[0] if path.count("/") > 1 else path
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if _path(key[0]) == collection or _path(key[0]).startswith(collection + "/")
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidated += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "invalidated": self.invalidated,
+                "evictions": self.evictions
+            }
@@ -0,0 +1,137 @@
+"""
+Повторы запросов CustomRequester: экспоненциальная пауза с джиттером, правила идемпотентности,
+общий бюджет времени и circuit breaker по хостам.
+"""
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Хост недоступен: circuit breaker открыт, запрос не отправлялся.
+    """
+
+
+class CircuitBreaker:
+    """
+    Размыкается после failure_threshold ошибок подряд и reset_timeout секунд отклоняет запросы.
+    Затем пропускает один пробный запрос (остальные потоки по-прежнему получают CircuitOpenError):
+    успех замыкает цепь, ошибка снова размыкает.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_timeout
+
+    def before_request(self, host):
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if self.is_open:
+                raise CircuitOpenError(
+                    f"{host} недоступен: {self.failures} ошибок подряд, повтор через "
+                    f"{self.reset_timeout - (time.monotonic() - self.opened_at):.1f} с"
+                )
+            if self.probing:
+                raise CircuitOpenError(f"{host} недоступен: выполняется пробный запрос")
+            self.probing = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.probing = False
+
+
+def _not_sent(error):
+    """
+    Ошибка возникла до отправки запроса (соединение не установлено) — повтор безопасен для любого метода.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    :param max_attempts: Максимум попыток, включая первую.
+    :param backoff_factor: Пауза перед первым повтором; дальше удваивается.
+    :param max_backoff: Верхняя граница паузы.
+    :param jitter: Доля паузы, выбираемая случайно (0 — без джиттера, 1 — full jitter).
+    :param total_budget: Сколько секунд можно потратить на запрос вместе с повторами.
+    :param retry_statuses: Статусы, после которых запрос повторяется.
+    :param idempotent_methods: Методы, которые повторяются без дополнительных условий.
+    :param failure_threshold: Ошибок подряд до размыкания circuit breaker хоста.
+    :param reset_timeout: Сколько секунд circuit breaker остаётся разомкнутым.
+    """
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 8.0
+    jitter: float = 0.5
+    total_budget: float = 30.0
+    retry_statuses: frozenset = frozenset({502, 503, 504})
+    idempotent_methods: frozenset = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    breakers: dict = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    def breaker(self, url):
+        """
+        Circuit breaker хоста (общий для всех реквестеров с этой политикой).
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return host, self.breakers[host]
+
+    def reset(self):
+        """
+        Забывает состояние circuit breaker всех хостов (между тестами).
+        """
+        with self._lock:
+            self.breakers.clear()
+
+    def backoff(self, attempt):
+        """
+        Пауза перед повтором номер attempt (1 — первый повтор).
+        """
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def can_retry(self, method, error, idempotency_guard):
+        """
+        Неидемпотентный запрос (POST, PATCH) повторяется, только если он точно не ушёл на сервер
+        или idempotency_guard() подтверждает, что предыдущая попытка не применилась.
+        """
+        if method.upper() in self.idempotent_methods:
+            return True
+        if error is not None and _not_sent(error):
+            return True
+        return idempotency_guard is not None and idempotency_guard()
@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from custom_requester.metrics import add_connect_time
+
+
+class PooledSession(requests.Session):
+    """
+    HTTP-сессия, использующая общий пул соединений SharedTransport.
+    Заголовки и cookies у каждой сессии свои, а TCP/TLS соединения общие.
+    """
+
+    def __init__(self, transport):
+        super().__init__()
+        self.transport = transport
+        self.mount("http://", transport.adapter)
+        self.mount("https://", transport.adapter)
+        if not transport.keep_alive:
+            self.headers["Connection"] = "close"
+
+    def close(self):
+        """
+        Закрывает только собственные адаптеры сессии: общий пул закрывается через SharedTransport.close().
+        """
+        for adapter in self.adapters.values():
+            if adapter is not self.transport.adapter:
+                adapter.close()
+
+
+class _ConnectionCounter:
+    """
+    Потокобезопасные счётчики запросов и установленных соединений по хостам.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)
+        self.connects = defaultdict(int)
+
+    def add(self, counter, host):
+        with self._lock:
+            counter[host] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                host: {
+                    "requests": self.requests[host],
+                    "hits": max(self.requests[host] - self.connects[host], 0),
+                    "misses": self.connects[host]
+                }
+                for host in self.requests.keys() | self.connects.keys()
+            }
+
+
+def _counting_pool_classes(counter):
+    """
+    Классы пулов urllib3, соединения которых сообщают о каждом connect() и каждом запросе.
+    """
+    def counting(connection_cls, scheme):
+        class CountingConnection(connection_cls):
+            def connect(self):
+                counter.add(counter.connects, f"{scheme}://{self.host}:{self.port}")
+                start = time.perf_counter()
+                try:
+                    return super().connect()
+                finally:
+                    add_connect_time(time.perf_counter() - start)
+
+            def request(self, *args, **kwargs):
+                counter.add(counter.requests, f"{scheme}://{self.host}:{self.port}")
+                return super().request(*args, **kwargs)
+
+        return CountingConnection
+
+    class CountingHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = counting(HTTPConnection, "http")
+
+    class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = counting(HTTPSConnection, "https")
+
+    return {"http": CountingHTTPConnectionPool, "https": CountingHTTPSConnectionPool}
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    def __init__(self, counter, **kwargs):
+        self.counter = counter
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _counting_pool_classes(self.counter)
+
+
+class SharedTransport:
+    """
+    Общий настраиваемый пул соединений для нескольких ApiManager.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=20, max_retries=0, backoff_factor=0,
+                 pool_block=False, keep_alive=True):
+        """
+        :param pool_connections: Количество хостов, для которых хранятся пулы соединений.
+        :param pool_maxsize: Максимум соединений на один хост.
+        :param max_retries: Количество повторов на уровне HTTP-адаптера (ошибки соединения).
+        :param backoff_factor: Множитель паузы между повторами.
+        :param pool_block: Ждать освобождения соединения вместо открытия лишнего.
+        :param keep_alive: Переиспользовать соединения между запросами.
+        """
+        self.keep_alive = keep_alive
+        self._counter = _ConnectionCounter()
+        self.adapter = _CountingHTTPAdapter(
+            self._counter,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=max_retries, backoff_factor=backoff_factor),
+            pool_block=pool_block
+        )
+
+    def new_session(self):
+        """
+        Создаёт новую сессию с собственными заголовками поверх общего пула.
+        """
+        return PooledSession(self)
+
+    def stats(self):
+        """
+        Статистика переиспользования соединений по хостам.
+        misses — сколько раз открывалось новое соединение (TCP+TLS handshake),
+        hits — сколько запросов ушло по уже открытому соединению.
+        """
+        return self._counter.snapshot()
+
+    def close(self):
+        self.adapter.close()
@@ -0,0 +1,189 @@
+"""
+Массовое создание и удаление тестовых данных в БД через SQLAlchemy core.
+
+Строки вставляются через insert() с executemany (по chunk_size строк за запрос) или, на PostgreSQL с psycopg2,
+через COPY FROM STDIN. Если первичного ключа в строках нет (целые id жанров и фильмов назначает БД),
+используется INSERT ... RETURNING. Первичные ключи созданных строк запоминаются, и при cleanup()
+каждая таблица очищается одним DELETE ... WHERE id IN (...).
+"""
+import csv
+import datetime
+import io
+from collections import defaultdict
+
+from sqlalchemy import delete, insert
+
+from db_requester.models import AccountTransactionTemplate, GenreDBModel, MovieDBModel, UserDBModel
+from utils.data_generator import DataGenerator
+
+# Значение NULL в COPY: отличается от пустой строки
+COPY_NULL = r"\N"
+
+
+class BulkLoader:
+    """
+    Загрузчик тестовых данных, который помнит, что создал.
+    Используется как контекстный менеджер: при выходе созданные строки удаляются.
+    """
+
+    def __init__(self, engine, chunk_size=1000, use_copy=None):
+        """
+        :param engine: Engine SQLAlchemy.
+        :param chunk_size: Сколько строк отправлять одним запросом (и сколько ключей в одном DELETE).
+        :param use_copy: Использовать COPY (None — автоматически, если это PostgreSQL с psycopg2).
+        """
+        self.engine = engine
+        self.chunk_size = chunk_size
+        if use_copy is None:
+            use_copy = engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg2"
+        self.use_copy = use_copy
+        self.created = defaultdict(list)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cleanup()
+
+    def insert(self, model, rows):
+        """
+        Вставляет строки и запоминает их первичные ключи.
+        :param model: ORM-модель или Table.
+        :param rows: Список словарей {колонка: значение}; у всех строк одинаковый набор колонок.
+            Если первичного ключа в строках нет, его назначает БД и он дописывается в каждую строку.
+        :return: Список первичных ключей вставленных строк.
+        """
+        table = getattr(model, "__table__", model)
+        if not rows:
+            return []
+        primary_key = self._primary_key(table)
+        generated = primary_key.name not in rows[0]
+        with self.engine.begin() as connection:
+            for start in range(0, len(rows), self.chunk_size):
+                chunk = rows[start:start + self.chunk_size]
+                if generated:
+                    # COPY не возвращает ключи, поэтому здесь всегда executemany с RETURNING
+                    statement = insert(table).returning(primary_key, sort_by_parameter_order=True)
+                    for row, key in zip(chunk, connection.execute(statement, chunk).scalars()):
+                        row[primary_key.name] = key
+                elif self.use_copy:
+                    self._copy(connection, table, chunk)
+                else:
+                    connection.execute(insert(table), chunk)
+        keys = [row[primary_key.name] for row in rows]
+        self.created[table].extend(keys)
+        return keys
+
+    def cleanup(self):
+        """
+        Удаляет всё созданное: по одному DELETE на таблицу (на chunk_size ключей),
+        таблицы — в порядке, обратном созданию.
+        """
+        with self.engine.begin() as connection:
+            for table in reversed(list(self.created)):
+                keys = self.created[table]
+                primary_key = self._primary_key(table)
+                for start in range(0, len(keys), self.chunk_size):
+                    connection.execute(delete(table).where(primary_key.in_(keys[start:start + self.chunk_size])))
+        self.created.clear()
+
+    @staticmethod
+    def _primary_key(table):
+        columns = list(table.primary_key.columns)
+        if len(columns) != 1:
+            raise ValueError(f"Таблица {table.name}: поддерживается только простой первичный ключ")
+        return columns[0]
+
+    @staticmethod
+    def _copy(connection, table, rows):
+        columns = list(rows[0])
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([_copy_value(row[column]) for column in columns])
+        buffer.seek(0)
+
+        quoted = ", ".join(connection.dialect.identifier_preparer.quote(column) for column in columns)
+        table_name = connection.dialect.identifier_preparer.format_table(table)
+        cursor = connection.connection.driver_connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table_name} ({quoted}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')", buffer)
+        finally:
+            cursor.close()
+
+    # Генераторы строк
+
+    def users(self, count, **overrides):
+        """
+        Создаёт count пользователей. overrides переопределяет значения колонок, например verified=True.
+        """
+        now = datetime.datetime.now()
+        rows = [
+            {
+                "id": DataGenerator.generate_random_id(),
+                "email": user["email"],
+                "full_name": user["fullName"],
+                "password": user["password"],
+                "created_at": now,
+                "updated_at": now,
+                "verified": False,
+                "banned": False,
+                "roles": "{USER}",
+                **overrides
+            }
+            for user in DataGenerator.generate_users(count)
+        ]
+        self.insert(UserDBModel, rows)
+        return rows
+
+    def genres(self, count):
+        """
+        Создаёт count жанров, id назначает БД.
+        """
+        rows = [{"name": f"genre {DataGenerator.generate_random_id()}"} for _ in range(count)]
+        self.insert(GenreDBModel, rows)
+        return rows
+
+    def movies(self, count, genre_id, **overrides):
+        """
+        Создаёт count фильмов жанра genre_id, id назначает БД.
+        """
+        now = datetime.datetime.now()
+        rows = [
+            {
+                "name": movie["name"],
+                "description": movie["description"],
+                "price": movie["price"],
+                "genre_id": genre_id,
+                "image_url": None,
+                "location": movie["location"],
+                "rating": 0,
+                "published": True,
+                "created_at": now,
+                **overrides
+            }
+            for movie in DataGenerator.generate_movies(count)
+        ]
+        self.insert(MovieDBModel, rows)
+        return rows
+
+    def accounts(self, count, balance=1000, prefix="account"):
+        """
+        Создаёт count счетов с одинаковым начальным балансом.
+        """
+        rows = [
+            {"user": f"{prefix}_{DataGenerator.generate_random_id()}", "balance": balance}
+            for _ in range(count)
+        ]
+        self.insert(AccountTransactionTemplate, rows)
+        return rows
+
+
+def _copy_value(value):
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
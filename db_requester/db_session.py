@@ -0,0 +1,65 @@
+"""
+Подключение тестов к БД: общий пул соединений и сессии, изолированные откатом транзакции.
+"""
+import os
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+
+def database_url():
+    """
+    URL базы из переменных окружения DB_USER, PASSWORD, HOST, PORT, DATABASE_NAME.
+    """
+    return (f"postgresql+psycopg2://{os.getenv('DB_USER')}:{os.getenv('PASSWORD')}"
+            f"@{os.getenv('HOST')}:{os.getenv('PORT')}/{os.getenv('DATABASE_NAME')}")
+
+
+def create_db_engine(url=None, pool_size=None, max_overflow=None):
+    """
+    Создаёт engine с пулом соединений, общий для всех тестов процесса (под xdist — у каждого воркера свой).
+    :param url: URL базы (по умолчанию database_url()).
+    :param pool_size: Число постоянных соединений (по умолчанию DB_POOL_SIZE или 5).
+    :param max_overflow: Сколько соединений можно открыть сверх пула (по умолчанию DB_MAX_OVERFLOW или 10).
+    """
+    url = url or database_url()
+    if url.startswith("sqlite"):
+        engine = create_engine(url)
+        _enable_sqlite_savepoints(engine)
+        return engine
+    return create_engine(
+        url,
+        pool_size=int(pool_size if pool_size is not None else os.getenv("DB_POOL_SIZE", 5)),
+        max_overflow=int(max_overflow if max_overflow is not None else os.getenv("DB_MAX_OVERFLOW", 10)),
+        pool_pre_ping=True
+    )
+
+
+@contextmanager
+def rollback_session(engine):
+    """
+    Сессия внутри внешней транзакции, которая в конце откатывается.
+    session.commit() в тесте фиксирует только SAVEPOINT, а session.rollback() откатывает к нему:
+    в базу ничего не записывается, и после теста (даже упавшего) не остаётся данных.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+def _enable_sqlite_savepoints(engine):
+    # pysqlite сам управляет BEGIN и ломает SAVEPOINT: передаём управление транзакциями SQLAlchemy
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(connection):
+        connection.exec_driver_sql("BEGIN")
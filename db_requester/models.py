@@ -17,6 +17,16 @@ class UserDBModel(Base):
     roles = Column(String)
 
 
+class GenreDBModel(Base):
+    """
+    Модель для таблицы genres.
+    """
+    __tablename__ = 'genres'
+
+    id = Column(Integer, primary_key=True)  # Уникальный идентификатор жанра (назначает БД)
+    name = Column(String, nullable=False)  # Название жанра
+
+
 class MovieDBModel(Base):
     """
     Модель для таблицы movies.
@@ -24,11 +34,11 @@ class MovieDBModel(Base):
     __tablename__ = 'movies'  # Имя таблицы в базе данных
 
     # Поля таблицы
-    id = Column(String, primary_key=True)  # Уникальный идентификатор фильма
+    id = Column(Integer, primary_key=True)  # Уникальный идентификатор фильма (назначает БД)
     name = Column(String, nullable=False)  # Название фильма
     description = Column(String)  # Описание фильма
     price = Column(Integer, nullable=False)  # Цена фильма
-    genre_id = Column(String, ForeignKey('genres.id'), nullable=False)  # Ссылка на жанр
+    genre_id = Column(Integer, ForeignKey('genres.id'), nullable=False)  # Ссылка на жанр
     image_url = Column(String)  # Ссылка на изображение
     location = Column(String)  # Локация фильма (например, "MSK")
     rating = Column(Integer)  # Рейтинг фильма
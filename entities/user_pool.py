@@ -0,0 +1,146 @@
+import queue
+from contextlib import contextmanager
+
+from constants import Roles
+from custom_requester.batch import run_batch
+from entities.user import User
+from utils.data_generator import DataGenerator
+
+
+class UserPool:
+    """
+    Пул заранее созданных и авторизованных пользователей.
+    Пользователи создаются один раз на сессию, выдаются тестам в аренду (lease/release)
+    и удаляются одним пакетом в конце сессии.
+    """
+
+    def __init__(self, admin: User, api_factory, size_per_role: int = 2, roles=(Roles.USER,),
+                 concurrency: int = 8, lease_timeout: float = 60, reset_on_release: bool = True):
+        """
+        :param admin: Пользователь с правами на создание/изменение/удаление пользователей.
+        :param api_factory: Функция, создающая новый ApiManager (со своей сессией) для пользователя пула.
+        :param size_per_role: Количество пользователей каждой роли.
+        :param roles: Роли, для которых создаются пользователи.
+        :param concurrency: Количество одновременных запросов при создании и удалении.
+        :param lease_timeout: Сколько секунд ждать свободного пользователя.
+        :param reset_on_release: Восстанавливать verified/banned/roles пользователя после теста
+            (только у помеченных через mark_changed: остальные возвращаются в пул без запроса).
+        """
+        self.admin = admin
+        self.api_factory = api_factory
+        self.size_per_role = size_per_role
+        self.roles = roles
+        self.concurrency = concurrency
+        self.lease_timeout = lease_timeout
+        self.reset_on_release = reset_on_release
+        self.users = []
+        self._user_ids = {}
+        self._headers = {}
+        self._changed = set()
+        self._available = {role: queue.Queue() for role in roles}
+
+    def provision(self):
+        """
+        Параллельно создаёт и авторизует пользователей для всех ролей пула.
+        """
+        users_data = [self._generate_user_data(role) for role in self.roles for _ in range(self.size_per_role)]
+        created = run_batch(self.admin.api.user_api.create_user, users_data, concurrency=self.concurrency)
+        failed = [result.error for result in created if not result.ok]
+        if failed:
+            raise RuntimeError(f"Не удалось создать пользователей пула: {failed}")
+
+        def _login(result):
+            user_data = result.item
+            user = User(user_data["email"], user_data["password"], user_data["roles"], self.api_factory())
+            user.api.auth_api.authenticate(user.creds)
+            return user
+
+        logged_in = run_batch(_login, created, concurrency=self.concurrency)
+        for result, login_result in zip(created, logged_in):
+            if not login_result.ok:
+                raise RuntimeError(f"Не удалось авторизовать пользователя пула: {login_result.error}")
+            user = login_result.response
+            self.users.append(user)
+            self._user_ids[user.email] = result.response.json()["id"]
+            self._headers[user.email] = self._snapshot_headers(user)
+            self._available[Roles(user.roles[0])].put(user)
+        return self
+
+    def lease(self, role=Roles.USER) -> User:
+        """
+        Выдаёт свободного пользователя с указанной ролью.
+        """
+        try:
+            return self._available[role].get(timeout=self.lease_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Нет свободных пользователей с ролью {role.value} за {self.lease_timeout} секунд")
+
+    def mark_changed(self, user: User):
+        """
+        Помечает, что тест изменил verified/banned/roles пользователя: при возврате в пул они восстанавливаются.
+        """
+        self._changed.add(user.email)
+
+    def release(self, user: User):
+        """
+        Возвращает пользователя в пул, предварительно сбросив его состояние.
+        """
+        self._reset(user)
+        self._available[Roles(user.roles[0])].put(user)
+
+    @contextmanager
+    def leased(self, role=Roles.USER):
+        user = self.lease(role)
+        try:
+            yield user
+        finally:
+            self.release(user)
+
+    def teardown(self):
+        """
+        Удаляет всех пользователей пула одним пакетом и закрывает их сессии.
+        :raises RuntimeError: Если кого-то удалить не удалось (после закрытия сессий).
+        """
+        deleted = run_batch(self.admin.api.user_api.delete_user, list(self._user_ids.values()),
+                            concurrency=self.concurrency)
+        for user in self.users:
+            user.api.close_session()
+        self.users.clear()
+        self._user_ids.clear()
+        failed = [f"{result.item}: {result.error}" for result in deleted if not result.ok]
+        if failed:
+            raise RuntimeError(f"Не удалось удалить пользователей пула: {failed}")
+
+    @staticmethod
+    def _apis(user: User):
+        return user.api.auth_api, user.api.user_api, user.api.movies_api
+
+    def _snapshot_headers(self, user: User):
+        return dict(user.api.session.headers), [dict(api.headers) for api in self._apis(user)]
+
+    def _reset(self, user: User):
+        # Возвращаем заголовки сессии и API-классов к состоянию сразу после авторизации
+        session_headers, api_headers = self._headers[user.email]
+        user.api.session.headers.clear()
+        user.api.session.headers.update(session_headers)
+        for api, headers in zip(self._apis(user), api_headers):
+            api.headers = dict(headers)
+        if self.reset_on_release and user.email in self._changed:
+            self._changed.discard(user.email)
+            self.admin.api.user_api.update_user(
+                self._user_ids[user.email],
+                {"verified": True, "banned": False, "roles": user.roles}
+            )
+
+    @staticmethod
+    def _generate_user_data(role):
+        password = DataGenerator.generate_random_password()
+        return {
+            "email": DataGenerator.generate_random_email(),
+            "fullName": DataGenerator.generate_random_name(),
+            "password": password,
+            "passwordRepeat": password,
+            "roles": [role.value],
+            "verified": True,
+            "banned": False
+        }
@@ -0,0 +1,65 @@
+"""
+Нагрузочный прогон через те же API-классы, что и функциональные тесты.
+
+Пример:
+    python -m load_testing --users 20 --ramp-up 5 --duration 60 --rps 200 \
+        --weights get_movies=5,get_movie_by_id=3,login=1,create_movie=1
+"""
+import argparse
+import json
+
+from load_testing.runner import LoadConfig, run_load
+from load_testing.scenarios import SCENARIOS
+from resources.user_creds import SuperAdminCreds
+
+
+def parse_weights(value):
+    weights = {}
+    for pair in value.split(","):
+        name, _, weight = pair.partition("=")
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон сценариев Cinescope")
+    parser.add_argument("--users", type=int, default=10, help="Количество виртуальных пользователей")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Время разгона в секундах")
+    parser.add_argument("--duration", type=float, default=30, help="Длительность прогона в секундах")
+    parser.add_argument("--rps", type=float, default=None, help="Целевая интенсивность запросов в секунду")
+    parser.add_argument("--weights", type=parse_weights, default=None,
+                        help=f"Веса сценариев, например get_movies=5,login=1. Доступны: {', '.join(SCENARIOS)}")
+    parser.add_argument("--email", default=SuperAdminCreds.USERNAME, help="Логин (по умолчанию супер-админ)")
+    parser.add_argument("--password", default=SuperAdminCreds.PASSWORD, help="Пароль")
+    parser.add_argument("--auth-url", default=None, help="Базовый URL сервиса авторизации")
+    parser.add_argument("--api-url", default=None, help="Базовый URL сервиса фильмов")
+    parser.add_argument("--no-cleanup", action="store_true", help="Не удалять созданные фильмы")
+    parser.add_argument("--seed", type=int, default=None, help="Зерно для воспроизводимого выбора сценариев")
+    parser.add_argument("--json", dest="json_path", default=None, help="Сохранить сводку в JSON-файл")
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(
+        users=args.users,
+        ramp_up=args.ramp_up,
+        duration=args.duration,
+        target_rps=args.rps,
+        email=args.email,
+        password=args.password,
+        auth_url=args.auth_url,
+        api_url=args.api_url,
+        cleanup=not args.no_cleanup,
+        seed=args.seed
+    )
+    if args.weights:
+        config.weights = args.weights
+
+    stats = run_load(config)
+    print(stats.report())
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as file:
+            json.dump({"duration": stats.duration, "endpoints": stats.summary()}, file, indent=4)
+    return stats
+
+
+if __name__ == "__main__":
+    main()
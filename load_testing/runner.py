@@ -0,0 +1,157 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from api.api_manager import ApiManager
+from custom_requester.custom_requester import CustomRequester
+from custom_requester.transport import SharedTransport
+from load_testing.scenarios import SCENARIOS
+from load_testing.stats import LoadStats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LoadConfig:
+    """
+    Параметры нагрузочного прогона.
+    :param users: Количество виртуальных пользователей (потоков).
+    :param ramp_up: За сколько секунд равномерно запускаются все пользователи.
+    :param duration: Длительность прогона в секундах (включая ramp-up).
+    :param target_rps: Целевая суммарная интенсивность запросов (None — без ограничения).
+    :param weights: Веса сценариев {имя сценария: вес}.
+    :param email: Логин пользователя, от имени которого идёт нагрузка.
+    :param password: Пароль пользователя.
+    :param auth_url: Базовый URL сервиса авторизации (None — из API-классов).
+    :param api_url: Базовый URL сервиса фильмов (None — из API-классов).
+    :param cleanup: Удалять созданные за прогон фильмы.
+    :param seed: Зерно генератора случайных чисел для воспроизводимого выбора сценариев.
+    """
+    users: int = 10
+    ramp_up: float = 0.0
+    duration: float = 30.0
+    target_rps: Optional[float] = None
+    weights: dict = field(default_factory=lambda: {name: scenario.weight for name, scenario in SCENARIOS.items()})
+    email: str = None
+    password: str = None
+    auth_url: Optional[str] = None
+    api_url: Optional[str] = None
+    cleanup: bool = True
+    seed: Optional[int] = None
+
+
+class RateLimiter:
+    """
+    Общий для всех потоков ограничитель интенсивности: каждому запросу выдаётся свой временной слот.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1 / rate
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class VirtualUser:
+    """
+    Виртуальный пользователь: собственный ApiManager поверх общего пула соединений.
+    """
+
+    def __init__(self, api: ApiManager, creds, rng):
+        self.api = api
+        self.creds = creds
+        self.rng = rng
+        self.known_movie_ids = deque(maxlen=100)
+        self.created_movie_ids = []
+
+
+def make_api(transport, config: LoadConfig):
+    api = ApiManager(transport.new_session())
+    if config.auth_url:
+        api.auth_api.base_url = config.auth_url
+        api.user_api.base_url = config.auth_url
+    if config.api_url:
+        api.movies_api.base_url = config.api_url
+    return api
+
+
+def run_load(config: LoadConfig) -> LoadStats:
+    """
+    Запускает нагрузку по сценариям с весами и возвращает собранную статистику.
+    """
+    names = [name for name, weight in config.weights.items() if weight > 0]
+    unknown = set(names) - SCENARIOS.keys()
+    if unknown:
+        raise ValueError(f"Неизвестные сценарии: {', '.join(sorted(unknown))}")
+    weights = [config.weights[name] for name in names]
+
+    # Логирование каждого запроса под нагрузкой только искажает результаты,
+    # а повторы скрывают ошибки, которые нагрузочный прогон как раз должен показать
+    log_level, retry_policy = CustomRequester.log_level, CustomRequester.retry_policy
+    CustomRequester.log_level, CustomRequester.retry_policy = logging.WARNING, None
+    try:
+        return _run_users(config, names, weights)
+    finally:
+        CustomRequester.log_level, CustomRequester.retry_policy = log_level, retry_policy
+        logging.getLogger(CustomRequester.__module__).setLevel(log_level)
+
+
+def _run_users(config: LoadConfig, names, weights) -> LoadStats:
+    transport = SharedTransport(pool_maxsize=max(config.users, 10))
+    stats = LoadStats()
+    limiter = RateLimiter(config.target_rps) if config.target_rps else None
+    seed_rng = random.Random(config.seed)
+    users = [
+        VirtualUser(make_api(transport, config), (config.email, config.password), random.Random(seed_rng.random()))
+        for _ in range(config.users)
+    ]
+
+    started_at = time.monotonic()
+    stop_at = started_at + config.duration
+
+    def _run_user(index, user):
+        time.sleep(config.ramp_up * index / config.users)
+        try:
+            user.api.auth_api.authenticate(user.creds)
+        except Exception as e:
+            logger.error(f"Виртуальный пользователь {index} не смог авторизоваться: {e}")
+            return
+        while time.monotonic() < stop_at:
+            if limiter:
+                limiter.wait()
+            # Пока у пользователя нет id фильмов, GET /movies/{id} заменяется своим fallback (GET /movies)
+            scenario = SCENARIOS[user.rng.choices(names, weights)[0]].resolve(SCENARIOS, user)
+            start = time.perf_counter()
+            try:
+                label = scenario.run(user)
+                ok = True
+            except Exception:
+                label, ok = scenario.label, False
+            stats.record(label, time.perf_counter() - start, ok)
+
+    threads = [threading.Thread(target=_run_user, args=(index, user), daemon=True) for index, user in enumerate(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats.duration = time.monotonic() - started_at
+
+    if config.cleanup:
+        created = [movie_id for user in users for movie_id in user.created_movie_ids]
+        if created:
+            users[0].api.movies_api.delete_movies(created, concurrency=min(config.users, 16))
+    for user in users:
+        user.api.close_session()
+    transport.close()
+    return stats
@@ -0,0 +1,72 @@
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from utils.data_generator import DataGenerator
+
+
+@dataclass
+class Scenario:
+    """
+    Один сценарий нагрузки.
+    :param label: Имя эндпоинта в отчёте.
+    :param weight: Вес по умолчанию при случайном выборе сценария.
+    :param run: Функция run(user), выполняющая запрос; возвращает имя фактически вызванного эндпоинта.
+    :param ready: Функция ready(user): есть ли у пользователя данные для сценария (None — есть всегда).
+    :param fallback: Сценарий, который выполняется вместо этого, пока ready(user) ложно;
+        его запросы и ошибки попадают в отчёт под его собственным эндпоинтом.
+    """
+    label: str
+    weight: float
+    run: Callable
+    ready: Optional[Callable] = None
+    fallback: Optional[str] = None
+
+    def resolve(self, scenarios, user):
+        """
+        :return: Сценарий, который нужно выполнить для пользователя: этот или его fallback.
+        """
+        if self.ready is None or self.ready(user):
+            return self
+        return scenarios[self.fallback].resolve(scenarios, user)
+
+
+def login(user):
+    user.api.auth_api.login_user({"email": user.creds[0], "password": user.creds[1]})
+    return "POST /login"
+
+
+def get_movies(user):
+    response = user.api.movies_api.get_movies(params={"page": user.rng.randint(1, 3)})
+    user.known_movie_ids.extend(movie["id"] for movie in response.json().get("movies", [])[:5])
+    return "GET /movies"
+
+
+def get_movie_by_id(user):
+    user.api.movies_api.get_movie_by_id(user.rng.choice(user.known_movie_ids))
+    return "GET /movies/{id}"
+
+
+def create_movie(user):
+    response = user.api.movies_api.create_movie({
+        "name": f"Load test {uuid.uuid4().hex}",
+        "imageUrl": "https://example.com/poster.png",
+        "price": DataGenerator.generate_random_price(),
+        "description": "Фильм, созданный нагрузочным тестом",
+        "location": DataGenerator.generate_random_location(),
+        "published": True,
+        "genreId": 1
+    })
+    movie_id = response.json()["id"]
+    user.created_movie_ids.append(movie_id)
+    user.known_movie_ids.append(movie_id)
+    return "POST /movies"
+
+
+SCENARIOS = {
+    "login": Scenario("POST /login", 1, login),
+    "get_movies": Scenario("GET /movies", 5, get_movies),
+    "get_movie_by_id": Scenario("GET /movies/{id}", 3, get_movie_by_id,
+                                ready=lambda user: bool(user.known_movie_ids), fallback="get_movies"),
+    "create_movie": Scenario("POST /movies", 1, create_movie),
+}
@@ -0,0 +1,67 @@
+import math
+import threading
+from collections import defaultdict
+
+
+def percentile(sorted_values, percent):
+    """
+    Перцентиль по методу ближайшего ранга для уже отсортированного списка.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LoadStats:
+    """
+    Потокобезопасная статистика нагрузочного прогона по эндпоинтам.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.duration = 0.0
+
+    def record(self, endpoint, latency, ok):
+        with self._lock:
+            self.latencies[endpoint].append(latency)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def summary(self):
+        """
+        :return: {endpoint: {requests, errors, error_rate, rps, p50, p95, p99}}, латентности в мс.
+        """
+        with self._lock:
+            result = {}
+            for endpoint, values in sorted(self.latencies.items()):
+                values = sorted(values)
+                result[endpoint] = {
+                    "requests": len(values),
+                    "errors": self.errors[endpoint],
+                    "error_rate": self.errors[endpoint] / len(values),
+                    "rps": len(values) / self.duration if self.duration else 0.0,
+                    "p50": percentile(values, 50) * 1000,
+                    "p95": percentile(values, 95) * 1000,
+                    "p99": percentile(values, 99) * 1000
+                }
+            return result
+
+    def report(self):
+        lines = [
+            f"{'endpoint':<24}{'requests':>10}{'errors':>8}{'err %':>8}{'rps':>10}"
+            f"{'p50, ms':>10}{'p95, ms':>10}{'p99, ms':>10}"
+        ]
+        total_requests = total_errors = 0
+        for endpoint, row in self.summary().items():
+            total_requests += row["requests"]
+            total_errors += row["errors"]
+            lines.append(
+                f"{endpoint:<24}{row['requests']:>10}{row['errors']:>8}{row['error_rate'] * 100:>8.2f}"
+                f"{row['rps']:>10.1f}{row['p50']:>10.2f}{row['p95']:>10.2f}{row['p99']:>10.2f}"
+            )
+        throughput = total_requests / self.duration if self.duration else 0.0
+        lines.append(f"Итого: {total_requests} запросов, {total_errors} ошибок, {throughput:.1f} rps за {self.duration:.1f} с")
+        return "\n".join(lines)
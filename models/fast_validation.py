@@ -0,0 +1,78 @@
+"""
+Быстрая валидация ответов API.
+
+- model_validate_json прямо из байтов ответа, без промежуточного response.json();
+- TypeAdapter и модели страниц создаются один раз и кэшируются;
+- режим выборочной валидации для нагрузочных прогонов: проверяется и возвращается
+  только каждый N-й элемент страницы.
+"""
+import json
+import os
+from functools import lru_cache
+
+from pydantic import TypeAdapter, create_model
+
+# Проверять каждый N-й элемент страницы (1 — проверять все)
+SAMPLE_EVERY = int(os.getenv("VALIDATION_SAMPLE_EVERY", 1))
+
+
+def _content(response):
+    return response.content if hasattr(response, "content") else response
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model):
+    """
+    Закэшированный TypeAdapter для списка моделей.
+    """
+    return TypeAdapter(list[model])
+
+
+@lru_cache(maxsize=None)
+def page_model(model, items_key):
+    """
+    Закэшированная модель страницы вида {items_key: [model, ...], ...}.
+    Остальные поля страницы (count, page, pageCount) игнорируются.
+    """
+    return create_model(f"{model.__name__}Page", **{items_key: (list[model], ...)})
+
+
+def validate_response(model, response):
+    """
+    Валидирует тело ответа (requests.Response или bytes) одной моделью.
+    """
+    return model.model_validate_json(_content(response))
+
+
+def validate_list(model, response):
+    """
+    Валидирует тело ответа, которое является JSON-массивом моделей.
+    """
+    return list_adapter(model).validate_json(_content(response))
+
+
+def validate_page(model, response, items_key="movies", sample_every=None):
+    """
+    Валидирует элементы страницы ответа.
+    :param model: Модель одного элемента.
+    :param response: requests.Response или bytes.
+    :param items_key: Ключ списка элементов в теле ответа.
+    :param sample_every: Проверять каждый N-й элемент (по умолчанию VALIDATION_SAMPLE_EVERY).
+    :return: Список моделей; в режиме выборки — только проверенные элементы.
+    """
+    sample_every = sample_every or SAMPLE_EVERY
+    if sample_every <= 1:
+        return getattr(page_model(model, items_key).model_validate_json(_content(response)), items_key)
+
+    items = json.loads(_content(response))[items_key]
+    return validate_items(model, items, sample_every)
+
+
+def validate_items(model, items, sample_every=None):
+    """
+    Валидирует уже распарсенный список элементов одним вызовом TypeAdapter.
+    :param sample_every: Проверять каждый N-й элемент (по умолчанию VALIDATION_SAMPLE_EVERY).
+    :return: Список моделей; в режиме выборки — только проверенные элементы.
+    """
+    sample_every = sample_every or SAMPLE_EVERY
+    return list_adapter(model).validate_python(items[::sample_every] if sample_every > 1 else items)
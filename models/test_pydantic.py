@@ -84,3 +84,14 @@ class AuthResponse(BaseModel):
     user: LoginUserResponse
     accessToken: str
 
+class MovieResponse(BaseModel):
+    id: int
+    name: str
+    price: int
+    description: Optional[str] = None
+    imageUrl: Optional[str] = None
+    location: str
+    published: bool
+    genreId: int
+    rating: Optional[float] = None
+    createdAt: Optional[str] = None
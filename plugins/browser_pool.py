@@ -0,0 +1,101 @@
+"""
+Общий браузер и пул контекстов Playwright для UI-тестов.
+
+Каждый воркер запускает один headless-браузер при первом UI-тесте; контексты после теста
+очищаются и переиспользуются. В конце прогона печатается, сколько было запусков браузера,
+новых и переиспользованных контекстов (под xdist — сумма по воркерам).
+"""
+import json
+import uuid
+
+import pytest
+
+from common.Tools import Tools
+
+STATS_KEYS = ("launches", "contexts_created", "contexts_reused", "contexts_discarded")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("browser_pool", "Браузер для UI-тестов")
+    # Имена с префиксом ui-: --headed и фикстура playwright уже есть у плагина pytest-playwright
+    group.addoption("--ui-headed", action="store_true", default=False,
+                    help="Запускать браузер с окном (для локальной отладки)")
+    group.addoption("--browser-pool-size", type=int, default=2,
+                    help="Сколько очищенных контекстов держать для повторного использования (0 — не переиспользовать)")
+
+
+def pytest_configure(config):
+    workerinput = getattr(config, "workerinput", None)
+    config.browser_pool_run = workerinput["browser_pool_run"] if workerinput else uuid.uuid4().hex
+    config.browser_pool_stats = None
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["browser_pool_run"] = node.config.browser_pool_run
+
+
+@pytest.fixture(scope="session")
+def ui_playwright():
+    """
+    Запущенный Playwright; импортируется только когда UI-тесту нужен браузер.
+    """
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        yield playwright
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request, ui_playwright, network_interceptor):
+    """
+    Пул воркера: один браузер и очищаемые между тестами контексты.
+    В каждый новый контекст устанавливается перехват запросов (плагин network).
+    """
+    from common.browser_pool import BrowserPool
+
+    config = request.config
+    pool = BrowserPool(
+        lambda: ui_playwright.chromium.launch(headless=not config.getoption("--ui-headed")),
+        size=config.getoption("--browser-pool-size"),
+        setup=network_interceptor.install
+    )
+    yield pool
+    config.browser_pool_stats = pool.stats()
+    pool.close()
+
+
+def _worker_part_path(run_id, worker_id):
+    return Tools.files_dir("browser_pool", f"{run_id}-{worker_id}.json")
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None or config.browser_pool_stats is None:
+        return
+    _worker_part_path(config.browser_pool_run, workerinput["workerid"]).write_text(
+        json.dumps(config.browser_pool_stats), encoding="utf-8"
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+
+    totals = dict.fromkeys(STATS_KEYS, 0)
+    parts = [config.browser_pool_stats] if config.browser_pool_stats else []
+    for path in Tools.files_dir("browser_pool").glob(f"{config.browser_pool_run}-*.json"):
+        parts.append(json.loads(path.read_text(encoding="utf-8")))
+        path.unlink()
+    if not parts:
+        return
+    for stats in parts:
+        for key in STATS_KEYS:
+            totals[key] += stats.get(key, 0)
+
+    terminalreporter.write_sep("=", "Playwright browser pool")
+    terminalreporter.write_line(
+        f"запусков браузера: {totals['launches']}, контекстов создано: {totals['contexts_created']}, "
+        f"переиспользовано: {totals['contexts_reused']}, закрыто при возврате: {totals['contexts_discarded']}"
+    )
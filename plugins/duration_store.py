@@ -0,0 +1,251 @@
+"""
+Хранилище длительностей тестов между прогонами (SQLite).
+
+Плагин записывает время setup/call/teardown каждого теста и время setup каждой фикстуры,
+умеет запускать тесты от самых долгих к быстрым (--order-by-duration) и отдаёт историю
+плагину xdist_sharding для балансировки воркеров.
+
+Отчёт по последним прогонам: python -m plugins.duration_store --runs 5 --top 20
+"""
+import argparse
+import os
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+from common.Tools import Tools
+from plugins.xdist_sharding import SHARD_GROUP_SUFFIX
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS test_durations (
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fixture_durations (
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    fixture TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_test_durations_run ON test_durations (run_id);
+CREATE INDEX IF NOT EXISTS idx_fixture_durations_run ON fixture_durations (run_id);
+"""
+
+
+def default_db_path():
+    return Tools.files_dir("test_durations", "durations.sqlite3")
+
+
+class DurationStore:
+    """
+    Доступ к SQLite-базе длительностей.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(SCHEMA)
+
+    def _connect(self):
+        # Несколько воркеров xdist пишут в одну базу: ждём снятия блокировки
+        return sqlite3.connect(self.path, timeout=30)
+
+    def save_run(self, run_id, started_at, test_rows, fixture_rows, keep_runs=None):
+        """
+        :param test_rows: Список (nodeid, phase, duration, outcome).
+        :param fixture_rows: Список (nodeid, fixture, scope, duration).
+        :param keep_runs: Сколько последних прогонов хранить (None — все): более старые удаляются.
+        """
+        with self._connect() as connection:
+            connection.execute("INSERT OR IGNORE INTO runs (id, started_at) VALUES (?, ?)", (run_id, started_at))
+            connection.executemany(
+                "INSERT INTO test_durations (run_id, nodeid, phase, duration, outcome) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in test_rows]
+            )
+            connection.executemany(
+                "INSERT INTO fixture_durations (run_id, nodeid, fixture, scope, duration) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in fixture_rows]
+            )
+            if keep_runs is not None:
+                self._prune(connection, keep_runs)
+
+    @staticmethod
+    def _prune(connection, keep_runs):
+        stale = "SELECT id FROM runs ORDER BY started_at DESC LIMIT -1 OFFSET ?"
+        for table in ("test_durations", "fixture_durations"):
+            connection.execute(f"DELETE FROM {table} WHERE run_id IN ({stale})", (keep_runs,))
+        connection.execute(f"DELETE FROM runs WHERE id IN ({stale})", (keep_runs,))
+
+    def _last_runs_clause(self):
+        return "run_id IN (SELECT id FROM runs ORDER BY started_at DESC LIMIT ?)"
+
+    def average_test_durations(self, runs=5):
+        """
+        Средняя полная длительность (setup + call + teardown) теста за последние runs прогонов.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT nodeid, SUM(duration) / COUNT(DISTINCT run_id)
+                FROM test_durations
+                WHERE {self._last_runs_clause()}
+                GROUP BY nodeid
+                """,
+                (runs,)
+            ).fetchall()
+        return dict(rows)
+
+    def top_tests(self, runs=5, limit=20):
+        """
+        Самые долгие тесты: (nodeid, setup, call, teardown, total) — средние значения за прогон.
+        """
+        with self._connect() as connection:
+            return connection.execute(
+                f"""
+                SELECT nodeid,
+                       SUM(CASE WHEN phase = 'setup' THEN duration ELSE 0 END) / COUNT(DISTINCT run_id),
+                       SUM(CASE WHEN phase = 'call' THEN duration ELSE 0 END) / COUNT(DISTINCT run_id),
+                       SUM(CASE WHEN phase = 'teardown' THEN duration ELSE 0 END) / COUNT(DISTINCT run_id),
+                       SUM(duration) / COUNT(DISTINCT run_id) AS total
+                FROM test_durations
+                WHERE {self._last_runs_clause()}
+                GROUP BY nodeid
+                ORDER BY total DESC
+                LIMIT ?
+                """,
+                (runs, limit)
+            ).fetchall()
+
+    def top_fixtures(self, runs=5, limit=20):
+        """
+        Самые дорогие фикстуры: (fixture, scope, setups, total, average) — суммарно за прогоны.
+        """
+        with self._connect() as connection:
+            return connection.execute(
+                f"""
+                SELECT fixture, scope, COUNT(*), SUM(duration) AS total, AVG(duration)
+                FROM fixture_durations
+                WHERE {self._last_runs_clause()}
+                GROUP BY fixture, scope
+                ORDER BY total DESC
+                LIMIT ?
+                """,
+                (runs, limit)
+            ).fetchall()
+
+
+class DurationRecorder:
+    """
+    Собирает длительности в памяти процесса и сохраняет их одной транзакцией в конце сессии.
+    """
+
+    def __init__(self, store, run_id, record_tests, keep_runs=None):
+        self.store = store
+        self.run_id = run_id
+        self.record_tests = record_tests
+        self.keep_runs = keep_runs
+        self.started_at = time.time()
+        self.test_rows = []
+        self.fixture_rows = []
+        self.current_nodeid = ""
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        self.current_nodeid = item.nodeid
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        start = time.perf_counter()
+        yield
+        self.fixture_rows.append(
+            (self.current_nodeid, fixturedef.argname, fixturedef.scope, time.perf_counter() - start)
+        )
+
+    def pytest_runtest_logreport(self, report):
+        if self.record_tests:
+            nodeid = SHARD_GROUP_SUFFIX.sub("", report.nodeid)
+            self.test_rows.append((nodeid, report.when, report.duration, report.outcome))
+
+    def pytest_sessionfinish(self, session):
+        self.store.save_run(self.run_id, self.started_at, self.test_rows, self.fixture_rows, self.keep_runs)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("duration_store", "История длительностей тестов")
+    group.addoption("--durations-db", default=None, help="Путь к SQLite-базе длительностей")
+    group.addoption("--no-record-durations", action="store_true", default=False,
+                    help="Не записывать длительности текущего прогона")
+    group.addoption("--order-by-duration", action="store_true", default=False,
+                    help="Запускать тесты от самых долгих к самым быстрым по истории")
+    group.addoption("--durations-history", type=int, default=5,
+                    help="Сколько последних прогонов учитывать при сортировке и балансировке; "
+                         "более старые удаляются из базы")
+
+
+def pytest_configure(config):
+    store = DurationStore(config.getoption("--durations-db") or default_db_path())
+    config.duration_store = store
+    if config.getoption("--no-record-durations"):
+        return
+
+    keep_runs = config.getoption("--durations-history")
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        # Воркер xdist: отчёты о тестах пишет контроллер, воркер пишет только фикстуры
+        recorder = DurationRecorder(store, workerinput["duration_run_id"], record_tests=False, keep_runs=keep_runs)
+    else:
+        recorder = DurationRecorder(store, uuid.uuid4().hex, record_tests=True, keep_runs=keep_runs)
+    config.pluginmanager.register(recorder, "duration_recorder")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    recorder = node.config.pluginmanager.get_plugin("duration_recorder")
+    node.workerinput["duration_run_id"] = recorder.run_id if recorder else uuid.uuid4().hex
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--order-by-duration"):
+        return
+    durations = config.duration_store.average_test_durations(config.getoption("--durations-history"))
+    items.sort(key=lambda item: durations.get(item.nodeid, 0.0), reverse=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Отчёт о самых долгих тестах и фикстурах")
+    parser.add_argument("--db", default=None, help="Путь к SQLite-базе длительностей")
+    parser.add_argument("--runs", type=int, default=5, help="Сколько последних прогонов учитывать")
+    parser.add_argument("--top", type=int, default=20, help="Сколько строк выводить")
+    args = parser.parse_args(argv)
+
+    db_path = args.db or default_db_path()
+    if not os.path.exists(db_path):
+        parser.error(f"База длительностей не найдена: {db_path}")
+    store = DurationStore(db_path)
+
+    print(f"Фикстуры (последние {args.runs} прогонов)")
+    print(f"{'fixture':<40}{'scope':<10}{'setups':>8}{'total, s':>12}{'avg, s':>10}")
+    for fixture, scope, count, total, average in store.top_fixtures(args.runs, args.top):
+        print(f"{fixture:<40}{scope:<10}{count:>8}{total:>12.3f}{average:>10.3f}")
+
+    print()
+    print(f"Тесты (среднее за прогон, последние {args.runs} прогонов)")
+    print(f"{'setup, s':>10}{'call, s':>10}{'teardown, s':>13}{'total, s':>10}  test")
+    for nodeid, setup, call, teardown, total in store.top_tests(args.runs, args.top):
+        print(f"{setup:>10.3f}{call:>10.3f}{teardown:>13.3f}{total:>10.3f}  {nodeid}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Профиль окружения в тестовом прогоне.
+
+Печатает выбранный профиль в заголовке отчёта, а с --stand-in поднимает локальный стенд
+для профиля local. Согласованность адресов проверяет сам профиль при загрузке
+(EnvironmentProfile.validate); API-классы и страницы UI берут адреса из него через constants.
+"""
+from urllib.parse import urlparse
+
+import pytest
+
+from resources.environment import ENVIRONMENT
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("environment", "Профиль окружения")
+    group.addoption("--stand-in", action="store_true", default=False,
+                    help="Поднять локальный стенд (python -m stand_in) на адресе профиля local")
+
+
+def pytest_report_header(config):
+    return (
+        f"cinescope environment: {ENVIRONMENT.name} "
+        f"(auth={ENVIRONMENT.auth_url}, api={ENVIRONMENT.api_url}, ui={ENVIRONMENT.ui_url})"
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--stand-in") or hasattr(config, "workerinput"):
+        return  # Воркеры xdist ходят в стенд, поднятый контроллером
+
+    auth, api = urlparse(ENVIRONMENT.auth_url), urlparse(ENVIRONMENT.api_url)
+    if auth.hostname not in ("127.0.0.1", "localhost") or (auth.hostname, auth.port) != (api.hostname, api.port):
+        raise pytest.UsageError("--stand-in работает только с локальным профилем, где auth_url и api_url совпадают")
+
+    from resources.user_creds import SuperAdminCreds
+    from stand_in import LocalServer, create_app
+
+    super_admin = (SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD) if SuperAdminCreds.USERNAME else None
+    server = LocalServer(
+        create_app(super_admin=super_admin),
+        host=auth.hostname,
+        port=auth.port
+    ).start()
+    config.add_cleanup(server.stop)
@@ -0,0 +1,90 @@
+"""
+Перехват запросов UI-тестов: статика из дискового кэша, блокировка сторонних доменов и картинок.
+
+Кэш статики включён по умолчанию (--no-asset-cache выключает) и учитывает Cache-Control и ETag
+сервера; в начале сессии из него удаляются мёртвые записи, а размер ограничивается --asset-cache-quota-mb.
+--block-third-party не пускает
+запросы за пределы доменов стенда, --block-images — картинки и медиа во всех тестах,
+кроме помеченных @pytest.mark.visual. Если ничего из этого не включено, перехват в контексты
+не устанавливается. Для каждого теста сохраняется, сколько байт отдано из кэша; в конце прогона
+печатается сумма (под xdist — по всем воркерам).
+"""
+from urllib.parse import urlsplit
+
+import pytest
+
+from common.Tools import Tools
+from common.network_interceptor import COUNTERS, AssetCache, NetworkInterceptor
+from resources.environment import ENVIRONMENT
+
+PROPERTY_PREFIX = "network_"
+
+# Суммы по всем тестам прогона (в контроллере xdist — по всем воркерам)
+_totals = dict.fromkeys(COUNTERS, 0)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("network", "Перехват запросов UI-тестов")
+    group.addoption("--no-asset-cache", action="store_true", default=False,
+                    help="Не кэшировать статику фронтенда на диске")
+    group.addoption("--asset-cache-max-age", type=float, default=24 * 3600,
+                    help="Верхняя граница свежести статики в кэше (секунды); max-age сервера меньше — берётся он")
+    group.addoption("--asset-cache-quota-mb", type=float, default=200,
+                    help="Предельный размер кэша статики; в начале сессии удаляются самые старые записи")
+    group.addoption("--block-third-party", action="store_true", default=False,
+                    help="Блокировать запросы к сторонним доменам (аналитика, виджеты)")
+    group.addoption("--block-images", action="store_true", default=False,
+                    help="Не загружать картинки в тестах без метки visual")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "visual: тест проверяет внешний вид, картинки не блокируются")
+
+
+@pytest.fixture(scope="session")
+def network_interceptor(request):
+    """
+    Обработчик перехвата, общий для всех контекстов воркера.
+    """
+    config = request.config
+    cache = None
+    if not config.getoption("--no-asset-cache"):
+        cache = AssetCache(Tools.files_dir("asset_cache"), max_age=config.getoption("--asset-cache-max-age"))
+        cache.prune(config.getoption("--asset-cache-quota-mb") * 1024 * 1024)
+    hosts = [urlsplit(url).hostname for url in (ENVIRONMENT.ui_url, ENVIRONMENT.api_url, ENVIRONMENT.auth_url)]
+    return NetworkInterceptor(cache, first_party_hosts=hosts,
+                              block_third_party=config.getoption("--block-third-party"),
+                              block_images=config.getoption("--block-images"))
+
+
+@pytest.fixture
+def network(request, network_interceptor):
+    """
+    Настраивает перехват на время теста и записывает его счётчики в user_properties отчёта.
+    """
+    network_interceptor.images_allowed = request.node.get_closest_marker("visual") is not None
+    before = network_interceptor.stats()
+    yield network_interceptor
+    after = network_interceptor.stats()
+    for name in COUNTERS:
+        request.node.user_properties.append((PROPERTY_PREFIX + name, after[name] - before[name]))
+
+
+def pytest_runtest_logreport(report):
+    # Отчёты воркеров xdist приходят в контроллер вместе с user_properties
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name.startswith(PROPERTY_PREFIX) and name[len(PROPERTY_PREFIX):] in COUNTERS:
+            _totals[name[len(PROPERTY_PREFIX):]] += value
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput") or not any(_totals.values()):
+        return
+    terminalreporter.write_sep("=", "UI network")
+    terminalreporter.write_line(
+        f"из кэша: {_totals['cache_hits']} запросов, {_totals['bytes_saved'] / 1024 / 1024:.1f} МБ сэкономлено; "
+        f"загружено в кэш: {_totals['cache_misses']} запросов, {_totals['bytes_downloaded'] / 1024 / 1024:.1f} МБ; "
+        f"заблокировано: {_totals['blocked']}"
+    )
@@ -0,0 +1,66 @@
+"""
+Сводка латентности HTTP-запросов за тестовый прогон.
+
+В конце сессии печатает таблицу по эндпоинтам и сохраняет гистограммы в JSON
+(по умолчанию files/request_metrics/request_metrics.json). Под pytest-xdist каждый воркер
+сохраняет свою часть, а контроллер сливает их в один отчёт.
+"""
+import uuid
+
+import pytest
+
+from common.Tools import Tools
+from custom_requester.custom_requester import CustomRequester
+from custom_requester.metrics import RequestMetrics
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("request_metrics", "Латентность HTTP-запросов")
+    group.addoption("--request-metrics-json", default=None,
+                    help="Куда сохранить гистограммы латентности (JSON)")
+    group.addoption("--no-request-metrics", action="store_true", default=False,
+                    help="Не измерять латентность запросов")
+
+
+def pytest_configure(config):
+    if config.getoption("--no-request-metrics"):
+        CustomRequester.metrics = None
+        return
+    workerinput = getattr(config, "workerinput", None)
+    config.request_metrics_run = workerinput["request_metrics_run"] if workerinput else uuid.uuid4().hex
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["request_metrics_run"] = getattr(node.config, "request_metrics_run", uuid.uuid4().hex)
+
+
+def _worker_part_path(run_id, worker_id):
+    return Tools.files_dir("request_metrics", f"{run_id}-{worker_id}.json")
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    workerinput = getattr(config, "workerinput", None)
+    if CustomRequester.metrics is None or workerinput is None:
+        return
+    CustomRequester.metrics.dump_json(_worker_part_path(config.request_metrics_run, workerinput["workerid"]))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if CustomRequester.metrics is None or hasattr(config, "workerinput"):
+        return
+
+    metrics = RequestMetrics()
+    metrics.merge(CustomRequester.metrics)
+    for part in Tools.files_dir("request_metrics").glob(f"{config.request_metrics_run}-*.json"):
+        metrics.merge(RequestMetrics.load_json(part))
+        part.unlink()
+    if not metrics.histograms and not metrics.counters:
+        return
+
+    path = config.getoption("--request-metrics-json") or Tools.files_dir("request_metrics", "request_metrics.json")
+    metrics.dump_json(path)
+    terminalreporter.write_sep("=", "HTTP request latency")
+    terminalreporter.write_line(metrics.report())
+    terminalreporter.write_line(f"Гистограммы сохранены в {path}")
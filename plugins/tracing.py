@@ -0,0 +1,124 @@
+"""
+Трассировка Playwright только там, где она нужна.
+
+--ui-tracing задаёт режим (префикс ui-: у плагина pytest-playwright есть своя опция --tracing):
+  retain-on-failure (по умолчанию) — трасса пишется в память браузера и сохраняется только у упавших тестов;
+  on-first-retry — трасса снимается только при первом перезапуске теста (pytest-rerunfailures);
+  on — сохраняется у всех тестов; off — трассировка выключена.
+Директория files/playwright_trace ограничена по размеру (--ui-trace-quota-mb): при превышении
+удаляются самые старые трассы.
+"""
+import re
+
+import pytest
+
+from common.Tools import Tools
+
+TRACING_MODES = ("off", "on", "retain-on-failure", "on-first-retry")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("tracing", "Трассировка Playwright")
+    group.addoption("--ui-tracing", choices=TRACING_MODES, default="retain-on-failure",
+                    help="Когда снимать и сохранять трассу UI-теста")
+    group.addoption("--ui-trace-quota-mb", type=float, default=500,
+                    help="Максимальный размер files/playwright_trace; старые трассы удаляются")
+
+
+# Фазы (setup/call), в которых тест упал; teardown контекста проверяет их до отчёта о собственной фазе
+failed_phases_key = pytest.StashKey[set]()
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    report = yield
+    if report.failed:
+        item.stash.setdefault(failed_phases_key, set()).add(report.when)
+    return report
+
+
+def should_trace(mode, item):
+    """
+    Нужно ли запускать трассировку для теста.
+    """
+    if mode == "on-first-retry":
+        return getattr(item, "execution_count", 1) == 2
+    return mode != "off"
+
+
+def should_keep(mode, item):
+    """
+    Нужно ли сохранить снятую трассу: в режиме retain-on-failure — только если тест упал.
+    """
+    if mode == "retain-on-failure":
+        return bool(item.stash.get(failed_phases_key, set()))
+    return True
+
+
+def trace_path(item, index=0):
+    name = re.sub(r"[^\w.-]+", "_", item.nodeid.split("/")[-1])[:120]
+    suffix = f"_{index}" if index else ""
+    return Tools.files_dir("playwright_trace", f"trace_{Tools.get_timestamp()}_{name}{suffix}.zip")
+
+
+def rotate(directory, quota_bytes):
+    """
+    Удаляет самые старые трассы, пока суммарный размер больше quota_bytes.
+    :return: Список удалённых файлов.
+    """
+    traces = sorted(directory.glob("*.zip"), key=lambda path: path.stat().st_mtime)
+    total = sum(path.stat().st_size for path in traces)
+    removed = []
+    for path in traces:
+        if total <= quota_bytes:
+            break
+        total -= path.stat().st_size
+        path.unlink(missing_ok=True)
+        removed.append(path)
+    return removed
+
+
+class Tracing:
+    """
+    Трассировка контекстов одного теста по режиму --ui-tracing.
+    Контекстов может быть несколько (например, context и authenticated_context): у каждого своя трасса.
+    """
+
+    def __init__(self, config, item):
+        self.mode = config.getoption("--ui-tracing")
+        self.quota_bytes = config.getoption("--ui-trace-quota-mb") * 1024 * 1024
+        self.item = item
+        self.started = []
+        self.saved = 0
+        # При перезапуске (pytest-rerunfailures) item тот же: падения прошлой попытки не считаются
+        item.stash[failed_phases_key] = set()
+
+    def start(self, context):
+        if should_trace(self.mode, self.item):
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            self.started.append(context)
+
+    def stop(self, context):
+        """
+        Останавливает трассировку; файл пишется только если трассу нужно сохранить.
+        :return: Путь к сохранённой трассе или None.
+        """
+        if context not in self.started:
+            return None
+        self.started.remove(context)
+        if not should_keep(self.mode, self.item):
+            context.tracing.stop()
+            return None
+        path = trace_path(self.item, self.saved)
+        self.saved += 1
+        context.tracing.stop(path=path)
+        rotate(path.parent, self.quota_bytes)
+        return path
+
+
+@pytest.fixture
+def tracing(request):
+    """
+    Управляет трассировкой контекстов: tracing.start(context) до теста, tracing.stop(context) после.
+    """
+    return Tracing(request.config, request.node)
@@ -0,0 +1,139 @@
+"""
+Контроль фиксированных пауз в UI-тестах.
+
+- Линтер: находит вызовы time.sleep (и sleep из `from time import sleep`) в модулях UI-тестов.
+  --sleep-lint=error (по умолчанию) роняет такие тесты, warn — только предупреждает, off — выключает.
+  То же самое из командной строки: python -m plugins.ui_waits tests/ui
+- Замер: в конце прогона для UI-тестов печатается текущая длительность, средняя за прошлые
+  прогоны (из плагина duration_store) и сколько времени сэкономлено.
+"""
+import argparse
+import ast
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+from plugins.xdist_sharding import SHARD_GROUP_SUFFIX
+
+UI_MARKER = "ui"
+
+# Сообщение линтера для тестов, которые нужно уронить (--sleep-lint=error)
+sleep_lint_message_key = pytest.StashKey[str]()
+
+# Полная длительность (setup + call + teardown) UI-тестов текущего прогона
+_durations = defaultdict(float)
+
+
+def find_sleeps(source):
+    """
+    Строки с вызовами time.sleep(...) / sleep(...), импортированного из time.
+    :param source: Текст модуля.
+    :return: Список номеров строк.
+    """
+    tree = ast.parse(source)
+    time_aliases = {"time"}
+    sleep_aliases = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            time_aliases.update(alias.asname or alias.name for alias in node.names if alias.name == "time")
+        elif isinstance(node, ast.ImportFrom) and node.module == "time":
+            sleep_aliases.update(alias.asname or alias.name for alias in node.names if alias.name == "sleep")
+
+    lines = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if (isinstance(func, ast.Attribute) and func.attr == "sleep"
+                and isinstance(func.value, ast.Name) and func.value.id in time_aliases):
+            lines.append(node.lineno)
+        elif isinstance(func, ast.Name) and func.id in sleep_aliases:
+            lines.append(node.lineno)
+    return sorted(lines)
+
+
+@lru_cache(maxsize=None)
+def _module_sleeps(path):
+    return tuple(find_sleeps(Path(path).read_text(encoding="utf-8")))
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ui_waits", "Фиксированные паузы в UI-тестах")
+    group.addoption("--sleep-lint", choices=("error", "warn", "off"), default="error",
+                    help="Что делать с UI-тестами, в модуле которых есть time.sleep")
+
+
+def pytest_sessionstart(session):
+    # История читается до прогона: duration_store запишет текущие длительности в конце сессии
+    store = getattr(session.config, "duration_store", None)
+    session.config.ui_durations_before = (
+        store.average_test_durations(session.config.getoption("--durations-history")) if store else {}
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    mode = config.getoption("--sleep-lint")
+    if mode == "off":
+        return
+    for item in items:
+        if item.get_closest_marker(UI_MARKER) is None or not str(item.path).endswith(".py"):
+            continue
+        lines = _module_sleeps(str(item.path))
+        if not lines:
+            continue
+        message = (f"time.sleep в UI-тесте ({item.path.name}, строки {', '.join(map(str, lines))}): "
+                   f"используйте ожидания PageAction (wait_for_response, wait_for_requests_idle, expect)")
+        if mode == "warn":
+            item.warn(pytest.PytestWarning(message))
+        else:
+            item.stash[sleep_lint_message_key] = message
+
+
+def pytest_runtest_setup(item):
+    if sleep_lint_message_key in item.stash:
+        pytest.fail(item.stash[sleep_lint_message_key], pytrace=False)
+
+
+def pytest_runtest_logreport(report):
+    if UI_MARKER in report.keywords:
+        _durations[SHARD_GROUP_SUFFIX.sub("", report.nodeid)] += report.duration
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput") or not _durations:
+        return
+    before = getattr(config, "ui_durations_before", {})
+    terminalreporter.write_sep("=", "UI test waits")
+    total_saved = 0.0
+    for nodeid, duration in sorted(_durations.items()):
+        if nodeid in before:
+            saved = before[nodeid] - duration
+            total_saved += saved
+            terminalreporter.write_line(
+                f"{nodeid}: {duration:.2f}s (было в среднем {before[nodeid]:.2f}s, сэкономлено {saved:+.2f}s)"
+            )
+        else:
+            terminalreporter.write_line(f"{nodeid}: {duration:.2f}s (нет истории)")
+    if before:
+        terminalreporter.write_line(f"Итого сэкономлено: {total_saved:+.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Поиск time.sleep в UI-тестах")
+    parser.add_argument("paths", nargs="*", default=["tests/ui"])
+    args = parser.parse_args(argv)
+
+    found = 0
+    for root in map(Path, args.paths):
+        for path in sorted(root.rglob("*.py") if root.is_dir() else [root]):
+            for line in find_sleeps(path.read_text(encoding="utf-8")):
+                print(f"{path}:{line}: time.sleep в UI-тесте")
+                found += 1
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Поддержка pytest-xdist: шардирование данных по воркерам, однократная подготовка
+общих ресурсов и балансировка тестов по сохранённым длительностям.
+
+Балансировка включается опцией --shard-by-duration и работает вместе с --dist loadgroup:
+каждый тест получает метку xdist_group так, чтобы суммарные длительности групп были равны.
+"""
+import itertools
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+import pytest
+
+from common.file_lock import FileLock
+
+SHARD_GROUP_SUFFIX = re.compile(r"@shard\d+$")
+
+
+class WorkerShard:
+    """
+    Детерминированное пространство имён и диапазон id для текущего воркера.
+    """
+
+    def __init__(self, worker_id: str = None, worker_count: int = None, run_id: str = None, id_range_size: int = 1_000_000):
+        self.worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "master")
+        self.worker_count = worker_count or int(os.getenv("PYTEST_XDIST_WORKER_COUNT", 1))
+        self.run_id = run_id or os.getenv("PYTEST_XDIST_TESTRUNUID", "local")[:8]
+        self.id_range_size = id_range_size
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> int:
+        """Номер воркера: gw0 -> 0, gw1 -> 1, без xdist -> 0."""
+        match = re.fullmatch(r"gw(\d+)", self.worker_id)
+        return int(match.group(1)) if match else 0
+
+    @property
+    def namespace(self) -> str:
+        return f"{self.run_id}-{self.worker_id}"
+
+    @property
+    def id_range(self) -> range:
+        """Непересекающийся между воркерами диапазон числовых id."""
+        start = self.index * self.id_range_size
+        return range(start, start + self.id_range_size)
+
+    def next_id(self) -> int:
+        with self._lock:
+            return self.id_range[next(self._counter)]
+
+    def unique_name(self, prefix: str) -> str:
+        """Имя, уникальное в рамках прогона, даже если воркеры генерируют одинаковые префиксы."""
+        with self._lock:
+            return f"{prefix} [{self.namespace}-{next(self._counter)}]"
+
+
+def shared_dir(tmp_path_factory) -> Path:
+    """
+    Директория, общая для всех воркеров текущего прогона.
+    """
+    base = tmp_path_factory.getbasetemp()
+    return base.parent if os.getenv("PYTEST_XDIST_WORKER") else base
+
+
+def run_once(directory: Path, key: str, setup):
+    """
+    Выполняет setup() один раз на весь прогон, остальные воркеры получают сохранённый результат.
+    Результат setup() должен сериализоваться в JSON.
+    """
+    result_path = Path(directory) / f"{key}.json"
+    with FileLock(Path(directory) / f"{key}.lock"):
+        if result_path.exists():
+            return json.loads(result_path.read_text(encoding="utf-8"))
+        result = setup()
+        result_path.write_text(json.dumps(result), encoding="utf-8")
+        return result
+
+
+def assign_shards(node_ids, durations: dict, shard_count: int) -> dict:
+    """
+    Распределяет тесты по shard_count группам жадным алгоритмом LPT:
+    самый долгий из оставшихся тестов уходит в наименее загруженную группу.
+    Для тестов без истории берётся медиана известных длительностей.
+    """
+    known = sorted(durations.values())
+    default = known[len(known) // 2] if known else 1.0
+    ordered = sorted(node_ids, key=lambda node_id: (-durations.get(node_id, default), node_id))
+
+    loads = [0.0] * shard_count
+    assignment = {}
+    for node_id in ordered:
+        shard = loads.index(min(loads))
+        assignment[node_id] = shard
+        loads[shard] += durations.get(node_id, default)
+    return assignment
+
+
+def historical_durations(config) -> dict:
+    """
+    Длительности тестов из прошлых прогонов из SQLite-хранилища плагина duration_store
+    (пустой словарь, если плагин отключён).
+    """
+    store = getattr(config, "duration_store", None)
+    if store is None:
+        return {}
+    return store.average_test_durations(config.getoption("--durations-history"))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--shard-by-duration",
+        action="store_true",
+        default=False,
+        help="Распределять тесты по воркерам xdist по сохранённым длительностям (используйте с --dist loadgroup)"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    worker_count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", 0))
+    if not config.getoption("--shard-by-duration") or worker_count < 2:
+        return
+    durations = historical_durations(config)
+    assignment = assign_shards([item.nodeid for item in items], durations, worker_count)
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(name=f"shard{assignment[item.nodeid]}"))
+
+
+@pytest.fixture(scope="session")
+def worker_shard():
+    """
+    Пространство имён и диапазон id текущего воркера xdist.
+    """
+    return WorkerShard()
+
+
+@pytest.fixture(scope="session")
+def shared_tmp_dir(tmp_path_factory):
+    """
+    Временная директория, общая для всех воркеров xdist текущего прогона.
+    """
+    return shared_dir(tmp_path_factory)
+
+
+@pytest.fixture(scope="session")
+def shared_setup(shared_tmp_dir):
+    """
+    Функция для однократной подготовки ресурса на весь прогон: shared_setup("db_seed", seed_func).
+    """
+    return lambda key, setup: run_once(shared_tmp_dir, key, setup)
@@ -0,0 +1,115 @@
+"""
+Профили окружений: адреса сервисов авторизации, фильмов и UI.
+
+Профиль выбирается переменной окружения CINESCOPE_ENV (dev, stage, local; по умолчанию dev)
+и загружается один раз при импорте. Отдельные адреса можно переопределить переменными
+CINESCOPE_AUTH_URL, CINESCOPE_API_URL и CINESCOPE_UI_URL.
+"""
+import ipaddress
+import os
+from dataclasses import dataclass, replace
+from urllib.parse import urlparse
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+LOCAL_HOSTS = {"localhost"}
+# Префиксы поддоменов отдельных сервисов: auth.dev-cinescope... и dev-cinescope... — одно окружение
+SERVICE_PREFIXES = ("auth", "api")
+
+
+@dataclass(frozen=True)
+class EnvironmentProfile:
+    """
+    :param name: Имя профиля.
+    :param auth_url: Базовый URL сервиса авторизации (AuthAPI, UserAPI).
+    :param api_url: Базовый URL сервиса фильмов (MoviesAPI).
+    :param ui_url: Адрес веб-интерфейса (страницы Playwright).
+    """
+    name: str
+    auth_url: str
+    api_url: str
+    ui_url: str
+
+    @property
+    def urls(self):
+        return {"auth_url": self.auth_url, "api_url": self.api_url, "ui_url": self.ui_url}
+
+    def validate(self):
+        """
+        Проверяет, что адреса корректны и все слои смотрят в одно окружение:
+        либо все адреса локальные, либо все хосты совпадают с точностью до префикса сервиса (auth., api.).
+        :raises ValueError: При несогласованном профиле.
+        """
+        errors = []
+        sites = set()
+        for field, url in self.urls.items():
+            parsed = urlparse(url)
+            if parsed.scheme not in ("http", "https") or not parsed.hostname:
+                errors.append(f"{field}={url!r}: ожидается http(s)-адрес")
+                continue
+            if not url.endswith("/"):
+                errors.append(f"{field}={url!r}: адрес должен заканчиваться на '/'")
+            sites.add(_site(parsed.hostname))
+        if len(sites) > 1:
+            errors.append(f"адреса указывают на разные окружения: {', '.join(sorted(sites))}")
+        if errors:
+            raise ValueError(f"Профиль окружения '{self.name}' некорректен: " + "; ".join(errors))
+        return self
+
+
+def _site(hostname):
+    """
+    Окружение, к которому относится хост: "local" или хост без префикса сервиса.
+    """
+    if hostname in LOCAL_HOSTS:
+        return "local"
+    try:
+        return "local" if ipaddress.ip_address(hostname).is_loopback else hostname
+    except ValueError:
+        label, _, rest = hostname.partition(".")
+        return rest if label in SERVICE_PREFIXES and rest else hostname
+
+
+PROFILES = {
+    "dev": EnvironmentProfile(
+        name="dev",
+        auth_url="https://auth.dev-cinescope.coconutqa.ru/",
+        api_url="https://api.dev-cinescope.coconutqa.ru/",
+        ui_url="https://dev-cinescope.coconutqa.ru/"
+    ),
+    "stage": EnvironmentProfile(
+        name="stage",
+        auth_url="https://auth.stage-cinescope.coconutqa.ru/",
+        api_url="https://api.stage-cinescope.coconutqa.ru/",
+        ui_url="https://stage-cinescope.coconutqa.ru/"
+    ),
+    # Локальный стенд (python -m stand_in) обслуживает и авторизацию, и фильмы на одном порту
+    "local": EnvironmentProfile(
+        name="local",
+        auth_url="http://127.0.0.1:8080/",
+        api_url="http://127.0.0.1:8080/",
+        ui_url="http://127.0.0.1:3000/"
+    ),
+}
+
+
+def load_environment(name=None, overrides=None):
+    """
+    Собирает и проверяет профиль окружения.
+    :param name: Имя профиля (по умолчанию CINESCOPE_ENV или dev).
+    :param overrides: Словарь {auth_url, api_url, ui_url}; по умолчанию берётся из CINESCOPE_*_URL.
+    """
+    name = name or os.getenv("CINESCOPE_ENV", "dev")
+    if name not in PROFILES:
+        raise ValueError(f"Неизвестный профиль окружения '{name}'. Доступны: {', '.join(PROFILES)}")
+    if overrides is None:
+        overrides = {
+            field: os.getenv(f"CINESCOPE_{field.upper()}")
+            for field in ("auth_url", "api_url", "ui_url")
+        }
+    return replace(PROFILES[name], **{field: url for field, url in overrides.items() if url}).validate()
+
+
+ENVIRONMENT = load_environment()
@@ -0,0 +1,10 @@
+"""
+Локальный стенд Cinescope: /register, /login, /user, /movies поверх хранилища в памяти.
+
+Запуск: python -m stand_in --port 8080
+Тесты направляются на стенд профилем окружения local:
+    CINESCOPE_ENV=local pytest --stand-in
+"""
+from stand_in.app import create_app
+from stand_in.server import LocalServer
+from stand_in.store import InMemoryStore
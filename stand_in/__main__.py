@@ -0,0 +1,30 @@
+import argparse
+
+from aiohttp import web
+
+from resources.user_creds import SuperAdminCreds
+from stand_in.app import create_app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Локальный стенд Cinescope")
+    parser.add_argument("--host", default="127.0.0.1", help="Адрес для прослушивания")
+    parser.add_argument("--port", type=int, default=8080, help="Порт")
+    parser.add_argument("--admin-email", default=SuperAdminCreds.USERNAME or "admin@cinescope.local",
+                        help="Email супер-админа (по умолчанию SUPER_ADMIN_USERNAME)")
+    parser.add_argument("--admin-password", default=SuperAdminCreds.PASSWORD or "Admin12345",
+                        help="Пароль супер-админа (по умолчанию SUPER_ADMIN_PASSWORD)")
+    parser.add_argument("--seed-movies", type=int, default=0, help="Сколько фильмов создать при старте")
+    parser.add_argument("--no-roles", action="store_true", help="Не проверять роли пользователей")
+    args = parser.parse_args(argv)
+
+    app = create_app(
+        super_admin=(args.admin_email, args.admin_password),
+        enforce_roles=not args.no_roles,
+        seed_movies=args.seed_movies
+    )
+    web.run_app(app, host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+import base64
+import hashlib
+import json
+import re
+import secrets
+import time
+from collections import OrderedDict
+
+from aiohttp import web
+
+from constants import Roles
+from stand_in.store import InMemoryStore
+from stand_in.validation import (DEFAULT_MOVIE_FIELDS, MOVIE_RULES, validate_movie, validate_movie_filters,
+                                 validate_registration)
+
+ADMIN_ROLES = {Roles.ADMIN.value, Roles.SUPER_ADMIN.value}
+TOKEN_TTL = 3600
+# Сколько токенов стенд помнит одновременно: при переполнении отзывается тот, что дольше всех не использовался
+MAX_TOKENS = 1000
+
+
+def _json(data, status=200):
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    return web.Response(body=body, status=status, content_type="application/json")
+
+
+def _error(message, status):
+    return _json({"message": message, "statusCode": status}, status)
+
+
+def _public_user(user):
+    return {key: value for key, value in user.items() if key != "password"}
+
+
+def _issue_token(user):
+    """
+    Токен в формате JWT (без настоящей подписи): TokenCache берёт из него exp.
+    """
+    def encode(part):
+        return base64.urlsafe_b64encode(json.dumps(part).encode("utf-8")).rstrip(b"=").decode("ascii")
+
+    payload = {"id": user["id"], "email": user["email"], "roles": user["roles"], "exp": int(time.time()) + TOKEN_TTL}
+    return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(payload)}.{secrets.token_urlsafe(16)}"
+
+
+class StandInApp:
+    """
+    Обработчики стенда. Маршрутизация своя, а не через router aiohttp:
+    базовые URL API-классов заканчиваются на "/", поэтому запросы приходят на "//login", "//movies" и т.п.
+    """
+
+    def __init__(self, store: InMemoryStore, enforce_roles=True):
+        """
+        :param enforce_roles: Проверять роли (создание фильмов и /user — только ADMIN и SUPER_ADMIN).
+            Без проверки достаточно любого выданного стендом токена.
+        """
+        self.store = store
+        self.enforce_roles = enforce_roles
+        self.tokens = OrderedDict()
+        self.routes = {
+            ("POST", "register", False): self.register,
+            ("POST", "login", False): self.login,
+            ("POST", "user", False): self.create_user,
+            ("GET", "user", True): self.get_user,
+            ("PATCH", "user", True): self.update_user,
+            ("DELETE", "user", True): self.delete_user,
+            ("GET", "movies", False): self.get_movies,
+            ("POST", "movies", False): self.create_movie,
+            ("GET", "movies", True): self.get_movie,
+            ("PATCH", "movies", True): self.update_movie,
+            ("DELETE", "movies", True): self.delete_movie,
+        }
+
+    async def dispatch(self, request):
+        segments = [segment for segment in request.path.split("/") if segment]
+        if not segments or len(segments) > 2:
+            return _error("Not Found", 404)
+        handler = self.routes.get((request.method, segments[0], len(segments) == 2))
+        if handler is None:
+            return _error(f"Cannot {request.method} {request.path}", 404)
+
+        body = None
+        if request.can_read_body:
+            try:
+                body = await request.json()
+            except ValueError:
+                return _error("Некорректный JSON", 400)
+        response = await handler(request, body, *segments[1:])
+        if request.method == "GET" and response.status == 200:
+            etag = f'"{hashlib.md5(response.body).hexdigest()}"'
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+        return response
+
+    def _authorize(self, request):
+        """
+        :return: None, если доступ разрешён, иначе ответ с ошибкой.
+        """
+        header = request.headers.get("authorization", "")
+        token = header[len("Bearer "):] if header.startswith("Bearer ") else None
+        user_id = self.tokens.get(token)
+        if user_id is not None:
+            self.tokens.move_to_end(token)
+        user = self.store.users.get(user_id)
+        if user is None:
+            return _error("Unauthorized", 401)
+        if self.enforce_roles and not ADMIN_ROLES & set(user["roles"]):
+            return _error("Forbidden resource", 403)
+        return None
+
+    # Авторизация
+
+    async def register(self, request, body):
+        errors = validate_registration(body)
+        if errors:
+            return _error(errors, 400)
+        if body["email"] in self.store.users_by_email:
+            return _error("Пользователь с таким email уже зарегистрирован", 409)
+        user = self.store.add_user(body["email"], body["fullName"], body["password"], [Roles.USER.value])
+        return _json(_public_user(user), 201)
+
+    async def login(self, request, body):
+        body = body or {}
+        user = self.store.users_by_email.get(body.get("email"))
+        if user is None or user["password"] != body.get("password") or user["banned"]:
+            return _error("Неверный логин или пароль", 401)
+        token = _issue_token(user)
+        self.tokens[token] = user["id"]
+        while len(self.tokens) > MAX_TOKENS:
+            self.tokens.popitem(last=False)
+        return _json({
+            "user": {key: user[key] for key in ("id", "email", "fullName", "roles")},
+            "accessToken": token,
+            "refreshToken": secrets.token_urlsafe(16),
+            "expiresIn": int(time.time() + TOKEN_TTL) * 1000
+        }, 200)
+
+    # Пользователи
+
+    async def create_user(self, request, body):
+        denied = self._authorize(request)
+        if denied:
+            return denied
+        errors = validate_registration(body)
+        if errors:
+            return _error(errors, 400)
+        if body["email"] in self.store.users_by_email:
+            return _error("Пользователь с таким email уже зарегистрирован", 409)
+        user = self.store.add_user(
+            body["email"], body["fullName"], body["password"], body.get("roles") or [Roles.USER.value],
+            verified=body.get("verified", False), banned=body.get("banned", False)
+        )
+        return _json(_public_user(user), 201)
+
+    async def get_user(self, request, body, locator):
+        denied = self._authorize(request)
+        if denied:
+            return denied
+        user = self.store.find_user(locator)
+        if user is None:
+            return _error("Пользователь не найден", 404)
+        return _json(_public_user(user))
+
+    async def update_user(self, request, body, locator):
+        denied = self._authorize(request)
+        if denied:
+            return denied
+        user = self.store.find_user(locator)
+        if user is None:
+            return _error("Пользователь не найден", 404)
+        changes = {key: value for key, value in (body or {}).items() if key in ("fullName", "roles", "verified", "banned")}
+        return _json(_public_user(self.store.update_user(user, changes)))
+
+    async def delete_user(self, request, body, locator):
+        denied = self._authorize(request)
+        if denied:
+            return denied
+        user = self.store.find_user(locator)
+        if user is None:
+            return _error("Пользователь не найден", 404)
+        self.store.delete_user(user)
+        return _json(_public_user(user))
+
+    # Фильмы
+
+    async def get_movies(self, request, body):
+        filters, page, page_size, errors = validate_movie_filters(request.query)
+        if errors:
+            return _error(errors, 400)
+        found = self.store.find_movies(**filters)
+        return _json({
+            "movies": found[(page - 1) * page_size:page * page_size],
+            "count": len(found),
+            "page": page,
+            "pageSize": page_size,
+            "pageCount": max((len(found) + page_size - 1) // page_size, 1)
+        })
+
+    async def create_movie(self, request, body):
+        denied = self._authorize(request)
+        if denied:
+            return denied
+        errors = validate_movie(body)
+        if errors:
+            return _error(errors, 400)
+        if self.store.movie_by_name(body["name"]) is not None:
+            return _error("Фильм с таким названием уже существует", 409)
+        return _json(self.store.add_movie({**DEFAULT_MOVIE_FIELDS, **body}), 201)
+
+    def _find_movie(self, movie_id):
+        return self.store.movies.get(int(movie_id)) if re.fullmatch(r"\d+", movie_id) else None
+
+    async def get_movie(self, request, body, movie_id):
+        movie = self._find_movie(movie_id)
+        if movie is None:
+            return _error("Фильм не найден", 404)
+        return _json(movie)
+
+    async def update_movie(self, request, body, movie_id):
+        denied = self._authorize(request)
+        if denied:
+            return denied
+        movie = self._find_movie(movie_id)
+        if movie is None:
+            return _error("Фильм не найден", 404)
+        errors = validate_movie(body, partial=True)
+        if errors:
+            return _error(errors, 400)
+        duplicate = self.store.movie_by_name(body.get("name"))
+        if duplicate is not None and duplicate is not movie:
+            return _error("Фильм с таким названием уже существует", 409)
+        changes = {key: value for key, value in body.items() if key in MOVIE_RULES}
+        return _json(self.store.update_movie(movie, changes))
+
+    async def delete_movie(self, request, body, movie_id):
+        denied = self._authorize(request)
+        if denied:
+            return denied
+        movie = self._find_movie(movie_id)
+        if movie is None:
+            return _error("Фильм не найден", 404)
+        self.store.delete_movie(movie)
+        return _json(movie)
+
+
+STAND_IN_KEY = web.AppKey("stand_in", StandInApp)
+
+
+def create_app(store=None, super_admin=None, enforce_roles=True, seed_movies=0):
+    """
+    Собирает aiohttp-приложение стенда.
+    :param store: Хранилище (по умолчанию новое пустое).
+    :param super_admin: Кортеж (email, password) супер-админа, создаваемого при старте.
+    :param enforce_roles: Проверять роли пользователей (см. StandInApp).
+    :param seed_movies: Сколько фильмов создать заранее, например для нагрузочных прогонов.
+    """
+    store = store or InMemoryStore()
+    if super_admin and super_admin[0] not in store.users_by_email:
+        store.add_user(super_admin[0], "Super Admin", super_admin[1], [Roles.SUPER_ADMIN.value], verified=True)
+    for i in range(seed_movies):
+        store.add_movie({
+            "name": f"Stand-in movie {i + 1}",
+            "price": i % 500 + 1,
+            "description": f"Описание фильма {i + 1}",
+            "imageUrl": None,
+            "location": "MSK" if i % 2 else "SPB",
+            "published": True,
+            "genreId": i % 10 + 1
+        })
+
+    stand_in = StandInApp(store, enforce_roles=enforce_roles)
+    app = web.Application()
+    app[STAND_IN_KEY] = stand_in
+    app.router.add_route("*", "/{tail:.*}", stand_in.dispatch)
+    return app
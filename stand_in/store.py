@@ -0,0 +1,126 @@
+import datetime
+import itertools
+import uuid
+from collections import defaultdict
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+class InMemoryStore:
+    """
+    Хранилище пользователей и фильмов стенда.
+    Кроме основных словарей по id держит индексы: email -> пользователь, название -> фильм,
+    локация и жанр -> множество id фильмов, чтобы фильтры /movies не перебирали всю таблицу.
+    """
+
+    def __init__(self):
+        self.users = {}
+        self.users_by_email = {}
+        self.movies = {}
+        self.movie_ids_by_name = {}
+        self.movie_ids_by_location = defaultdict(set)
+        self.movie_ids_by_genre = defaultdict(set)
+        self._movie_ids = itertools.count(1)
+
+    # Пользователи
+
+    def add_user(self, email, full_name, password, roles, verified=False, banned=False):
+        user = {
+            "id": str(uuid.uuid4()),
+            "email": email,
+            "fullName": full_name,
+            "password": password,
+            "roles": list(roles),
+            "verified": verified,
+            "banned": banned,
+            "createdAt": _now()
+        }
+        self.users[user["id"]] = user
+        self.users_by_email[email] = user
+        return user
+
+    def find_user(self, locator):
+        """
+        Ищет пользователя по id или email.
+        """
+        return self.users.get(locator) or self.users_by_email.get(locator)
+
+    def update_user(self, user, changes):
+        if "email" in changes and changes["email"] != user["email"]:
+            del self.users_by_email[user["email"]]
+            self.users_by_email[changes["email"]] = user
+        user.update(changes)
+        return user
+
+    def delete_user(self, user):
+        del self.users[user["id"]]
+        del self.users_by_email[user["email"]]
+
+    # Фильмы
+
+    def add_movie(self, data):
+        movie = {
+            "id": next(self._movie_ids),
+            "name": data["name"],
+            "price": data["price"],
+            "description": data["description"],
+            "imageUrl": data.get("imageUrl"),
+            "location": data["location"],
+            "published": data["published"],
+            "genreId": data["genreId"],
+            "rating": 0,
+            "createdAt": _now()
+        }
+        self.movies[movie["id"]] = movie
+        self._index_movie(movie)
+        return movie
+
+    def update_movie(self, movie, changes):
+        self._unindex_movie(movie)
+        movie.update(changes)
+        self._index_movie(movie)
+        return movie
+
+    def delete_movie(self, movie):
+        self._unindex_movie(movie)
+        del self.movies[movie["id"]]
+
+    def movie_by_name(self, name):
+        movie_id = self.movie_ids_by_name.get(name)
+        return self.movies[movie_id] if movie_id is not None else None
+
+    def find_movies(self, locations=None, genre_id=None, min_price=None, max_price=None, published=None,
+                    newest_first=True):
+        """
+        Фильтрует фильмы, начиная с самого узкого индекса.
+        :return: Список фильмов, отсортированный по дате создания.
+        """
+        candidates = None
+        if locations:
+            candidates = set().union(*(self.movie_ids_by_location.get(location, ()) for location in locations))
+        if genre_id is not None:
+            genre_ids = self.movie_ids_by_genre.get(genre_id, set())
+            candidates = genre_ids if candidates is None else candidates & genre_ids
+        ids = sorted(candidates) if candidates is not None else list(self.movies)
+
+        found = [
+            movie for movie in map(self.movies.__getitem__, ids)
+            if (min_price is None or movie["price"] >= min_price)
+            and (max_price is None or movie["price"] <= max_price)
+            and (published is None or movie["published"] == published)
+        ]
+        if newest_first:
+            found.reverse()
+        return found
+
+    def _index_movie(self, movie):
+        self.movie_ids_by_name[movie["name"]] = movie["id"]
+        self.movie_ids_by_location[movie["location"]].add(movie["id"])
+        self.movie_ids_by_genre[movie["genreId"]].add(movie["id"])
+
+    def _unindex_movie(self, movie):
+        self.movie_ids_by_name.pop(movie["name"], None)
+        self.movie_ids_by_location[movie["location"]].discard(movie["id"])
+        self.movie_ids_by_genre[movie["genreId"]].discard(movie["id"])
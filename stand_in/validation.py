@@ -0,0 +1,142 @@
+"""
+Проверки тел запросов стенда с теми же текстами ошибок, что отдаёт настоящий Cinescope.
+Как и в class-validator, у отсутствующего обязательного поля срабатывают все его проверки.
+"""
+LOCATIONS = ("MSK", "SPB")
+
+
+def _is_string(value):
+    return isinstance(value, str)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_int(value):
+    return _is_number(value) and int(value) == value
+
+
+def _rule(check, message):
+    return check, message
+
+
+MOVIE_RULES = {
+    "name": [
+        _rule(lambda value: _is_string(value) and len(value) >= 3, "Поле name должно содержать не менее 3 символов"),
+        _rule(_is_string, "Поле name должно быть строкой"),
+    ],
+    "imageUrl": [
+        _rule(_is_string, "Поле imageUrl должно быть строкой"),
+    ],
+    "price": [
+        _rule(lambda value: _is_number(value) and value > 0, "Поле price должно быть больше 0"),
+        _rule(_is_int, "Поле price должно быть целым числом"),
+    ],
+    "description": [
+        _rule(lambda value: _is_string(value) and len(value) >= 5, "Поле description должно содержать не менее 5 символов"),
+        _rule(_is_string, "Поле description должно быть строкой"),
+    ],
+    "location": [
+        _rule(lambda value: value in LOCATIONS, f"Поле location должно быть одним из значений: {', '.join(LOCATIONS)}"),
+    ],
+    "published": [
+        _rule(lambda value: isinstance(value, bool), "Поле published должно быть булевым значением"),
+    ],
+    "genreId": [
+        _rule(lambda value: _is_number(value) and value > 0, "Поле genreId должно быть больше 0"),
+        _rule(_is_int, "Поле genreId должно быть целым числом"),
+        _rule(_is_number, "Поле genreId должно быть числом"),
+    ],
+}
+
+REQUIRED_MOVIE_FIELDS = ("name", "description", "published", "genreId")
+# Поля, которые при создании можно не передавать, и их значения по умолчанию
+DEFAULT_MOVIE_FIELDS = {"price": 100, "location": "MSK"}
+
+
+def validate_movie(data, partial=False):
+    """
+    :param data: Тело POST /movies или PATCH /movies/{id}.
+    :param partial: PATCH — проверяются только переданные поля.
+    :return: Список сообщений об ошибках (пустой, если данные корректны).
+    """
+    if not isinstance(data, dict):
+        return ["Тело запроса должно быть объектом"]
+    errors = []
+    for field, rules in MOVIE_RULES.items():
+        value = data.get(field)
+        if value is None or value == "":
+            if field in REQUIRED_MOVIE_FIELDS and not partial:
+                errors.extend(message for _, message in rules)
+                errors.append(f"Поле {field} не может быть пустым")
+            continue
+        errors.extend(message for check, message in rules if not check(value))
+    return errors
+
+
+def validate_movie_filters(query):
+    """
+    Проверяет параметры GET /movies.
+    :return: (фильтры для InMemoryStore.find_movies, номер страницы, размер страницы, список ошибок).
+    """
+    errors = []
+
+    def _int_param(name, default, minimum=None, maximum=None):
+        raw = query.get(name)
+        if raw is None:
+            return default
+        try:
+            value = int(raw)
+        except ValueError:
+            errors.append(f"Поле {name} должно быть целым числом")
+            return default
+        if minimum is not None and value < minimum:
+            errors.append(f"Поле {name} должно быть не меньше {minimum}")
+        if maximum is not None and value > maximum:
+            errors.append(f"Поле {name} должно быть не больше {maximum}")
+        return value
+
+    locations = [location for value in query.getall("locations", []) for location in value.split(",") if location]
+    if any(location not in LOCATIONS for location in locations):
+        errors.append(f"Каждое значение в поле locations должно быть одним из значений: {', '.join(LOCATIONS)}")
+
+    published = query.get("published")
+    if published is not None and published not in ("true", "false"):
+        errors.append("Поле published должно быть булевым значением")
+
+    created_at = query.get("createdAt", "desc")
+    if created_at not in ("asc", "desc"):
+        errors.append("Поле createdAt должно быть одним из значений: asc, desc")
+
+    filters = {
+        "locations": locations or None,
+        "genre_id": _int_param("genreId", None, minimum=1),
+        "min_price": _int_param("minPrice", 1, minimum=0),
+        "max_price": _int_param("maxPrice", 1000, minimum=0),
+        "published": None if published is None else published == "true",
+        "newest_first": created_at == "desc"
+    }
+    page = _int_param("page", 1, minimum=1)
+    page_size = _int_param("pageSize", 10, minimum=1, maximum=20)
+    return filters, page, page_size, errors
+
+
+def validate_registration(data):
+    """
+    Проверяет тело POST /register и POST /user.
+    """
+    if not isinstance(data, dict):
+        return ["Тело запроса должно быть объектом"]
+    errors = []
+    email = data.get("email")
+    if not _is_string(email) or "@" not in email:
+        errors.append("Некорректный email")
+    if not _is_string(data.get("fullName")) or not data.get("fullName"):
+        errors.append("Поле fullName не может быть пустым")
+    password = data.get("password")
+    if not _is_string(password) or len(password) < 8:
+        errors.append("Пароль должен содержать не менее 8 символов")
+    if "passwordRepeat" in data and data["passwordRepeat"] != password:
+        errors.append("Пароли не совпадают")
+    return errors
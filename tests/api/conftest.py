@@ -0,0 +1,43 @@
+import pytest
+import requests
+
+from api.api_manager import ApiManager
+from tests.api.local_server import LocalServer, fake_cinescope_app, point_to
+
+
+@pytest.fixture(scope="module")
+def local_server():
+    """
+    Локальный стенд Cinescope (fake_cinescope_app), свой у каждого модуля тестов.
+    """
+    with LocalServer(fake_cinescope_app()) as server:
+        yield server
+
+
+@pytest.fixture
+def local_api_manager_factory(local_server):
+    """
+    Фабрика ApiManager, направленных на local_server: local_api_manager_factory(session=None, **kwargs).
+    Без session создаётся новая requests.Session; сессии всех менеджеров закрываются после теста.
+    """
+    managers = []
+
+    def _make(session=None, **kwargs):
+        manager = point_to(ApiManager(session or requests.Session(), **kwargs), local_server.url)
+        managers.append(manager)
+        return manager
+
+    yield _make
+    for manager in managers:
+        manager.close_session()
+
+
+@pytest.fixture
+def local_api_manager(local_api_manager_factory, test_user):
+    """
+    ApiManager локального стенда, авторизованный новым зарегистрированным пользователем.
+    """
+    manager = local_api_manager_factory()
+    manager.auth_api.register_user(test_user)
+    manager.auth_api.authenticate([test_user["email"], test_user["password"]])
+    return manager
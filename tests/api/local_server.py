@@ -0,0 +1,21 @@
+from stand_in.app import create_app
+from stand_in.server import LocalServer
+
+__all__ = ["LocalServer", "fake_cinescope_app", "point_to"]
+
+
+def fake_cinescope_app():
+    """
+    Стенд Cinescope для тестов инфраструктуры (пулов, кэшей, батчей).
+    Роли не проверяются: зарегистрированному пользователю достаточно токена, чтобы создавать фильмы.
+    """
+    return create_app(enforce_roles=False)
+
+
+def point_to(manager, url):
+    """
+    Направляет все API-классы менеджера (ApiManager или AsyncApiManager) на адрес локального стенда.
+    """
+    for api in (manager.auth_api, manager.user_api, manager.movies_api):
+        api.base_url = url
+    return manager
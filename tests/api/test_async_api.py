@@ -0,0 +1,66 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from api.async_api_manager import AsyncApiManager
+from tests.api.local_server import point_to
+
+
+def run_with_manager(local_server, scenario):
+    """
+    Создаёт AsyncApiManager, направленный на локальный сервер, и выполняет сценарий.
+    """
+    async def _run():
+        manager = point_to(AsyncApiManager(aiohttp.ClientSession()), local_server.url)
+        try:
+            return await scenario(manager)
+        finally:
+            await manager.close_session()
+
+    return asyncio.run(_run())
+
+
+class TestAsyncApi:
+    def test_register_and_authenticate(self, local_server, test_user):
+        async def scenario(manager):
+            response = await manager.auth_api.register_user(test_user)
+            await manager.auth_api.authenticate([test_user["email"], test_user["password"]])
+            return response
+
+        response = run_with_manager(local_server, scenario)
+
+        assert response.status_code == 201
+        assert response.json()["email"] == test_user["email"]
+
+    def test_unexpected_status_raises(self, local_server):
+        async def scenario(manager):
+            await manager.auth_api.login_user({"email": "nobody@gmail.com", "password": "123"})
+
+        with pytest.raises(ValueError, match="Unexpected status code: 401"):
+            run_with_manager(local_server, scenario)
+
+    def test_expected_negative_status(self, local_server):
+        async def scenario(manager):
+            return await manager.auth_api.login_user({}, expected_status=401)
+
+        response = run_with_manager(local_server, scenario)
+
+        assert response.json()["message"] == "Неверный логин или пароль"
+
+    def test_concurrent_movie_creation(self, local_server, test_user, test_movie):
+        async def scenario(manager):
+            await manager.auth_api.register_user(test_user)
+            await manager.auth_api.authenticate([test_user["email"], test_user["password"]])
+
+            created = await asyncio.gather(*[
+                manager.movies_api.create_movie({**test_movie, "name": f"{test_movie['name']} {i}"})
+                for i in range(50)
+            ])
+            ids = [response.json()["id"] for response in created]
+            await asyncio.gather(*[manager.movies_api.delete_movie(movie_id) for movie_id in ids])
+            return ids
+
+        ids = run_with_manager(local_server, scenario)
+
+        assert len(set(ids)) == 50
@@ -2,7 +2,6 @@ import pytest
 from sqlalchemy.orm import Session
 
 from api.api_manager import ApiManager
-from conftest import api_manager
 from db_requester.models import UserDBModel
 from models.test_pydantic import RegisterUserResponse, AuthResponse
 
@@ -0,0 +1,134 @@
+import io
+import json
+import logging
+
+import pytest
+import requests
+
+from custom_requester.custom_requester import CustomRequester
+from custom_requester.metrics import LatencyHistogram, RequestMetrics, endpoint_template
+from custom_requester.transport import SharedTransport
+
+
+def make_response(payload, status_code=200):
+    """
+    Собирает requests.Response без обращения к сети.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode("utf-8")
+    response.request = requests.Request(
+        "POST", "https://api.example.test/movies", json={"name": "movie"}, headers=CustomRequester.base_headers
+    ).prepare()
+    return response
+
+
+class ExplodingResponse(requests.Response):
+    """
+    Ответ, который падает при любом обращении к телу.
+    """
+    @property
+    def text(self):
+        raise AssertionError("Тело ответа не должно форматироваться")
+
+
+@pytest.fixture
+def offline_requester():
+    requester = CustomRequester(session=requests.Session(), base_url="https://api.example.test/")
+    yield requester
+    requester.logger.setLevel(CustomRequester.log_level)
+
+
+class TestCustomRequesterLogging:
+    def test_disabled_info_skips_formatting(self, offline_requester):
+        offline_requester.logger.setLevel(logging.WARNING)
+        response = ExplodingResponse()
+        response.status_code = 200
+
+        offline_requester.log_request_and_response(response)
+
+    def test_large_body_is_truncated(self, offline_requester, caplog):
+        offline_requester.log_body_limit = 100
+        response = make_response({"movies": [{"name": f"movie {i}"} for i in range(100)]})
+
+        with caplog.at_level(logging.INFO, logger=offline_requester.logger.name):
+            offline_requester.log_request_and_response(response)
+
+        assert "chars truncated" in caplog.text
+        assert "movie 99" not in caplog.text
+
+    def test_small_json_body_is_pretty_printed(self, offline_requester, caplog):
+        response = make_response({"id": 1})
+
+        with caplog.at_level(logging.INFO, logger=offline_requester.logger.name):
+            offline_requester.log_request_and_response(response)
+
+        assert '"id": 1' in caplog.text
+        assert "curl -X POST 'https://api.example.test/movies'" in caplog.text
+
+    def test_message_is_formatted_once_for_all_handlers(self, offline_requester, monkeypatch):
+        from custom_requester import custom_requester
+
+        calls = []
+        format_response = custom_requester._format_response
+        monkeypatch.setattr(custom_requester, "_format_response",
+                            lambda *args: calls.append(1) or format_response(*args))
+        handlers = [logging.StreamHandler(io.StringIO()) for _ in range(3)]
+        for handler in handlers:
+            offline_requester.logger.addHandler(handler)
+        try:
+            offline_requester.log_request_and_response(make_response({"id": 1}))
+        finally:
+            for handler in handlers:
+                offline_requester.logger.removeHandler(handler)
+
+        assert len(calls) == 1
+        assert all('"id": 1' in handler.stream.getvalue() for handler in handlers)
+
+    def test_endpoint_sampling(self, offline_requester):
+        offline_requester.log_sampling = {"/movies*": 0, "/login": 1}
+
+        assert offline_requester._is_sampled("/movies/1") is False
+        assert offline_requester._is_sampled("/login") is True
+        assert offline_requester._is_sampled("/register") is True
+
+
+class TestRequestMetrics:
+    def test_endpoint_template(self):
+        assert endpoint_template("movies/42") == "/movies/{id}"
+        assert endpoint_template("/user/test@example.com") == "/user/{id}"
+        assert endpoint_template("user/0b8f6a2e-6f0e-4b8e-9d7e-1f2a3b4c5d6e") == "/user/{id}"
+        assert endpoint_template("//movies?page=2") == "/movies"
+
+    def test_histogram_percentiles_within_precision(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.01)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.01)
+        assert histogram.percentile(100) == pytest.approx(1.0)
+
+    def test_send_request_records_breakdown(self, tmp_path, local_server):
+        metrics = RequestMetrics()
+        transport = SharedTransport()
+        requester = CustomRequester(session=transport.new_session(), base_url=local_server.url)
+        requester.metrics = metrics
+        requester.send_request("GET", "movies", need_logging=False)
+        requester.send_request("GET", "movies", need_logging=False)
+        with pytest.raises(ValueError):
+            requester.send_request("GET", "movies/999", need_logging=False)
+        transport.close()
+
+        total = metrics.histogram("GET", "movies")
+        connect = metrics.histogram("GET", "movies", "connect")
+        assert total.count == 2
+        assert connect.max > 0 and connect.min == 0
+        assert metrics.histogram("get", "movies/1").count == 1
+        assert "GET /movies/{id}" in metrics.report()
+
+        path = tmp_path / "metrics.json"
+        metrics.dump_json(path)
+        restored = RequestMetrics.load_json(path)
+        assert restored.summary() == metrics.summary()
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+import requests
+from pydantic import ValidationError
+
+from models.fast_validation import list_adapter, validate_page, validate_response, validate_items
+from models.test_pydantic import GetUserResponse, MovieResponse
+
+
+def make_response(payload):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode("utf-8")
+    return response
+
+
+def make_movie(movie_id, **overrides):
+    return {"id": movie_id, "name": f"Movie {movie_id}", "price": 100, "location": "MSK",
+            "published": True, "genreId": 1, **overrides}
+
+
+class TestFastValidation:
+    def test_validate_response_from_bytes(self):
+        user = {"id": "1", "email": "user@gmail.com", "fullName": "User", "verified": True, "banned": False,
+                "roles": ["USER"], "createdAt": "2025-06-01T12:00:00"}
+
+        assert validate_response(GetUserResponse, make_response(user)).email == user["email"]
+
+    def test_validate_page(self):
+        response = make_response({"movies": [make_movie(i) for i in range(5)], "count": 5, "pageCount": 1})
+
+        movies = validate_page(MovieResponse, response)
+
+        assert [movie.id for movie in movies] == list(range(5))
+
+    def test_invalid_item_fails_full_validation(self):
+        response = make_response({"movies": [make_movie(1), make_movie(2, price="дорого")]})
+
+        with pytest.raises(ValidationError):
+            validate_page(MovieResponse, response)
+
+    def test_sampled_validation_checks_every_nth_item(self):
+        items = [make_movie(i) for i in range(10)]
+        items[4]["price"] = "дорого"
+
+        sampled = validate_items(MovieResponse, items, sample_every=3)
+
+        assert [movie.id for movie in sampled] == [0, 3, 6, 9]
+        with pytest.raises(ValidationError):
+            validate_items(MovieResponse, items, sample_every=1)
+
+    def test_adapters_are_cached(self):
+        assert list_adapter(MovieResponse) is list_adapter(MovieResponse)
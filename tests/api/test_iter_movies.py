@@ -0,0 +1,50 @@
+import pytest
+
+
+class TestIterMovies:
+    @pytest.fixture
+    def seeded_movies(self, local_api_manager, test_movie):
+        movies_data = [
+            {**test_movie, "name": f"{test_movie['name']} {i}", "genreId": 777, "price": i + 1,
+             "location": "MSK" if i % 2 else "SPB"}
+            for i in range(25)
+        ]
+        created = local_api_manager.movies_api.create_movies(movies_data)
+        ids = [result.response.json()["id"] for result in created]
+        yield ids
+        local_api_manager.movies_api.delete_movies(ids)
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_walks_all_pages(self, local_api_manager, seeded_movies, prefetch):
+        movies = list(local_api_manager.movies_api.iter_movies({"genreId": 777}, page_size=10, prefetch=prefetch))
+
+        assert sorted(movie.id for movie in movies) == sorted(seeded_movies)
+
+    def test_filters_apply_to_every_page(self, local_api_manager, seeded_movies):
+        movies = list(local_api_manager.movies_api.iter_movies(
+            {"genreId": 777, "locations": "MSK", "minPrice": 5, "maxPrice": 20}, page_size=3
+        ))
+
+        assert movies
+        assert all(movie.location == "MSK" and 5 <= movie.price <= 20 for movie in movies)
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_early_stop_fetches_lazily(self, local_api_manager, seeded_movies, monkeypatch, prefetch):
+        movies_api = local_api_manager.movies_api
+        pages = []
+        get_movies = movies_api.get_movies
+
+        def spy_get_movies(params=None, **kwargs):
+            pages.append(params["page"])
+            return get_movies(params=params, **kwargs)
+
+        monkeypatch.setattr(movies_api, "get_movies", spy_get_movies)
+        iterator = movies_api.iter_movies({"genreId": 777}, page_size=5, prefetch=prefetch)
+
+        first = next(iterator)
+        iterator.close()
+
+        # 25 фильмов — 5 страниц; после первого элемента загружена только первая (и, с prefetch, вторая)
+        assert first.id in seeded_movies
+        assert 1 <= len(pages) <= 1 + prefetch
+        assert set(pages) <= {1, 2}
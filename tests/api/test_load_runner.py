@@ -0,0 +1,80 @@
+import json
+
+import pytest
+import requests
+
+from api.auth_api import AuthAPI
+from custom_requester.custom_requester import CustomRequester
+from load_testing import runner
+from load_testing.__main__ import main
+from load_testing.runner import LoadConfig, run_load
+from load_testing.stats import percentile
+
+
+@pytest.fixture
+def load_user(local_server, test_user):
+    auth_api = AuthAPI(requests.Session())
+    auth_api.base_url = local_server.url
+    auth_api.register_user(test_user)
+    return test_user["email"], test_user["password"]
+
+
+class TestLoadRunner:
+    def test_percentile(self):
+        values = list(range(1, 101))
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 95) == 0.0
+
+    def test_all_scenarios_report_latency(self, local_server, load_user):
+        stats = run_load(LoadConfig(
+            users=4, duration=1, email=load_user[0], password=load_user[1],
+            auth_url=local_server.url, api_url=local_server.url, seed=1
+        ))
+
+        summary = stats.summary()
+        assert set(summary) == {"POST /login", "GET /movies", "GET /movies/{id}", "POST /movies"}
+        assert all(row["errors"] == 0 for row in summary.values())
+        assert all(row["p50"] <= row["p95"] <= row["p99"] for row in summary.values())
+
+    def test_target_rps_is_respected(self, local_server, load_user):
+        stats = run_load(LoadConfig(
+            users=4, duration=1, target_rps=40, weights={"get_movies": 1},
+            email=load_user[0], password=load_user[1], auth_url=local_server.url, api_url=local_server.url
+        ))
+
+        assert 25 <= stats.summary()["GET /movies"]["requests"] <= 45
+
+    def test_fallback_errors_are_recorded_under_fallback_endpoint(self, local_server, load_user):
+        stats = run_load(LoadConfig(
+            users=1, duration=0.3, weights={"get_movie_by_id": 1}, email=load_user[0], password=load_user[1],
+            auth_url=local_server.url, api_url=f"{local_server.url}missing/"
+        ))
+
+        summary = stats.summary()
+        assert set(summary) == {"GET /movies"}
+        assert summary["GET /movies"]["errors"] == summary["GET /movies"]["requests"] > 0
+
+    def test_requester_settings_are_restored_after_failure(self, monkeypatch):
+        def fail(*args):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(runner, "_run_users", fail)
+        before = CustomRequester.log_level, CustomRequester.retry_policy
+        with pytest.raises(RuntimeError):
+            run_load(LoadConfig(users=1, duration=0))
+
+        assert (CustomRequester.log_level, CustomRequester.retry_policy) == before
+
+    def test_cli_writes_json_summary(self, local_server, load_user, tmp_path):
+        json_path = tmp_path / "load.json"
+
+        main([
+            "--users", "2", "--duration", "0.5", "--ramp-up", "0.2", "--weights", "get_movies=1,create_movie=1",
+            "--email", load_user[0], "--password", load_user[1],
+            "--auth-url", local_server.url, "--api-url", local_server.url, "--json", str(json_path)
+        ])
+
+        summary = json.loads(json_path.read_text(encoding="utf-8"))
+        assert summary["endpoints"]["POST /movies"]["requests"] > 0
@@ -0,0 +1,28 @@
+class TestMoviesBatch:
+    def test_create_and_delete_movies_keep_input_order(self, local_api_manager, test_movie):
+        movies_data = [{**test_movie, "name": f"{test_movie['name']} {i}"} for i in range(30)]
+
+        created = local_api_manager.movies_api.create_movies(movies_data, concurrency=8)
+
+        assert all(result.ok for result in created)
+        assert [result.response.json()["name"] for result in created] == [movie["name"] for movie in movies_data]
+
+        ids = [result.response.json()["id"] for result in created]
+        deleted = local_api_manager.movies_api.delete_movies(ids, concurrency=8)
+
+        assert [result.response.json()["id"] for result in deleted] == ids
+
+    def test_errors_are_reported_per_item(self, local_api_manager, test_movie):
+        movies_data = [test_movie, test_movie]
+
+        results = local_api_manager.movies_api.create_movies(movies_data, concurrency=1)
+
+        assert results[0].ok
+        assert isinstance(results[1].error, ValueError)
+        local_api_manager.movies_api.delete_movie(results[0].response.json()["id"])
+
+    def test_error_budget_stops_early(self, local_api_manager):
+        results = local_api_manager.movies_api.delete_movies([99999, 99998, 99997, 99996], concurrency=1, max_errors=0)
+
+        assert results[0].error is not None
+        assert all(result.skipped for result in results[1:])
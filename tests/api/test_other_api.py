@@ -16,20 +16,20 @@ class TestAccountTransactionTemplate:
     1. Создание двух счетов: Stan и Bob.
     2. Перевод 200 единиц от Stan к Bob.
     3. Проверка изменения балансов.
-    4. Очистка тестовых данных.
+    Тест выполняется в транзакции, которая откатывается после него, поэтому данные не нужно удалять.
     """)
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.label("qa_name", "Ivan Petrovich")
     @allure.title("Тест перевода денег между счетами 200 рублей")
-    def test_accounts_transaction_template(self, db_session):
+    def test_accounts_transaction_template(self, db_transaction):
         stan_name = f"Stan_{DataGenerator.generate_random_int(10)}"
         bob_name = f"Bob_{DataGenerator.generate_random_int(10)}"
 
         with allure.step("Создание тестовых данных в базе данных: счета Stan и Bob"):
             stan = AccountTransactionTemplate(user=stan_name, balance=1000)
             bob = AccountTransactionTemplate(user=bob_name, balance=500)
-            db_session.add_all([stan, bob])
-            db_session.commit()
+            db_transaction.add_all([stan, bob])
+            db_transaction.commit()
 
         def transfer_money(session, from_user, to_user, amount):
             with allure.step("Получаем счета"):
@@ -55,7 +55,7 @@ class TestAccountTransactionTemplate:
         try:
             with allure.step("Выполняем перевод 200 единиц от stan к bob"):
                 updated_stan, updated_bob = transfer_money(
-                    db_session,
+                    db_transaction,
                     from_user=stan_name,
                     to_user=bob_name,
                     amount=200
@@ -67,16 +67,9 @@ class TestAccountTransactionTemplate:
 
         except Exception as e:
             with allure.step("ОШИБКА откаты транзакции"):
-                db_session.rollback()
+                db_transaction.rollback()
             pytest.fail(f"Ошибка при переводе денег: {e}")
 
-        finally:
-            with allure.step("Удаляем данные для тестирования из базы"):
-                db_session.query(AccountTransactionTemplate).filter(
-                    AccountTransactionTemplate.user.in_([stan_name, bob_name])
-                ).delete(synchronize_session=False)
-                db_session.commit()
-
 
 # Тесты для DELETE /movies/{id}
 def test_delete_movie_positive(create_test_movie, super_admin, db_session):
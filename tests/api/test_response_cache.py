@@ -0,0 +1,78 @@
+import time
+
+import pytest
+import requests
+
+from api.api_manager import ApiManager
+from custom_requester.response_cache import ResponseCache
+from stand_in import LocalServer, create_app
+from tests.api.local_server import point_to
+
+ADMIN_CREDS = ("admin@stand-in.test", "Admin12345")
+
+
+@pytest.fixture(scope="module")
+def stand_in():
+    with LocalServer(create_app(super_admin=ADMIN_CREDS, seed_movies=5)) as server:
+        yield server
+
+
+@pytest.fixture
+def cached_manager(stand_in):
+    manager = point_to(ApiManager(requests.Session(), response_cache=ResponseCache(ttl=60, max_entries=3)),
+                       stand_in.url)
+    manager.auth_api.authenticate(ADMIN_CREDS)
+    yield manager
+    manager.close_session()
+
+
+class TestResponseCache:
+    def test_identical_get_is_served_from_cache(self, cached_manager):
+        first = cached_manager.movies_api.get_movies(params={"locations": "MSK", "pageSize": 5})
+        second = cached_manager.movies_api.get_movies(params={"pageSize": 5, "locations": "MSK"})
+        other = cached_manager.movies_api.get_movies(params={"locations": "SPB"})
+
+        assert second is first
+        assert other is not first
+        assert cached_manager.response_cache.stats()["hits"] == 1
+
+    def test_update_and_delete_invalidate_movie(self, cached_manager, test_movie):
+        movie_id = cached_manager.movies_api.create_movie(test_movie).json()["id"]
+        assert cached_manager.movies_api.get_movie_by_id(movie_id).json()["price"] == test_movie["price"]
+
+        cached_manager.movies_api.update_movie(movie_id, {"price": 777})
+        assert cached_manager.movies_api.get_movie_by_id(movie_id).json()["price"] == 777
+
+        cached_manager.movies_api.delete_movie(movie_id)
+        cached_manager.movies_api.get_movie_by_id(movie_id, expected_status=404)
+        assert cached_manager.response_cache.stats()["invalidated"] == 2
+
+    def test_stale_entry_is_revalidated_with_etag(self, cached_manager):
+        cached_manager.response_cache.ttl = 0.05
+        first = cached_manager.movies_api.get_movie_by_id(1)
+        time.sleep(0.1)
+
+        second = cached_manager.movies_api.get_movie_by_id(1)
+
+        assert second is first
+        assert cached_manager.response_cache.stats()["revalidated"] == 1
+
+    def test_lru_eviction(self, cached_manager):
+        for movie_id in (1, 2, 3):
+            cached_manager.movies_api.get_movie_by_id(movie_id)
+        cached_manager.movies_api.get_movie_by_id(1)
+        cached_manager.movies_api.get_movie_by_id(4)
+
+        stats = cached_manager.response_cache.stats()
+        assert (stats["entries"], stats["evictions"]) == (3, 1)
+        cached_manager.movies_api.get_movie_by_id(1)
+        assert cached_manager.response_cache.stats()["hits"] == 2
+
+    def test_responses_are_not_shared_between_tokens(self, cached_manager, stand_in):
+        anonymous = ApiManager(requests.Session(), response_cache=cached_manager.response_cache)
+        anonymous.movies_api.base_url = stand_in.url
+
+        cached_manager.movies_api.get_movie_by_id(1)
+        anonymous.movies_api.get_movie_by_id(1)
+
+        assert cached_manager.response_cache.stats()["misses"] == 2
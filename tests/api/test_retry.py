@@ -0,0 +1,160 @@
+import socket
+from collections import Counter
+
+import pytest
+import requests
+from aiohttp import web
+
+from custom_requester.custom_requester import CustomRequester
+from custom_requester.metrics import RequestMetrics
+from custom_requester.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from stand_in import LocalServer
+
+
+def flaky_app(calls):
+    """
+    /flaky/{n} отвечает 503 первые n раз, затем 200; /down — всегда 503.
+    """
+    async def flaky(request):
+        calls[request.path] += 1
+        failures = int(request.match_info.get("failures", 10 ** 6))
+        if calls[request.path] <= failures:
+            return web.json_response({"message": "Service Unavailable"}, status=503)
+        return web.json_response({"attempt": calls[request.path]})
+
+    app = web.Application()
+    app.router.add_route("*", "/flaky/{failures}", flaky)
+    app.router.add_route("*", "/down", flaky)
+    return app
+
+
+@pytest.fixture(scope="module")
+def calls():
+    return Counter()
+
+
+@pytest.fixture(scope="module")
+def flaky_server(calls):
+    with LocalServer(flaky_app(calls)) as server:
+        yield server
+
+
+@pytest.fixture
+def make_requester(flaky_server):
+    def _make(base_url=flaky_server.url, **policy):
+        requester = CustomRequester(session=requests.Session(), base_url=base_url)
+        requester.retry_policy = RetryPolicy(**{"backoff_factor": 0, **policy})
+        requester.metrics = RequestMetrics()
+        return requester
+
+    return _make
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestRetryPolicy:
+    def test_backoff_grows_and_is_capped(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=3, jitter=0)
+
+        assert [policy.backoff(attempt) for attempt in (1, 2, 3, 4)] == [1, 2, 3, 3]
+
+    def test_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(backoff_factor=1, jitter=0.5)
+
+        assert all(0.5 <= policy.backoff(1) <= 1 for _ in range(100))
+
+    def test_get_is_retried_until_success(self, make_requester, calls):
+        requester = make_requester()
+
+        response = requester.send_request("GET", "flaky/2", need_logging=False)
+
+        assert response.json()["attempt"] == 3
+        assert requester.metrics.counter("GET", "flaky/2", "retries") == 2
+
+    def test_post_is_not_retried_without_guard(self, make_requester, calls):
+        requester = make_requester()
+
+        with pytest.raises(ValueError, match="503"):
+            requester.send_request("POST", "flaky/1", data={}, need_logging=False)
+
+        assert calls["/flaky/1"] == 1
+
+    def test_post_is_retried_with_guard(self, make_requester, calls):
+        requester = make_requester(max_attempts=4)
+        checks = []
+
+        response = requester.send_request(
+            "POST", "flaky/3", data={}, need_logging=False, idempotency_guard=lambda: checks.append(1) or True
+        )
+
+        assert response.status_code == 200
+        assert len(checks) == calls["/flaky/3"] - 1 == 3
+
+    def test_unsent_post_is_retried(self, make_requester):
+        requester = make_requester(base_url=f"http://127.0.0.1:{free_port()}/")
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            requester.send_request("POST", "movies", data={}, need_logging=False)
+
+        assert requester.metrics.counter("POST", "movies", "retries") == 2
+
+    def test_attempts_and_budget_limit_retries(self, make_requester, calls):
+        requester = make_requester(max_attempts=5, backoff_factor=0.2, jitter=0, total_budget=0.7)
+
+        requester.send_request("GET", "flaky/100", expected_status=503, need_logging=False)
+
+        assert calls["/flaky/100"] == 3  # паузы 0.2 и 0.4 укладываются в бюджет, следующая (0.8) — уже нет
+
+    def test_circuit_breaker_fails_fast(self, make_requester, calls):
+        requester = make_requester(max_attempts=2, failure_threshold=3, reset_timeout=60)
+
+        requester.send_request("GET", "down", expected_status=503, need_logging=False)
+        requester.send_request("GET", "down", expected_status=503, need_logging=False)
+        with pytest.raises(CircuitOpenError):
+            requester.send_request("GET", "down", need_logging=False)
+
+        assert calls["/down"] == 3
+        assert requester.metrics.counter("GET", "down", "rejected") == 1
+        assert "rejected" in requester.metrics.report()
+
+    def test_half_open_breaker_lets_one_probe_through(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr("custom_requester.retry.time.monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        breaker.record_failure()
+        now[0] = 11
+
+        breaker.before_request("host")
+        with pytest.raises(CircuitOpenError, match="пробный"):
+            breaker.before_request("host")
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("host")
+
+        now[0] = 22
+        breaker.before_request("host")
+        breaker.record_success()
+        breaker.before_request("host")
+
+    def test_reset_forgets_open_breakers(self):
+        policy = RetryPolicy(failure_threshold=1)
+        host, breaker = policy.breaker("http://down.test/")
+        breaker.record_failure()
+
+        policy.reset()
+
+        policy.breaker("http://down.test/")[1].before_request(host)
+
+    def test_create_user_guard_checks_user_is_missing(self, local_api_manager_factory, test_user):
+        manager = local_api_manager_factory()
+        manager.auth_api.register_user(test_user)
+        manager.auth_api.authenticate((test_user["email"], test_user["password"]))
+        new_user = {**test_user, "email": f"guard.{test_user['email']}", "verified": True, "banned": False}
+
+        assert manager.user_api._is_missing(new_user["email"]) is True
+        manager.user_api.create_user(new_user)
+        assert manager.user_api._is_missing(new_user["email"]) is False
@@ -0,0 +1,116 @@
+import pytest
+import requests
+
+from api.api_manager import ApiManager
+from stand_in import LocalServer, create_app
+from stand_in import app as stand_in_app
+from stand_in.app import STAND_IN_KEY
+from tests.api.local_server import point_to
+
+ADMIN_CREDS = ("admin@stand-in.test", "Admin12345")
+
+
+@pytest.fixture(scope="module")
+def stand_in():
+    with LocalServer(create_app(super_admin=ADMIN_CREDS, seed_movies=30)) as server:
+        yield server
+
+
+def make_manager(stand_in):
+    return point_to(ApiManager(requests.Session()), stand_in.url)
+
+
+@pytest.fixture
+def admin(stand_in):
+    manager = make_manager(stand_in)
+    manager.auth_api.authenticate(ADMIN_CREDS)
+    yield manager
+    manager.close_session()
+
+
+@pytest.fixture
+def common_api(stand_in, test_user):
+    manager = make_manager(stand_in)
+    manager.auth_api.register_user(test_user)
+    manager.auth_api.authenticate([test_user["email"], test_user["password"]])
+    yield manager
+    manager.close_session()
+
+
+class TestStandInMovies:
+    def test_filters_and_pagination(self, admin):
+        response = admin.movies_api.get_movies(params={"locations": "MSK", "pageSize": 5, "page": 2})
+        data = response.json()
+
+        assert data["count"] == 15
+        assert data["pageCount"] == 3
+        assert len(data["movies"]) == 5
+        assert all(movie["location"] == "MSK" for movie in data["movies"])
+
+        prices = admin.movies_api.get_movies(params={"minPrice": 10, "maxPrice": 12, "genreId": 1}).json()["movies"]
+        assert [movie["price"] for movie in prices] == [11]
+
+    def test_invalid_location_filter(self, admin):
+        response = admin.movies_api.get_movies(params={"locations": "EKB"}, expected_status=400)
+
+        assert response.json()["message"][0] == "Каждое значение в поле locations должно быть одним из значений: MSK, SPB"
+
+    def test_crud_and_duplicate(self, admin, test_movie):
+        movie_id = admin.movies_api.create_movie(test_movie).json()["id"]
+
+        response = admin.movies_api.create_movie(test_movie, expected_status=409)
+        assert response.json()["message"] == "Фильм с таким названием уже существует"
+
+        updated = admin.movies_api.update_movie(movie_id, {"price": 400, "published": False}).json()
+        assert (updated["price"], updated["published"]) == (400, False)
+
+        admin.movies_api.delete_movie(movie_id)
+        response = admin.movies_api.get_movie_by_id(movie_id, expected_status=404)
+        assert "не найден" in response.json()["message"]
+
+    def test_missing_required_fields(self, admin):
+        response = admin.movies_api.create_movie({"price": 100, "location": "MSK"}, expected_status=400)
+
+        assert len(response.json()["message"]) == 12
+        assert "Поле genreId должно быть целым числом" in response.json()["message"]
+
+    def test_invalid_update_reports_fields_in_order(self, admin, test_movie):
+        movie_id = admin.movies_api.create_movie(test_movie).json()["id"]
+
+        response = admin.movies_api.update_movie(movie_id, {"price": -100, "location": "INVALID"}, expected_status=400)
+
+        assert "price" in response.json()["message"][0].lower()
+        assert "location" in response.json()["message"][1].lower()
+        admin.movies_api.delete_movie(movie_id)
+
+
+class TestStandInRoles:
+    def test_common_user_cannot_manage(self, common_api, test_movie, test_user):
+        common_api.movies_api.create_movie(test_movie, expected_status=403)
+        common_api.user_api.get_user(test_user["email"], expected_status=403)
+
+    def test_anonymous_is_unauthorized(self, stand_in, test_movie):
+        make_manager(stand_in).movies_api.create_movie(test_movie, expected_status=401)
+
+    def test_least_recently_used_token_is_revoked(self, stand_in, admin, test_user, monkeypatch):
+        monkeypatch.setattr(stand_in_app, "MAX_TOKENS", 3)
+        manager = make_manager(stand_in)
+        manager.auth_api.register_user(test_user)
+        creds = [test_user["email"], test_user["password"]]
+        manager.auth_api.authenticate(creds, use_cache=False)
+        for _ in range(3):
+            admin.user_api.get_user(test_user["email"])  # токен админа используется и не отзывается
+            manager.auth_api.login_user({"email": creds[0], "password": creds[1]})
+
+        assert len(stand_in.app[STAND_IN_KEY].tokens) == 3
+        admin.user_api.get_user(test_user["email"])
+        manager.user_api.get_user(test_user["email"], expected_status=401)
+        manager.close_session()
+
+    def test_admin_creates_verified_user(self, admin, creation_user_data):
+        created = admin.user_api.create_user(creation_user_data).json()
+
+        by_email = admin.user_api.get_user(creation_user_data["email"]).json()
+        assert by_email == admin.user_api.get_user(created["id"]).json()
+        assert by_email["verified"] is True
+        assert "password" not in by_email
@@ -0,0 +1,87 @@
+import base64
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from api.auth_api import AuthAPI
+from api.token_cache import TokenCache, jwt_expiry
+
+
+def make_jwt(expires_in):
+    def encode(part):
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).rstrip(b"=").decode()
+    return f"{encode({'alg': 'HS256'})}.{encode({'exp': time.time() + expires_in})}.signature"
+
+
+class LoginCounter:
+    def __init__(self, expires_in=3600):
+        self.calls = 0
+        self.expires_in = expires_in
+
+    def __call__(self):
+        self.calls += 1
+        return make_jwt(self.expires_in)
+
+
+class TestTokenCache:
+    def test_jwt_expiry(self):
+        assert jwt_expiry(make_jwt(100)) == pytest.approx(time.time() + 100, abs=5)
+        assert jwt_expiry("not-a-jwt") is None
+
+    def test_valid_token_is_reused(self):
+        cache = TokenCache()
+        login = LoginCounter()
+
+        tokens = {cache.get_token("admin", login) for _ in range(5)}
+
+        assert len(tokens) == 1
+        assert cache.stats() == {"hits": 4, "logins": 1}
+
+    def test_token_is_refreshed_before_expiry(self):
+        cache = TokenCache(refresh_margin=60)
+        login = LoginCounter(expires_in=30)
+
+        cache.get_token("admin", login)
+        cache.get_token("admin", login)
+
+        assert login.calls == 2
+
+    def test_concurrent_requests_login_once(self):
+        cache = TokenCache()
+        login = LoginCounter()
+
+        threads = [threading.Thread(target=cache.get_token, args=("admin", login)) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert login.calls == 1
+        assert cache.stats()["hits"] == 19
+
+    def test_file_backed_cache_is_shared(self, tmp_path):
+        login = LoginCounter()
+        first_process = TokenCache(path=tmp_path / "tokens.json")
+        second_process = TokenCache(path=tmp_path / "tokens.json")
+
+        token = first_process.get_token("admin", login)
+
+        assert second_process.get_token("admin", login) == token
+        assert login.calls == 1
+
+    def test_authenticate_uses_cache(self, local_server, test_user):
+        auth_api = AuthAPI(requests.Session())
+        auth_api.base_url = local_server.url
+        auth_api.token_cache = TokenCache()
+        auth_api.register_user(test_user)
+        creds = (test_user["email"], test_user["password"])
+
+        auth_api.authenticate(creds)
+        auth_api.authenticate(creds)
+        auth_api.authenticate(creds, use_cache=False)
+
+        assert auth_api.token_cache.stats() == {"hits": 1, "logins": 1}
+        assert auth_api.session.headers["authorization"].startswith("Bearer ")
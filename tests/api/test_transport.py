@@ -0,0 +1,56 @@
+import pytest
+
+from custom_requester.transport import SharedTransport
+
+
+@pytest.fixture
+def transport():
+    transport = SharedTransport(pool_maxsize=4)
+    yield transport
+    transport.close()
+
+
+class TestSharedTransport:
+    def test_connections_are_reused_across_managers(self, transport, local_api_manager_factory):
+        first = local_api_manager_factory(transport.new_session())
+        second = local_api_manager_factory(transport.new_session())
+
+        for _ in range(5):
+            first.movies_api.get_movies()
+            second.movies_api.get_movies()
+
+        host_stats = next(iter(transport.stats().values()))
+        assert host_stats["requests"] == 10
+        assert host_stats["misses"] == 1
+        assert host_stats["hits"] == 9
+
+    def test_auth_headers_are_isolated(self, transport, local_api_manager_factory, test_user):
+        admin = local_api_manager_factory(transport.new_session())
+        anonymous = local_api_manager_factory(transport.new_session())
+
+        admin.auth_api.register_user(test_user)
+        admin.auth_api.authenticate([test_user["email"], test_user["password"]])
+
+        assert "authorization" in admin.session.headers
+        assert "authorization" not in anonymous.session.headers
+        anonymous.movies_api.create_movie({"name": "movie"}, expected_status=401)
+
+    def test_closing_session_keeps_shared_pool(self, transport, local_api_manager_factory):
+        first = local_api_manager_factory(transport.new_session())
+        second = local_api_manager_factory(transport.new_session())
+
+        first.movies_api.get_movies()
+        first.close_session()
+        second.movies_api.get_movies()
+
+        assert next(iter(transport.stats().values()))["hits"] == 1
+
+    def test_keep_alive_disabled(self, local_api_manager_factory):
+        transport = SharedTransport(keep_alive=False)
+        manager = local_api_manager_factory(transport.new_session())
+
+        manager.movies_api.get_movies()
+        manager.movies_api.get_movies()
+
+        assert next(iter(transport.stats().values()))["misses"] == 2
+        transport.close()
@@ -0,0 +1,106 @@
+import pytest
+
+from constants import Roles
+from custom_requester.transport import SharedTransport
+from entities.user import User
+from entities.user_pool import UserPool
+
+
+@pytest.fixture
+def local_api_factory(local_api_manager_factory):
+    transport = SharedTransport()
+    yield lambda: local_api_manager_factory(transport.new_session())
+    transport.close()
+
+
+@pytest.fixture
+def local_admin(local_api_factory, test_user):
+    api = local_api_factory()
+    api.auth_api.register_user(test_user)
+    admin = User(test_user["email"], test_user["password"], [Roles.SUPER_ADMIN.value], api)
+    admin.api.auth_api.authenticate(admin.creds)
+    return admin
+
+
+@pytest.fixture
+def make_pool(local_admin, local_api_factory):
+    """
+    Создаёт пулы с local_admin и удаляет их пользователей после теста, даже если тест упал.
+    """
+    pools = []
+
+    def _make(**kwargs):
+        pool = UserPool(local_admin, local_api_factory, **kwargs)
+        pools.append(pool)
+        return pool.provision()
+
+    yield _make
+    for pool in pools:
+        pool.teardown()
+
+
+class TestUserPool:
+    def test_provision_lease_and_teardown(self, local_admin, make_pool):
+        pool = make_pool(size_per_role=3, roles=(Roles.USER, Roles.ADMIN))
+
+        assert len(pool.users) == 6
+        with pool.leased(Roles.ADMIN) as admin_user:
+            assert admin_user.roles == [Roles.ADMIN.value]
+            assert "authorization" in admin_user.api.session.headers
+            local_admin.api.user_api.get_user(admin_user.email)
+
+        emails = [user.email for user in pool.users]
+        pool.teardown()
+
+        for email in emails:
+            local_admin.api.user_api.get_user(email, expected_status=404)
+
+    def test_release_resets_changed_user(self, local_admin, make_pool):
+        pool = make_pool(size_per_role=1)
+
+        user = pool.lease()
+        user_id = local_admin.api.user_api.get_user(user.email).json()["id"]
+        local_admin.api.user_api.update_user(user_id, {"banned": True})
+        pool.mark_changed(user)
+        user.api.movies_api._update_session_headers(**{"X-Test": "dirty"})
+        pool.release(user)
+
+        same_user = pool.lease()
+        assert same_user is user
+        assert "X-Test" not in same_user.api.session.headers
+        assert "X-Test" not in same_user.api.movies_api.headers
+        assert local_admin.api.user_api.get_user(user.email).json()["banned"] is False
+        pool.release(same_user)
+
+    def test_unchanged_user_is_released_without_request(self, local_admin, make_pool, monkeypatch):
+        pool = make_pool(size_per_role=1)
+        updates = []
+        monkeypatch.setattr(local_admin.api.user_api, "update_user", lambda *args, **kwargs: updates.append(args))
+
+        with pool.leased():
+            pass
+
+        assert updates == []
+
+    def test_failed_deletes_are_reported(self, local_admin, make_pool, monkeypatch):
+        pool = make_pool(size_per_role=1)
+        user_ids = list(pool._user_ids.values())
+        delete_user = local_admin.api.user_api.delete_user
+
+        def flaky_delete(user_id, **kwargs):
+            if user_id == user_ids[0]:
+                raise ValueError("Unexpected status code: 500. Expected: 200")
+            return delete_user(user_id, **kwargs)
+
+        monkeypatch.setattr(local_admin.api.user_api, "delete_user", flaky_delete)
+        with pytest.raises(RuntimeError, match="Не удалось удалить"):
+            pool.teardown()
+        monkeypatch.undo()
+        delete_user(user_ids[0])
+
+    def test_lease_timeout(self, make_pool):
+        pool = make_pool(size_per_role=1, lease_timeout=0.1)
+
+        pool.lease()
+        with pytest.raises(TimeoutError):
+            pool.lease()
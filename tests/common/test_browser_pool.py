@@ -0,0 +1,123 @@
+from common.browser_pool import BrowserPool
+
+
+class FakePage:
+    def __init__(self, context, url="about:blank"):
+        self.context = context
+        self.url = url
+        self.storage = {}
+
+    def evaluate(self, script):
+        self.storage.clear()
+
+    def close(self):
+        self.context.pages.remove(self)
+
+
+class FakeContext:
+    def __init__(self, **options):
+        self.options = options
+        self.pages = []
+        self.cookies = []
+        self.closed = False
+
+    def new_page(self, url="about:blank"):
+        page = FakePage(self, url)
+        self.pages.append(page)
+        return page
+
+    def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    def clear_cookies(self):
+        self.cookies.clear()
+
+    def clear_permissions(self):
+        pass
+
+    def storage_state(self):
+        return {"cookies": self.cookies, "origins": [{"origin": page.url} for page in self.pages if page.storage]}
+
+    def set_default_timeout(self, timeout):
+        self.timeout = timeout
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **options):
+        return FakeContext(**options)
+
+    def close(self):
+        self.connected = False
+
+
+def make_pool(size=2):
+    return BrowserPool(FakeBrowser, size=size, default_timeout=1000)
+
+
+class TestBrowserPool:
+    def test_browser_is_launched_once_and_contexts_are_reused(self):
+        pool = make_pool()
+
+        for _ in range(5):
+            context = pool.acquire()
+            context.new_page("http://cinescope.local/").storage["token"] = "abc"
+            context.add_cookies([{"name": "session"}])
+            pool.release(context)
+
+        assert pool.stats() == {"launches": 1, "contexts_created": 1, "contexts_reused": 4, "contexts_discarded": 0}
+        assert (context.pages, context.cookies, context.timeout) == ([], [], 1000)
+
+    def test_pool_keeps_at_most_size_contexts(self):
+        pool = make_pool(size=1)
+        contexts = [pool.acquire() for _ in range(3)]
+        for context in contexts:
+            pool.release(context)
+
+        assert [context.closed for context in contexts] == [False, True, True]
+        assert pool.stats()["contexts_discarded"] == 2
+
+    def test_cookie_state_is_added_to_reused_context(self):
+        pool = make_pool()
+        pool.release(pool.acquire())
+
+        context = pool.acquire(storage_state={"cookies": [{"name": "auth"}], "origins": []})
+
+        assert context.cookies == [{"name": "auth"}]
+        assert pool.stats()["contexts_reused"] == 1
+
+    def test_local_storage_state_needs_new_context(self):
+        pool = make_pool()
+        pool.release(pool.acquire())
+        state = {"cookies": [], "origins": [{"origin": "http://cinescope.local", "localStorage": []}]}
+
+        context = pool.acquire(storage_state=state)
+
+        assert context.options == {"storage_state": state}
+        assert pool.stats()["contexts_created"] == 2
+
+    def test_browser_is_relaunched_after_crash(self):
+        pool = make_pool()
+        pool.release(pool.acquire())
+        pool.browser.connected = False
+
+        pool.acquire()
+
+        assert (pool.stats()["launches"], pool.stats()["contexts_reused"]) == (2, 0)
+
+    def test_setup_runs_once_per_new_context(self):
+        installed = []
+        pool = BrowserPool(FakeBrowser, size=1, setup=installed.append)
+
+        for _ in range(3):
+            pool.release(pool.acquire())
+
+        assert len(installed) == 1
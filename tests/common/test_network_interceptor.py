@@ -0,0 +1,160 @@
+import os
+
+import pytest
+
+from common.network_interceptor import AssetCache, NetworkInterceptor
+
+UI = "https://dev-cinescope.coconutqa.ru/"
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="script", method="GET"):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self.headers = {"accept": "*/*"}
+
+
+class FakeResponse:
+    def __init__(self, body, status=200, headers=None):
+        self._body = body
+        self.status = status
+        self.headers = headers or {"content-type": "application/javascript", "content-encoding": "gzip"}
+
+    def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, response=None):
+        self.response = response
+        self.result = None
+        self.fetch_headers = None
+
+    def fetch(self, headers=None):
+        self.fetch_headers = headers
+        return self.response
+
+    def fulfill(self, **kwargs):
+        self.result = ("fulfill", kwargs)
+
+    def fallback(self):
+        self.result = ("fallback",)
+
+    def abort(self, error_code):
+        self.result = ("abort", error_code)
+
+
+@pytest.fixture
+def interceptor(tmp_path):
+    return NetworkInterceptor(AssetCache(tmp_path), first_party_hosts=["dev-cinescope.coconutqa.ru",
+                                                                      "api.dev-cinescope.coconutqa.ru"])
+
+
+def handle(interceptor, request, response=None):
+    return handle_route(interceptor, request, response).result
+
+
+def handle_route(interceptor, request, response=None):
+    route = FakeRoute(response)
+    interceptor.handle(route, request)
+    return route
+
+
+class TestNetworkInterceptor:
+    def test_static_asset_is_served_from_disk_after_first_load(self, interceptor, tmp_path):
+        request = FakeRequest(f"{UI}_next/static/chunks/main.js")
+
+        first = handle(interceptor, request, FakeResponse(b"x" * 1000))
+        second = handle(NetworkInterceptor(AssetCache(tmp_path)), request)
+
+        assert first[1]["body"] == b"x" * 1000
+        assert second == ("fulfill", {"status": 200, "headers": {"content-type": "application/javascript"},
+                                      "body": b"x" * 1000})
+        assert interceptor.stats()["bytes_downloaded"] == 1000
+
+    def test_hits_are_counted_as_saved_bytes(self, interceptor):
+        request = FakeRequest(f"{UI}poster.png", resource_type="image")
+        handle(interceptor, request, FakeResponse(b"png" * 100))
+        handle(interceptor, request)
+        handle(interceptor, request)
+
+        stats = interceptor.stats()
+        assert (stats["cache_misses"], stats["cache_hits"], stats["bytes_saved"]) == (1, 2, 600)
+
+    def test_documents_api_calls_and_errors_are_not_cached(self, interceptor):
+        assert handle(interceptor, FakeRequest(UI, resource_type="document")) == ("fallback",)
+        assert handle(interceptor, FakeRequest(f"{UI}api/x", resource_type="fetch")) == ("fallback",)
+
+        request = FakeRequest(f"{UI}missing.js")
+        handle(interceptor, request, FakeResponse(b"", status=404))
+        assert handle(interceptor, request, FakeResponse(b"ok"))[1]["body"] == b"ok"
+        assert interceptor.stats()["cache_hits"] == 0
+
+    def test_third_party_and_images_can_be_blocked(self, interceptor):
+        interceptor.block_third_party = True
+        interceptor.block_images = True
+
+        assert handle(interceptor, FakeRequest("https://mc.yandex.ru/metrika/tag.js")) == ("abort", "blockedbyclient")
+        assert handle(interceptor, FakeRequest(f"{UI}poster.png", resource_type="image"))[0] == "abort"
+        assert handle(interceptor, FakeRequest("https://auth.dev-cinescope.coconutqa.ru/login",
+                                               resource_type="fetch")) == ("fallback",)
+        assert interceptor.stats()["blocked"] == 2
+
+    def test_expired_entry_is_reloaded(self, tmp_path):
+        cache = AssetCache(tmp_path, max_age=-1)
+        cache.put(f"{UI}main.js", 200, {}, b"old")
+
+        assert cache.get(f"{UI}main.js") is None
+
+    def test_prune_drops_dead_entries_and_keeps_quota(self, tmp_path):
+        cache = AssetCache(tmp_path, max_age=3600)
+        for name in ("old.js", "new.js"):
+            cache.put(f"{UI}{name}", 200, {}, b"x" * 1000)
+        old_meta = cache._paths(f"{UI}old.js")[1]
+        os.utime(old_meta, (old_meta.stat().st_mtime - 60,) * 2)
+        AssetCache(tmp_path, max_age=-1).put(f"{UI}expired.js", 200, {}, b"x")
+        AssetCache(tmp_path, max_age=-1).put(f"{UI}stale.js", 200, {"etag": '"v1"'}, b"x")
+
+        assert cache.prune() == 1
+        assert cache.get(f"{UI}stale.js") is not None
+
+        assert cache.prune(quota_bytes=1500) == 1
+        assert cache.get(f"{UI}old.js") is None
+        assert cache.get(f"{UI}new.js").body == b"x" * 1000
+        assert len(list(tmp_path.iterdir())) == 2 * 2
+
+    def test_server_max_age_limits_freshness(self, tmp_path):
+        cache = AssetCache(tmp_path, max_age=3600)
+
+        assert cache.lifetime({"Cache-Control": "public, max-age=31536000, immutable"}) == 3600
+        assert cache.lifetime({"cache-control": "max-age=60"}) == 60
+        assert cache.lifetime({"cache-control": "no-cache", "etag": '"v1"'}) == 0
+        assert cache.lifetime({"etag": '"v1"'}) == 0
+        assert cache.lifetime({}) == 3600
+
+    def test_stale_entry_is_revalidated_with_etag(self, interceptor):
+        request = FakeRequest(f"{UI}main.js")
+        handle(interceptor, request, FakeResponse(b"v1", headers={"cache-control": "no-cache", "etag": '"v1"'}))
+
+        not_modified = handle_route(interceptor, request, FakeResponse(b"", status=304, headers={"etag": '"v1"'}))
+        deployed = handle_route(interceptor, request, FakeResponse(b"v2", headers={"etag": '"v2"'}))
+
+        assert not_modified.fetch_headers == {"accept": "*/*", "if-none-match": '"v1"'}
+        assert not_modified.result[1]["body"] == b"v1"
+        assert deployed.result[1]["body"] == b"v2"
+        assert interceptor.cache.get(request.url).etag == '"v2"'
+        assert (interceptor.stats()["cache_hits"], interceptor.stats()["cache_misses"]) == (1, 2)
+
+    def test_route_is_not_installed_without_cache_or_blocking(self, tmp_path):
+        class FakeContext:
+            routes = 0
+
+            def route(self, pattern, handler):
+                self.routes += 1
+
+        idle, caching = FakeContext(), FakeContext()
+        NetworkInterceptor().install(idle)
+        NetworkInterceptor(AssetCache(tmp_path)).install(caching)
+
+        assert (idle.routes, caching.routes) == (0, 1)
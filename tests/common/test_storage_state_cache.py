@@ -0,0 +1,107 @@
+import base64
+import json
+import os
+import time
+
+from api.token_cache import TokenCache
+from common.storage_state_cache import StorageStateCache
+
+CREDS = ("user@cinescope.test", "Password123")
+
+
+def jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def state_with_cookie(expires=-1, value="session"):
+    return {"cookies": [{"name": "auth", "value": value, "domain": "cinescope.local", "path": "/", "expires": expires}],
+            "origins": []}
+
+
+class TestStorageStateCache:
+    def test_login_runs_once_per_creds(self, tmp_path):
+        cache = StorageStateCache(tmp_path)
+        logins = []
+
+        def login():
+            logins.append(1)
+            return state_with_cookie()
+
+        first = cache.get("http://ui/", CREDS, login)
+        second = cache.get("http://ui/", CREDS, login)
+        cache.get("http://other-ui/", CREDS, login)
+
+        assert second == first
+        assert cache.stats() == {"hits": 1, "logins": 2}
+
+    def test_state_file_is_reused_by_new_process(self, tmp_path):
+        StorageStateCache(tmp_path).get("http://ui/", CREDS, state_with_cookie)
+
+        restarted = StorageStateCache(tmp_path)
+        state = restarted.get("http://ui/", CREDS, lambda: state_with_cookie(value="new"))
+
+        assert state["cookies"][0]["value"] == "session"
+        assert restarted.stats() == {"hits": 1, "logins": 0}
+
+    def test_expired_state_triggers_new_login(self, tmp_path):
+        cache = StorageStateCache(tmp_path, refresh_margin=60)
+        cache.get("http://ui/", CREDS, lambda: state_with_cookie(expires=time.time() + 30))
+
+        state = cache.get("http://ui/", CREDS, lambda: state_with_cookie(expires=time.time() + 3600, value="new"))
+
+        assert state["cookies"][0]["value"] == "new"
+        assert cache.stats()["logins"] == 2
+
+    def test_expiry_comes_from_jwt_in_local_storage(self, tmp_path):
+        cache = StorageStateCache(tmp_path)
+        exp = time.time() + 1000
+        state = {"cookies": [], "origins": [{"origin": "http://ui", "localStorage": [{"name": "token", "value": jwt(exp)}]}]}
+
+        assert cache.expires_at(state, saved_at=0) == exp
+
+    def test_state_without_deadlines_ages_out_by_file_time(self, tmp_path):
+        StorageStateCache(tmp_path, default_ttl=600).get("http://ui/", CREDS, state_with_cookie)
+        for path in tmp_path.glob("*.json"):
+            os.utime(path, (time.time() - 3600, time.time() - 3600))
+
+        restarted = StorageStateCache(tmp_path, default_ttl=600)
+        restarted.get("http://ui/", CREDS, state_with_cookie)
+
+        assert restarted.stats()["logins"] == 1
+
+    def test_prune_removes_stale_and_broken_files(self, tmp_path):
+        cache = StorageStateCache(tmp_path, refresh_margin=60)
+        cache.get("http://ui/", CREDS, lambda: state_with_cookie(expires=time.time() + 3600))
+        cache.get("http://ui/", ("old@cinescope.test", "Password123"), lambda: state_with_cookie(expires=time.time() + 30))
+        (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+
+        removed = cache.prune()
+
+        assert len(removed) == 2
+        assert [path.name for path in tmp_path.glob("*.json")] == [cache.path(TokenCache.make_key("http://ui/", CREDS)).name]
+
+
+def test_api_login_converts_cookies(tmp_path):
+    import requests
+    from aiohttp import web
+
+    from api.auth_api import AuthAPI
+    from common.storage_state_cache import api_storage_state
+    from stand_in import LocalServer
+
+    async def login(request):
+        response = web.json_response({"accessToken": jwt(time.time() + 600)})
+        response.set_cookie("refresh", "token", httponly=True, max_age=3600, path="/")
+        return response
+
+    app = web.Application()
+    app.router.add_post("/{tail:/*}login", login)
+    with LocalServer(app) as server, requests.Session() as session:
+        auth_api = AuthAPI(session)
+        auth_api.base_url = server.url
+        state = api_storage_state(auth_api, CREDS)
+
+    cookie, = state["cookies"]
+    assert (cookie["name"], cookie["domain"], cookie["httpOnly"]) == ("refresh", "127.0.0.1", True)
+    assert cookie["expires"] > time.time()
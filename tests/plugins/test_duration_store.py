@@ -0,0 +1,56 @@
+import pytest
+
+from plugins.duration_store import DurationStore, main
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DurationStore(tmp_path / "durations.sqlite3")
+    store.save_run(
+        "run-1", 1.0,
+        [("test_a", "setup", 1.0, "passed"), ("test_a", "call", 2.0, "passed"), ("test_b", "call", 0.5, "passed")],
+        [("test_a", "super_admin", "function", 0.9), ("test_b", "super_admin", "function", 0.7),
+         ("test_a", "http_transport", "session", 0.1)]
+    )
+    store.save_run(
+        "run-2", 2.0,
+        [("test_a", "call", 4.0, "passed"), ("test_b", "call", 1.5, "failed")],
+        []
+    )
+    return store
+
+
+class TestDurationStore:
+    def test_average_test_durations(self, store):
+        assert store.average_test_durations(runs=2) == {"test_a": 3.5, "test_b": 1.0}
+
+    def test_only_last_runs_are_used(self, store):
+        assert store.average_test_durations(runs=1) == {"test_a": 4.0, "test_b": 1.5}
+
+    def test_old_runs_are_pruned(self, store):
+        store.save_run("run-3", 3.0, [("test_a", "call", 6.0, "passed")], [("test_a", "super_admin", "function", 1.0)],
+                       keep_runs=2)
+
+        assert store.average_test_durations(runs=10) == {"test_a": 5.0, "test_b": 1.5}
+        assert store.top_fixtures(runs=10) == [("super_admin", "function", 1, 1.0, 1.0)]
+        with store._connect() as connection:
+            assert connection.execute("SELECT id FROM runs ORDER BY started_at").fetchall() == [("run-2",), ("run-3",)]
+
+    def test_top_tests_split_by_phase(self, store):
+        nodeid, setup, call, teardown, total = store.top_tests(runs=2, limit=1)[0]
+
+        assert nodeid == "test_a"
+        assert (setup, call, teardown, total) == (0.5, 3.0, 0.0, 3.5)
+
+    def test_top_fixtures(self, store):
+        fixture, scope, setups, total, average = store.top_fixtures(runs=2)[0]
+
+        assert (fixture, scope, setups) == ("super_admin", "function", 2)
+        assert total == pytest.approx(1.6)
+
+    def test_cli_report(self, store, capsys):
+        main(["--db", str(store.path), "--runs", "2", "--top", "5"])
+
+        output = capsys.readouterr().out
+        assert "super_admin" in output
+        assert "test_a" in output
@@ -0,0 +1,34 @@
+import pytest
+
+from resources.environment import EnvironmentProfile, load_environment
+
+
+class TestEnvironmentProfile:
+    def test_named_profile_with_overrides(self):
+        profile = load_environment("local", overrides={"api_url": "http://localhost:9000/", "ui_url": None})
+
+        assert profile.name == "local"
+        assert profile.auth_url == "http://127.0.0.1:8080/"
+        assert profile.api_url == "http://localhost:9000/"
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError, match="Неизвестный профиль"):
+            load_environment("prod", overrides={})
+
+    def test_service_subdomains_belong_to_one_environment(self):
+        load_environment("dev", overrides={})
+        load_environment("stage", overrides={})
+
+    def test_mixed_environments_are_rejected(self):
+        with pytest.raises(ValueError, match="разные окружения"):
+            load_environment("dev", overrides={"api_url": "https://api.stage-cinescope.coconutqa.ru/"})
+
+    def test_malformed_urls_are_rejected(self):
+        profile = EnvironmentProfile("broken", "auth.example.test/", "http://127.0.0.1:8080", "http://127.0.0.1/")
+
+        with pytest.raises(ValueError) as error:
+            profile.validate()
+
+        assert "auth_url" in str(error.value)
+        assert "заканчиваться на '/'" in str(error.value)
+
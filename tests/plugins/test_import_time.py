@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+from benchmarks.bench_import_time import ROOT, eager_modules, import_times
+
+
+def test_pytest_startup_does_not_import_heavy_dependencies():
+    # С теми же сторонними плагинами, что загружаются в обычном прогоне (pytest.ini отключает плагин faker)
+    times = import_times()
+
+    assert eager_modules(times) == []
+
+
+def test_eager_modules_match_submodules():
+    assert eager_modules({"faker.factory": (740000, 0), "sqlalchemyx": (1, 0)}) == ["faker"]
+
+
+def test_conftest_imports_without_db_settings():
+    env = {key: value for key, value in os.environ.items()
+           if key not in ("DB_USER", "PASSWORD", "HOST", "PORT", "DATABASE_NAME")}
+
+    subprocess.run([sys.executable, "-c", "import conftest"], cwd=ROOT, env=env, check=True)
+
+
+def test_faker_is_created_on_first_use():
+    code = ("import sys; from utils.data_generator import DataGenerator; "
+            "assert 'faker' not in sys.modules; DataGenerator.generate_random_name(); "
+            "assert 'faker' in sys.modules")
+
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from plugins.tracing import Tracing, failed_phases_key, rotate
+
+
+class FakeConfig:
+    def __init__(self, mode, quota_mb=500):
+        self.options = {"--ui-tracing": mode, "--ui-trace-quota-mb": quota_mb}
+
+    def getoption(self, name):
+        return self.options[name]
+
+
+class FakeItem:
+    nodeid = "tests/ui/test_login_page.py::TestLoginPage::test_login_by_ui"
+
+    def __init__(self, execution_count=None):
+        self.stash = pytest.Stash()
+        if execution_count is not None:
+            self.execution_count = execution_count
+
+
+class FakeTracing:
+    def __init__(self):
+        self.calls = []
+
+    def start(self, **options):
+        self.calls.append("start")
+
+    def stop(self, path=None):
+        self.calls.append(("stop", path))
+        if path is not None:
+            path.write_bytes(b"trace")
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+def run_test(mode, failed=False, execution_count=None):
+    item, context = FakeItem(execution_count), FakeContext()
+    tracing = Tracing(FakeConfig(mode), item)
+    tracing.start(context)
+    if failed:
+        item.stash[failed_phases_key].add("call")
+    path = tracing.stop(context)
+    if path is not None:
+        path.unlink()
+    return context.tracing.calls, path
+
+
+class TestTracing:
+    def test_passed_test_trace_is_discarded(self):
+        calls, path = run_test("retain-on-failure")
+
+        assert (calls, path) == (["start", ("stop", None)], None)
+
+    def test_failed_test_trace_is_saved(self):
+        calls, path = run_test("retain-on-failure", failed=True)
+
+        assert path.name.startswith("trace_") and "test_login_by_ui" in path.name
+        assert calls == ["start", ("stop", path)]
+
+    def test_off_and_first_retry(self):
+        assert run_test("off", failed=True) == ([], None)
+        assert run_test("on-first-retry", failed=True, execution_count=1) == ([], None)
+        assert run_test("on-first-retry", execution_count=2)[1] is not None
+
+    def test_retry_does_not_inherit_previous_failure(self):
+        item = FakeItem()
+        item.stash[failed_phases_key] = {"call"}
+        context = FakeContext()
+        tracing = Tracing(FakeConfig("retain-on-failure"), item)
+        tracing.start(context)
+
+        assert tracing.stop(context) is None
+
+
+    def test_each_context_gets_its_own_trace(self):
+        item = FakeItem()
+        tracing = Tracing(FakeConfig("retain-on-failure"), item)
+        contexts = [FakeContext(), FakeContext()]
+        for context in contexts:
+            tracing.start(context)
+        item.stash[failed_phases_key].add("call")
+
+        paths = [tracing.stop(context) for context in contexts]
+        for path in paths:
+            path.unlink()
+
+        assert paths[0] != paths[1] and paths[1].stem.endswith("_1")
+        assert tracing.stop(contexts[0]) is None
+
+
+def test_rotate_removes_oldest_traces(tmp_path):
+    for age, name in enumerate(["newest", "middle", "oldest"]):
+        path = tmp_path / f"{name}.zip"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1000 - age, 1000 - age))
+
+    removed = rotate(tmp_path, quota_bytes=150)
+
+    assert [path.stem for path in removed] == ["oldest", "middle"]
+    assert [path.stem for path in tmp_path.glob("*.zip")] == ["newest"]
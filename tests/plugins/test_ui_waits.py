@@ -0,0 +1,49 @@
+import textwrap
+from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
+
+from plugins import ui_waits
+from plugins.ui_waits import find_sleeps, main
+
+UI_TESTS = Path(__file__).resolve().parent.parent / "ui"
+
+
+def test_finds_sleep_under_any_import_form():
+    source = textwrap.dedent("""
+        import time
+        import time as t
+        from time import sleep, sleep as pause
+
+        def test_page(page):
+            time.sleep(5)
+            t.sleep(1)
+            sleep(2)
+            pause(3)
+            page.wait_for_timeout(100)
+            asyncio.sleep(1)
+    """)
+
+    assert find_sleeps(source) == [7, 8, 9, 10]
+
+
+def test_ui_tests_have_no_fixed_sleeps(capsys):
+    assert main([str(UI_TESTS)]) == 0
+    assert capsys.readouterr().out == ""
+
+
+def test_cli_reports_sleeps(tmp_path, capsys):
+    (tmp_path / "test_page.py").write_text("import time\ntime.sleep(5)\n", encoding="utf-8")
+
+    assert main([str(tmp_path)]) == 1
+    assert "test_page.py:2" in capsys.readouterr().out
+
+
+def test_durations_are_recorded_without_shard_suffix(monkeypatch):
+    monkeypatch.setattr(ui_waits, "_durations", defaultdict(float))
+    for when, duration in (("setup", 0.5), ("call", 1.0)):
+        report = SimpleNamespace(nodeid="tests/ui/test_login_page.py::test_login@shard1", when=when,
+                                 duration=duration, keywords={"ui": 1})
+        ui_waits.pytest_runtest_logreport(report)
+
+    assert ui_waits._durations == {"tests/ui/test_login_page.py::test_login": 1.5}
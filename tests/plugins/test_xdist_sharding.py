@@ -0,0 +1,66 @@
+import threading
+
+from plugins.xdist_sharding import WorkerShard, assign_shards, run_once
+
+
+class TestWorkerShard:
+    def test_workers_get_disjoint_id_ranges(self):
+        first = WorkerShard(worker_id="gw0", run_id="run")
+        second = WorkerShard(worker_id="gw1", run_id="run")
+
+        first_ids = {first.next_id() for _ in range(100)}
+        second_ids = {second.next_id() for _ in range(100)}
+
+        assert not first_ids & second_ids
+        assert second.index == 1
+
+    def test_unique_names_differ_between_workers(self):
+        first = WorkerShard(worker_id="gw0", run_id="run")
+        second = WorkerShard(worker_id="gw1", run_id="run")
+
+        assert first.unique_name("Movie") != second.unique_name("Movie")
+        assert first.unique_name("Movie") != first.unique_name("Movie")
+
+
+class TestRunOnce:
+    def test_setup_runs_once_for_all_workers(self, tmp_path):
+        calls = []
+        results = []
+
+        def setup():
+            calls.append(1)
+            return {"token": "secret"}
+
+        threads = [
+            threading.Thread(target=lambda: results.append(run_once(tmp_path, "admin_token", setup)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"token": "secret"}] * 8
+
+
+class TestAssignShards:
+    def test_longest_tests_are_balanced(self):
+        durations = {"a": 10, "b": 9, "c": 5, "d": 4, "e": 1, "f": 1}
+
+        assignment = assign_shards(durations.keys(), durations, 2)
+
+        loads = [0, 0]
+        for node_id, shard in assignment.items():
+            loads[shard] += durations[node_id]
+        assert loads == [15, 15]
+
+    def test_unknown_tests_use_median_duration(self):
+        assignment = assign_shards(["known", "new_1", "new_2"], {"known": 2.0}, 2)
+
+        assert assignment == {"known": 0, "new_1": 1, "new_2": 0}
+
+    def test_assignment_is_deterministic(self):
+        node_ids = [f"test_{i}" for i in range(50)]
+
+        assert assign_shards(node_ids, {}, 4) == assign_shards(list(reversed(node_ids)), {}, 4)
@@ -1,12 +1,14 @@
 import allure
 from playwright.sync_api import Page
+
+from constants import UI_URL
 from tests.ui.pages.PageAction import PageAction
 
 
 class BasePage(PageAction): #Базовая логика доспустимая для всех страниц на сайте
     def __init__(self, page: Page):
         super().__init__(page)
-        self.home_url = "https://dev-cinescope.coconutqa.ru/"
+        self.home_url = UI_URL
 
         # Общие локаторы для всех страниц на сайте
         self.home_button = "a[href='/' and text()='Cinescope']"
@@ -1,11 +1,14 @@
 from playwright.sync_api import Page
+
+from constants import API_URL
 from tests.ui.pages.BasePage import BasePage
 
 
 class DetailsMoviePage(BasePage):
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = f"{self.home_url}movies/2365"
+        self.movie_id = 2365
+        self.url = f"{self.home_url}movies/{self.movie_id}"
 
         # Локаторы элементов
         self.input_review = "textarea[data-qa-id='movie_review_input']"
@@ -17,7 +20,10 @@ class DetailsMoviePage(BasePage):
     # Локальные action методы
 
     def open(self):
-        self.open_url(self.url)
+        """
+        Открывает страницу и ждёт, пока загрузятся фильм и его отзывы из API, а не только сама страница.
+        """
+        self.wait_for_requests_idle(f"{API_URL}movies/{self.movie_id}", lambda: self.open_url(self.url))
 
     def select_rating(self, value):
         self.rating_select.select_option(value=value, force=True)
@@ -28,3 +34,9 @@ class DetailsMoviePage(BasePage):
     def submit_click(self):
         self.page.locator(self.submit_button).click()
 
+    def submit_review(self):
+        """
+        Отправляет отзыв и возвращает ответ API на POST отзыва.
+        """
+        return self.wait_for_response("/reviews", self.submit_click, method="POST")
+
@@ -1,4 +1,4 @@
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
 import allure
 
 class PageAction:
@@ -39,15 +39,60 @@ class PageAction:
         with open(screenshot_path, "rb") as file:
             allure.attach(file.read(), name="Screenshot after redirect", attachment_type=allure.attachment_type.PNG)
 
+    @allure.step("Ожидание ответа на запрос '{url_part}'")
+    def wait_for_response(self, url_part: str, action, method: str = None):
+        """
+        Выполняет action() и ждёт ответ сервера вместо фиксированной паузы.
+        :param url_part: Часть URL запроса, например "/reviews".
+        :param action: Действие, отправляющее запрос (клик по кнопке и т.п.).
+        :param method: HTTP-метод запроса (None — любой).
+        :return: Ответ Playwright (status, json() и т.д.).
+        """
+        def matches(response):
+            return url_part in response.url and (method is None or response.request.method == method)
+
+        with self.page.expect_response(matches) as response_info:
+            action()
+        return response_info.value
+
+    @allure.step("Ожидание завершения запросов к '{url_part}'")
+    def wait_for_requests_idle(self, url_part: str, action=None):
+        """
+        Ждёт, пока завершатся все запросы, URL которых содержит url_part, включая начатые во время ожидания.
+        В отличие от networkidle не зависит от посторонних запросов (аналитика, long polling).
+        :param action: Действие, запускающее запросы (None — ждать уже начатые). Хотя бы один
+            подходящий запрос после него обязателен: иначе ожидание закончилось бы раньше, чем он начнётся.
+        """
+        pending = set()
+
+        def matches(request):
+            return url_part in request.url
+
+        def started(request):
+            if matches(request):
+                pending.add(request)
+
+        self.page.on("request", started)
+        try:
+            if action is not None:
+                with self.page.expect_request(matches):
+                    action()
+            while pending:
+                response = pending.pop().response()
+                if response is not None:
+                    response.finished()
+        finally:
+            self.page.remove_listener("request", started)
+
     @allure.step("Проверка всплывающего сообщения c текстом: {text}")
-    def check_pop_up_element_with_text(self, text: str) -> bool:
-        with allure.step("Проверка появления алерта с текстом: '{text}'"):
-            notification_locator = self.page.get_by_text(text)
-            # Ждем появления элемента
-            notification_locator.wait_for(state="visible")
-            assert notification_locator.is_visible(), "Уведомление не появилось"
-
-        with allure.step("Проверка исчезновения алерта с текстом: '{text}'"):
-            # Ждем, пока алерт исчезнет
-            notification_locator.wait_for(state="hidden")
-            assert notification_locator.is_visible() == False, "Уведомление не исчезло"
\ No newline at end of file
+    def check_pop_up_element_with_text(self, text: str, wait_hidden: bool = True):
+        """
+        :param wait_hidden: Дождаться и исчезновения уведомления (занимает время показа алерта).
+        """
+        notification_locator = self.page.get_by_text(text)
+        with allure.step(f"Проверка появления алерта с текстом: '{text}'"):
+            expect(notification_locator, "Уведомление не появилось").to_be_visible()
+
+        if wait_hidden:
+            with allure.step(f"Проверка исчезновения алерта с текстом: '{text}'"):
+                expect(notification_locator, "Уведомление не исчезло").to_be_hidden()
@@ -1,8 +1,5 @@
-import time
-
 import allure
 import pytest
-from playwright.sync_api import sync_playwright
 
 from tests.ui.pages.LoginPage import LoginPage
 
@@ -12,19 +9,12 @@ from tests.ui.pages.LoginPage import LoginPage
 @pytest.mark.ui
 class TestLoginPage:
    @allure.title("Проведение успешного входа в систему")
-   def test_login_by_ui(self, registered_user):
-      with sync_playwright() as playwright:
-           browser = playwright.chromium.launch(headless=False)# Запуск браузера headless=False для визуального отображения
-           page = browser.new_page()
-           login_page = LoginPage(page)# Создаем объект страницы Login
-
-           login_page.open()
-           login_page.login(registered_user["email"], registered_user["password"]) # Осуществяем вход
+   def test_login_by_ui(self, registered_user, page):
+      login_page = LoginPage(page)# Создаем объект страницы Login
 
-           login_page.assert_was_redirect_to_home_page() # Проверка редиректа на домашнюю страницу
-           login_page.make_screenshot_and_attach_to_allure() # Прикрепляем скриншот
-           login_page.assert_allert_was_pop_up() # Проверка появления и исчезновения алерта
+      login_page.open()
+      login_page.login(registered_user["email"], registered_user["password"]) # Осуществяем вход
 
-           # Пауза для визуальной проверки (нужно удалить в реальном тестировании)
-           time.sleep(5)
-           browser.close()
+      login_page.assert_was_redirect_to_home_page() # Проверка редиректа на домашнюю страницу
+      login_page.make_screenshot_and_attach_to_allure() # Прикрепляем скриншот
+      login_page.assert_allert_was_pop_up() # Проверка появления и исчезновения алерта
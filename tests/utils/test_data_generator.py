@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+from models.test_pydantic import PydenticUser
+from utils.data_generator import DataGenerator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def title(movie):
+    return movie["name"].split(" [")[0]
+
+
+def without_unique_parts(items, *fields):
+    return [{key: value for key, value in item.items() if key not in fields} for item in items]
+
+
+class TestBatchGeneration:
+    def test_users_are_valid_and_unique(self):
+        users = DataGenerator.generate_users(2000)
+
+        assert len({user["email"] for user in users}) == 2000
+        for user in users[:50]:
+            PydenticUser(**user)
+
+    def test_movie_names_are_unique_across_batches(self):
+        names = [movie["name"] for movie in DataGenerator.generate_movies(500, seed=7)]
+        names += [movie["name"] for movie in DataGenerator.generate_movies(500, seed=7)]
+
+        assert len(set(names)) == 1000
+
+    def test_same_seed_gives_same_data(self):
+        first = DataGenerator.generate_movies(20, seed=42, namespace="run-a")
+        second = DataGenerator.generate_movies(20, seed=42, namespace="run-b")
+
+        assert without_unique_parts(first, "name") == without_unique_parts(second, "name")
+        assert [title(movie) for movie in first] == [title(movie) for movie in second]
+        assert without_unique_parts(DataGenerator.generate_users(20, seed=1), "email") != \
+            without_unique_parts(DataGenerator.generate_users(20, seed=2), "email")
+
+    def test_workers_of_one_run_do_not_collide(self):
+        code = "from utils.data_generator import DataGenerator; print(*(u['email'] for u in DataGenerator.generate_users(100, seed=1)))"
+        emails = set()
+        for worker in ("gw0", "gw1"):
+            env = {**os.environ, "PYTEST_XDIST_WORKER": worker, "PYTEST_XDIST_TESTRUNUID": "abcdef0123"}
+            output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                                    capture_output=True, text=True, check=True).stdout
+            emails.update(output.split())
+
+        assert len(emails) == 200
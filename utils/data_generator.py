@@ -1,10 +1,71 @@
+import os
 import random
 import string
+import threading
 import uuid
-
-from faker import Faker
-
-faker = Faker()
+from collections import defaultdict
+from functools import lru_cache
+
+from constants import Roles
+
+PASSWORD_SPECIAL_CHARS = "?@#$%^&*|:"
+MOVIE_IMAGE_URL = "https://example.com/poster.png"
+
+_reserved = defaultdict(int)
+_reserved_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_faker():
+    """
+    Faker создаётся при первом обращении: импорт и загрузка локали заметно замедляют старт pytest.
+    """
+    from faker import Faker
+    return Faker()
+
+
+@lru_cache(maxsize=None)
+def word_pools():
+    """
+    Словари имён, фамилий и слов Faker (en_US). Берутся один раз, дальше значения
+    выбираются из них через random без вызовов Faker.
+    :return: (имена, фамилии, слова).
+    """
+    from faker.providers.lorem.en_US import Provider as LoremProvider
+    from faker.providers.person.en_US import Provider as PersonProvider
+    return tuple(PersonProvider.first_names), tuple(PersonProvider.last_names), tuple(LoremProvider.word_list)
+
+
+@lru_cache(maxsize=None)
+def run_namespace():
+    """
+    Пространство имён процесса: id прогона xdist + воркер (gw0, gw1...), без xdist — случайный id.
+    У воркеров одного прогона общий run id, но разные имена воркеров, поэтому значения не пересекаются.
+    """
+    run_id = os.getenv("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+    return f"{run_id[:8]}-{os.getenv('PYTEST_XDIST_WORKER', 'master')}"
+
+
+def reserve_indexes(namespace, count):
+    """
+    Выделяет count порядковых номеров, которые больше не выдаются в этом пространстве имён.
+    """
+    with _reserved_lock:
+        start = _reserved[namespace]
+        _reserved[namespace] += count
+    return range(start, start + count)
+
+
+def _passwords(rng, count):
+    all_chars = string.ascii_letters + string.digits + PASSWORD_SPECIAL_CHARS
+    passwords = []
+    for letter, digit, length in zip(rng.choices(string.ascii_letters, k=count),
+                                     rng.choices(string.digits, k=count),
+                                     rng.choices(range(6, 19), k=count)):
+        password = [letter, digit, *rng.choices(all_chars, k=length)]
+        rng.shuffle(password)
+        passwords.append("".join(password))
+    return passwords
 
 
 class DataGenerator:
@@ -17,6 +78,7 @@ class DataGenerator:
 
     @staticmethod
     def generate_random_name():
+        faker = get_faker()
         return f"{faker.first_name()} {faker.last_name()}"
 
     @staticmethod
@@ -51,11 +113,11 @@ class DataGenerator:
 
     @staticmethod
     def generate_random_movie_name():
-        return faker.text()
+        return get_faker().text()
 
     @staticmethod
     def generate_random_desc_name():
-        return faker.text()
+        return get_faker().text()
 
     @staticmethod
     def generate_random_price():
@@ -68,3 +130,62 @@ class DataGenerator:
     @classmethod
     def generate_random_int(cls, b):
         return random.randint(1, b)
+
+    @staticmethod
+    def generate_users(count, seed=None, namespace=None):
+        """
+        Пачка пользователей в формате тела POST /register.
+        Поля выбираются из заранее загруженных словарей одним проходом random, без вызовов Faker.
+        :param count: Количество пользователей.
+        :param seed: Зерно random: с одним seed получаются те же имена и пароли.
+        :param namespace: Пространство имён для уникальных email (по умолчанию run_namespace()).
+        Email уникален в прогоне и между воркерами xdist: в нём есть пространство имён и порядковый номер.
+        """
+        rng = random.Random(seed)
+        namespace = namespace or run_namespace()
+        first_names, last_names, _ = word_pools()
+        users = []
+        for first, last, password, index in zip(rng.choices(first_names, k=count),
+                                                rng.choices(last_names, k=count),
+                                                _passwords(rng, count),
+                                                reserve_indexes(namespace, count)):
+            users.append({
+                "email": f"kek.{first}.{last}.{namespace}.{index}@gmail.com".lower(),
+                "fullName": f"{first} {last}",
+                "password": password,
+                "passwordRepeat": password,
+                "roles": [Roles.USER.value]
+            })
+        return users
+
+    @staticmethod
+    def generate_movies(count, seed=None, namespace=None, genre_id=1):
+        """
+        Пачка фильмов в формате тела POST /movies.
+        :param count: Количество фильмов.
+        :param seed: Зерно random: с одним seed получаются те же названия, описания и цены.
+        :param namespace: Пространство имён для уникальных названий (по умолчанию run_namespace()).
+        :param genre_id: Жанр всех фильмов пачки.
+        Название уникально в прогоне и между воркерами xdist (как у WorkerShard.unique_name).
+        """
+        rng = random.Random(seed)
+        namespace = namespace or run_namespace()
+        _, _, words = word_pools()
+        title_words = rng.choices(words, k=3 * count)
+        description_words = rng.choices(words, k=12 * count)
+        movies = []
+        for i, price, location, index in zip(range(count),
+                                             rng.choices(range(1, 501), k=count),
+                                             rng.choices(("MSK", "SPB"), k=count),
+                                             reserve_indexes(namespace, count)):
+            title = " ".join(title_words[3 * i:3 * i + 3]).capitalize()
+            movies.append({
+                "name": f"{title} [{namespace}-{index}]",
+                "imageUrl": MOVIE_IMAGE_URL,
+                "price": price,
+                "description": " ".join(description_words[12 * i:12 * i + 12]).capitalize() + ".",
+                "location": location,
+                "published": True,
+                "genreId": genre_id
+            })
+        return movies